@@ -0,0 +1,104 @@
+"""Benchmark broadcast latency with a few slow sockets in a full Hangman game.
+
+Compares the previous sequential send loop against per-connection outbound
+queues used by WebSocketHandler.broadcast_to_game. Latency is measured until
+every fast client has received the frame.
+
+Usage:
+    python benchmarks/bench_broadcast.py
+"""
+
+import asyncio
+import json
+import random
+import statistics
+import sys
+import time
+from pathlib import Path
+from types import SimpleNamespace
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from config import MAX_PLAYERS_PER_GAME  # noqa: E402
+from games.hangman.messages import StationSnapshotMessage  # noqa: E402
+from games.hangman.models import HangmanGame, HangmanPlayer  # noqa: E402
+from websocket.handler import WebSocketHandler  # noqa: E402
+
+BROADCASTS = 100
+SLOW_SOCKETS = 3
+SLOW_DELAY = 0.050
+FAST_DELAY = 0.0005
+
+
+class LatencySocket:
+    def __init__(self, delay: float):
+        self.client_state = SimpleNamespace(name="CONNECTED")
+        self.delay = delay
+
+    async def send_text(self, data: str) -> None:
+        await asyncio.sleep(self.delay * random.uniform(0.5, 1.5))
+
+
+def build_game(handler: WebSocketHandler) -> HangmanGame:
+    game = HangmanGame.create(["WORD"] * 10)
+    for i in range(MAX_PLAYERS_PER_GAME):
+        delay = SLOW_DELAY if i < SLOW_SOCKETS else FAST_DELAY
+        ws = LatencySocket(delay)
+        player = HangmanPlayer.create(f"Player{i}", ws)
+        game.add_player(player)
+        handler.register_connection(player.id, ws)
+    return game
+
+
+async def sequential_broadcast(handler, game, message) -> None:
+    for player in game.connected_players:
+        await player.websocket.send_text(json.dumps(message.to_dict()))
+
+
+async def queued_broadcast(handler, game, message) -> None:
+    await handler.broadcast_to_game(game, message)
+    await asyncio.gather(
+        *(
+            handler._connections[player.id].flush()
+            for player in game.connected_players
+            if player.websocket.delay == FAST_DELAY
+        )
+    )
+
+
+async def measure(broadcast, handler, game, message) -> list[float]:
+    samples = []
+    for _ in range(BROADCASTS):
+        start = time.perf_counter()
+        await broadcast(handler, game, message)
+        samples.append(time.perf_counter() - start)
+    return samples
+
+
+def report(name: str, samples: list[float]) -> None:
+    ordered = sorted(samples)
+    p50 = statistics.median(ordered) * 1000
+    p99 = ordered[int(len(ordered) * 0.99) - 1] * 1000
+    print(f"{name:<12} p50={p50:8.2f} ms  p99={p99:8.2f} ms")
+
+
+async def main() -> None:
+    handler = WebSocketHandler(max_queue=BROADCASTS * 2)
+    game = build_game(handler)
+    message = StationSnapshotMessage(
+        seq=0,
+        players=[
+            {"id": p.id, "name": p.name, "station": 1} for p in game.connected_players
+        ],
+    )
+
+    print(
+        f"{MAX_PLAYERS_PER_GAME} players, {SLOW_SOCKETS} slow sockets "
+        f"(~{SLOW_DELAY * 1000:.0f} ms), {BROADCASTS} broadcasts"
+    )
+    report("sequential", await measure(sequential_broadcast, handler, game, message))
+    report("queued", await measure(queued_broadcast, handler, game, message))
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,152 @@
+"""Micro-benchmark the wire codecs over every client and server message type.
+
+For each message type in models/messages.py, games/hangman/messages.py and
+games/duels/messages.py, reports the encoded size and the encode and decode
+time of every available codec.
+
+Usage:
+    python benchmarks/bench_codec.py
+"""
+
+import inspect
+import sys
+import timeit
+import uuid
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from pydantic import BaseModel  # noqa: E402
+
+import games.duels.messages as duels_messages  # noqa: E402
+import games.hangman.messages as hangman_messages  # noqa: E402
+import models.messages as base_messages  # noqa: E402
+from config import MAX_PLAYERS_PER_GAME, TOTAL_STATIONS  # noqa: E402
+from services.codec import available_codecs, get_codec  # noqa: E402
+
+ITERATIONS = 5000
+
+PLAYER_IDS = [str(uuid.uuid4()) for _ in range(MAX_PLAYERS_PER_GAME)]
+PLAYERS = [{"id": pid, "name": f"Jugador{i:02d}"} for i, pid in enumerate(PLAYER_IDS)]
+
+SAMPLES: dict[str, dict] = {
+    "join": {"player_name": "Ana", "game_type": "hangman"},
+    "leave": {},
+    "joined": {
+        "player_id": PLAYER_IDS[0],
+        "game_id": "AB12CD34",
+        "player_name": "Ana",
+        "resume_token": "q3v9Jc0tJ2y1r3Jm4d2Zr5u8X2c7b1Ws",
+    },
+    "resume": {"token": "q3v9Jc0tJ2y1r3Jm4d2Zr5u8X2c7b1Ws", "last_seq": 41},
+    "resumed": {"player_id": PLAYER_IDS[0], "seq": 45, "replayed": 3},
+    "resume_failed": {"message": "Session expired"},
+    "ping": {},
+    "pong": {},
+    "waiting": {"players_in_queue": 12, "message": "Esperando jugadores... (12 en cola)"},
+    "error": {"message": "Invalid letter"},
+    "guess": {"letter": "A"},
+    "guess_batch": {"letters": ["A", "E", "R"]},
+    "guess_batch_result": {
+        "guesses": [
+            {"letter": "A", "correct": True},
+            {"letter": "E", "correct": False},
+            {"letter": "R", "correct": True},
+        ],
+        "revealed": "_ A R _ A",
+        "attempts_left": 5,
+    },
+    "station_resync": {},
+    "game_start": {"players": PLAYERS, "total_stations": TOTAL_STATIONS},
+    "station_update": {"station": 3, "revealed": "_ A _ A", "attempts_left": 6},
+    "correct_guess": {"letter": "A", "revealed": "_ A _ A"},
+    "wrong_guess": {"letter": "X", "attempts_left": 5},
+    "station_complete": {"station": 3, "word": "CASA"},
+    "station_failed": {"reset_to": 1, "word": "CASA"},
+    "player_progress": {"player_id": PLAYER_IDS[1], "player_name": "Bea", "station": 4},
+    "player_joined": {"player_id": PLAYER_IDS[2], "player_name": "Carl", "station": 1},
+    "game_over": {
+        "winner_id": PLAYER_IDS[0],
+        "winner_name": "Ana",
+        "words": ["MURCIELAGO"] * TOTAL_STATIONS,
+    },
+    "station_snapshot": {
+        "seq": 0,
+        "players": [{**p, "station": i % TOTAL_STATIONS + 1} for i, p in enumerate(PLAYERS)],
+    },
+    "station_delta": {
+        "seq": 7,
+        "moves": [{"player_id": pid, "from": 2, "to": 3} for pid in PLAYER_IDS[:3]],
+    },
+    "spell_cast": {"spell": "ignis"},
+    "rematch": {},
+    "duel_start": {"opponent_id": PLAYER_IDS[1], "opponent_name": "Bea", "rounds_to_win": 2},
+    "round_start": {"round_number": 2},
+    "opponent_cast": {},
+    "round_result": {
+        "round_number": 2,
+        "your_spell": "ignis",
+        "opponent_spell": "virel",
+        "result": "win",
+        "your_score": 1,
+        "opponent_score": 0,
+    },
+    "duel_over": {
+        "winner_id": PLAYER_IDS[0],
+        "winner_name": "Ana",
+        "final_score": "2-1",
+        "your_result": "victory",
+    },
+}
+
+
+def message_types() -> dict[str, type[BaseModel]]:
+    """Find every concrete message model with a literal type."""
+    found = {}
+    for module in (base_messages, hangman_messages, duels_messages):
+        for _, cls in inspect.getmembers(module, inspect.isclass):
+            if not issubclass(cls, BaseModel) or cls.__module__ != module.__name__:
+                continue
+            type_field = cls.model_fields.get("type")
+            if type_field is not None and isinstance(type_field.default, str):
+                found[type_field.default] = cls
+    return found
+
+
+def main() -> None:
+    types = message_types()
+    missing = set(types) - set(SAMPLES)
+    if missing:
+        raise SystemExit(f"No benchmark sample for message types: {sorted(missing)}")
+
+    codecs = [get_codec(name) for name in available_codecs()]
+    header = f"{'message':<18}" + "".join(
+        f"{c.name.split('.')[-1] + ' bytes':>15}{'enc us':>9}{'dec us':>9}" for c in codecs
+    )
+    print(header)
+
+    totals = {c.name: [0, 0.0, 0.0] for c in codecs}
+    for msg_type, cls in sorted(types.items()):
+        payload = cls(**SAMPLES[msg_type]).model_dump()
+        row = f"{msg_type:<18}"
+        for codec in codecs:
+            data = codec.encode(payload)
+            enc = timeit.timeit(lambda: codec.encode(payload), number=ITERATIONS)
+            dec = timeit.timeit(lambda: codec.decode(data), number=ITERATIONS)
+            enc_us = enc / ITERATIONS * 1e6
+            dec_us = dec / ITERATIONS * 1e6
+            totals[codec.name][0] += len(data)
+            totals[codec.name][1] += enc_us
+            totals[codec.name][2] += dec_us
+            row += f"{len(data):>15}{enc_us:>9.2f}{dec_us:>9.2f}"
+        print(row)
+
+    row = f"{'total':<18}"
+    for codec in codecs:
+        size, enc_us, dec_us = totals[codec.name]
+        row += f"{size:>15}{enc_us:>9.2f}{dec_us:>9.2f}"
+    print(row)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,71 @@
+"""Compare deflate levels on the largest server frames.
+
+For a full 50-player game, reports the JSON size, the compressed size and
+ratio, and the compression time per frame at several zlib levels. Frames
+below WS_COMPRESSION_THRESHOLD_BYTES are sent uncompressed.
+
+Usage:
+    python benchmarks/bench_compression.py
+"""
+
+import sys
+import timeit
+import uuid
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from config import (  # noqa: E402
+    MAX_PLAYERS_PER_GAME,
+    TOTAL_STATIONS,
+    WS_COMPRESSION_THRESHOLD_BYTES,
+)
+from games.hangman.messages import (  # noqa: E402
+    GameOverMessage,
+    GameStartMessage,
+    StationSnapshotMessage,
+)
+from services.codec import JSON_CODEC, DeflateCodec  # noqa: E402
+from services.metrics import Metrics  # noqa: E402
+from services.word_bank import get_word_bank  # noqa: E402
+
+ITERATIONS = 2000
+LEVELS = (1, 6, 9)
+
+
+def sample_messages() -> dict[str, dict]:
+    ids = [str(uuid.uuid4()) for _ in range(MAX_PLAYERS_PER_GAME)]
+    players = [{"id": pid, "name": f"Jugador{i:02d}"} for i, pid in enumerate(ids)]
+    words = get_word_bank().select_words(TOTAL_STATIONS)
+    return {
+        "game_start": GameStartMessage(
+            players=players, total_stations=TOTAL_STATIONS
+        ).to_dict(),
+        "station_snapshot": StationSnapshotMessage(
+            seq=0,
+            players=[{**p, "station": i % TOTAL_STATIONS + 1} for i, p in enumerate(players)],
+        ).to_dict(),
+        "game_over": GameOverMessage(
+            winner_id=ids[0], winner_name="Jugador00", words=words
+        ).to_dict(),
+    }
+
+
+def main() -> None:
+    print(f"threshold: {WS_COMPRESSION_THRESHOLD_BYTES} bytes")
+    print(f"{'message':<18}{'json':>7}" + "".join(
+        f"{'L' + str(level) + ' bytes':>11}{'ratio':>7}{'us':>8}" for level in LEVELS
+    ))
+    for msg_type, payload in sample_messages().items():
+        raw = len(JSON_CODEC.encode(payload))
+        row = f"{msg_type:<18}{raw:>7}"
+        for level in LEVELS:
+            codec = DeflateCodec(JSON_CODEC, threshold=0, level=level, metrics=Metrics())
+            size = len(codec.encode(payload))
+            elapsed = timeit.timeit(lambda: codec.encode(payload), number=ITERATIONS)
+            row += f"{size:>11}{size / raw:>7.2f}{elapsed / ITERATIONS * 1e6:>8.1f}"
+        print(row)
+
+
+if __name__ == "__main__":
+    main()
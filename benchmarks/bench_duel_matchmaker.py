@@ -0,0 +1,96 @@
+"""Measure duel join latency with per-join and tick-based matchmaking.
+
+SEEKERS players join duels at once, each from its own task as concurrent
+connections would. Starting a duel sends both players a start message,
+simulated as SEND_SECONDS of I/O each. Reports how long the join handlers
+take, how long until every seeker is in a started duel, and the p50/p99
+time from join to game start. In "event" mode every join that completes a
+pair starts its duel inline; in "tick" mode joins only enqueue and the
+whole queue is paired every TICK_SECONDS, starting its duels together.
+
+Usage:
+    python benchmarks/bench_duel_matchmaker.py
+"""
+
+import asyncio
+import statistics
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from models.base import BaseGame, Player  # noqa: E402
+from services.matchmaking import Matchmaking  # noqa: E402
+
+SEEKERS = (1_000, 5_000, 20_000)
+SEND_SECONDS = 0.002
+TICK_SECONDS = 0.05
+
+
+async def run(count: int, tick: float | None) -> dict[str, float]:
+    matchmaking = Matchmaking()
+    joined_at: dict[str, float] = {}
+    waits: list[float] = []
+    done = asyncio.Event()
+
+    async def on_start(game: BaseGame) -> None:
+        for _ in game.players:
+            await asyncio.sleep(SEND_SECONDS)
+        now = time.perf_counter()
+        waits.extend(now - joined_at[player_id] for player_id in game.players)
+        if len(waits) == count:
+            done.set()
+
+    matchmaking.register_game_type(
+        "duels",
+        2,
+        2,
+        3600,
+        lambda: BaseGame(id=BaseGame.generate_id(), game_type="duels"),
+        on_start,
+        tick_seconds=tick,
+    )
+
+    async def join(player: Player) -> None:
+        joined_at[player.id] = time.perf_counter()
+        matchmaking.enqueue_player(player, "duels")
+        await matchmaking.try_start_game("duels")
+
+    players = [
+        Player(id=f"p{i}", name="bench", websocket=None) for i in range(count)
+    ]
+    started = time.perf_counter()
+    await asyncio.gather(*(join(player) for player in players))
+    joins = time.perf_counter() - started
+    await done.wait()
+    total = time.perf_counter() - started
+
+    waits.sort()
+    return {
+        "joins": joins,
+        "total": total,
+        "p50": statistics.median(waits),
+        "p99": waits[int(len(waits) * 0.99)],
+    }
+
+
+def main() -> None:
+    print(
+        f"start message send: {SEND_SECONDS * 1000:.0f} ms,"
+        f" tick: {TICK_SECONDS * 1000:.0f} ms"
+    )
+    print(
+        f"{'mode':<6} {'seekers':>8} {'joins ms':>10} {'all ms':>10}"
+        f" {'p50 ms':>10} {'p99 ms':>10}"
+    )
+    for count in SEEKERS:
+        for mode, tick in (("event", None), ("tick", TICK_SECONDS)):
+            result = asyncio.run(run(count, tick))
+            keys = ("joins", "total", "p50", "p99")
+            cells = " ".join(f"{result[key] * 1000:>10.1f}" for key in keys)
+            print(f"{mode:<6} {count:>8} {cells}")
+
+
+if __name__ == "__main__":
+    main()
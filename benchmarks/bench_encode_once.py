@@ -0,0 +1,88 @@
+"""Benchmark serializations saved by encoding each broadcast once.
+
+Broadcasts StationSnapshotMessage to a full Hangman game for a few seconds and
+reports the serialization counters exported by the handler, alongside the
+cost of encoding the same message once per recipient.
+
+Usage:
+    python benchmarks/bench_encode_once.py
+"""
+
+import asyncio
+import json
+import sys
+import time
+from pathlib import Path
+from types import SimpleNamespace
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from config import MAX_PLAYERS_PER_GAME, TOTAL_STATIONS  # noqa: E402
+from games.hangman.messages import StationSnapshotMessage  # noqa: E402
+from games.hangman.models import HangmanGame, HangmanPlayer  # noqa: E402
+from services.metrics import get_metrics  # noqa: E402
+from websocket.handler import WebSocketHandler  # noqa: E402
+
+DURATION_SECONDS = 3.0
+
+
+class NullSocket:
+    def __init__(self):
+        self.client_state = SimpleNamespace(name="CONNECTED")
+
+    async def send_text(self, data: str) -> None:
+        pass
+
+
+def build_game(handler: WebSocketHandler) -> HangmanGame:
+    game = HangmanGame.create(["WORD"] * TOTAL_STATIONS)
+    for i in range(MAX_PLAYERS_PER_GAME):
+        ws = NullSocket()
+        player = HangmanPlayer.create(f"Player{i}", ws)
+        game.add_player(player)
+        handler.register_connection(player.id, ws)
+    return game
+
+
+def station_snapshot(game: HangmanGame) -> StationSnapshotMessage:
+    players = [
+        {"id": player.id, "name": player.name, "station": index % TOTAL_STATIONS + 1}
+        for index, player in enumerate(game.connected_players)
+    ]
+    return StationSnapshotMessage(seq=0, players=players)
+
+
+async def main() -> None:
+    handler = WebSocketHandler()
+    game = build_game(handler)
+    message = station_snapshot(game)
+    start = time.perf_counter()
+    for _ in range(1000):
+        for _player in game.connected_players:
+            json.dumps(message.to_dict())
+    per_recipient = (time.perf_counter() - start) / 1000
+
+    start = time.perf_counter()
+    for _ in range(1000):
+        json.dumps(message.to_dict())
+    once = (time.perf_counter() - start) / 1000
+
+    metrics = get_metrics()
+    metrics.reset()
+    broadcasts = 0
+    deadline = time.monotonic() + DURATION_SECONDS
+    while time.monotonic() < deadline:
+        await handler.broadcast_to_game(game, station_snapshot(game))
+        await handler.flush()
+        broadcasts += 1
+
+    print(f"{MAX_PLAYERS_PER_GAME} players, {broadcasts} broadcasts")
+    print(f"encode per recipient: {per_recipient * 1e6:8.1f} us per broadcast")
+    print(f"encode once:          {once * 1e6:8.1f} us per broadcast")
+    print(f"serializations:       {metrics.value('ws_serializations')}")
+    print(f"serializations saved: {metrics.value('ws_serializations_saved')}")
+    print(f"saved per second:     {metrics.rate('ws_serializations_saved'):.0f}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
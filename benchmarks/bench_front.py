@@ -0,0 +1,112 @@
+"""Measure the front layer's cost to route an inbound client frame.
+
+Binds CLIENTS clients spread over SHARDS shards and routes FRAMES guess
+frames from them through FrontLayer._shard_for and the shard link, as
+handle_connection does for every frame it receives. The links write into
+a byte counter instead of a socket. Compares decoding every frame to spot
+joins (the previous front) with forwarding bound clients' frames as
+opaque bytes, for each available codec. The front is a single process
+relaying for every shard, so its per-frame cost caps the inbound frame
+rate of the whole sharded runtime.
+
+Usage:
+    python benchmarks/bench_front.py
+"""
+
+import random
+import string
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from services.codec import CodecError, JsonCodec, MsgPackCodec, msgpack  # noqa: E402
+from services.metrics import Metrics  # noqa: E402
+from sharding.front import FrontLayer, RelayedClient  # noqa: E402
+from sharding.link import OP_BYTES, OP_TEXT  # noqa: E402
+from websocket.connection import Connection  # noqa: E402
+
+SHARDS = 4
+CLIENTS = 1_000
+FRAMES = 200_000
+
+
+class CountingWriter:
+    def __init__(self):
+        self.written = 0
+
+    def write(self, data: bytes) -> None:
+        self.written += len(data)
+
+
+class DecodingFront(FrontLayer):
+    """The previous front, which decoded every frame."""
+
+    def _shard_for(self, client, payload, text, codec):
+        try:
+            data = codec.decode(text if text is not None else payload)
+        except CodecError:
+            data = None
+        if isinstance(data, dict) and data.get("type") == "join":
+            return self._placement.for_join(str(data.get("game_type")))
+        return client.shard
+
+
+def make_front(cls: type[FrontLayer], codec) -> tuple[FrontLayer, list]:
+    front = cls([("127.0.0.1", 0)] * SHARDS, metrics=Metrics())
+    for link in front._links:
+        link._writer = CountingWriter()
+    clients = []
+    for conn_id in range(CLIENTS):
+        client = RelayedClient(
+            conn_id=conn_id,
+            subprotocol=codec.name,
+            connection=Connection(None, codec=codec),
+        )
+        front._bind(client, conn_id % SHARDS)
+        clients.append(client)
+    return front, clients
+
+
+def route(cls: type[FrontLayer], codec, frames: list) -> float:
+    """Seconds per frame routed."""
+    front, clients = make_front(cls, codec)
+    op = OP_BYTES if codec.binary else OP_TEXT
+    started = time.perf_counter()
+    for i, (payload, text) in enumerate(frames):
+        client = clients[i % CLIENTS]
+        shard = front._shard_for(client, payload, text, codec)
+        front._links[shard].send(op, client.conn_id, payload)
+    return (time.perf_counter() - started) / len(frames)
+
+
+def guess_frames(codec) -> list[tuple[bytes, str | None]]:
+    random.seed(0)
+    frames = []
+    for _ in range(FRAMES):
+        message = {"type": "guess", "letter": random.choice(string.ascii_uppercase)}
+        data = codec.encode(message)
+        if codec.binary:
+            frames.append((data, None))
+        else:
+            frames.append((data.encode(), data))
+    return frames
+
+
+def main() -> None:
+    codecs = [JsonCodec()] + ([MsgPackCodec()] if msgpack is not None else [])
+    print(f"{FRAMES} guess frames from {CLIENTS} clients bound to {SHARDS} shards")
+    print(f"{'codec':<16} {'front':<8} {'us/frame':>9} {'frames/s':>11}")
+    for codec in codecs:
+        frames = guess_frames(codec)
+        for name, cls in (("decode", DecodingFront), ("opaque", FrontLayer)):
+            elapsed = route(cls, codec, frames)
+            print(
+                f"{codec.name:<16} {name:<8} {elapsed * 1e6:>9.2f}"
+                f" {1 / elapsed:>11.0f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,72 @@
+"""Measure Hangman game start latency with and without the game pool.
+
+Starts GAMES two-player games through Matchmaking, as the join that fills a
+queue would, and times each start. Between starts the event loop is given
+IDLE_SECONDS, as it would be between joins, so the pool can refill in the
+background. Compares a pool size of 0 (words selected and the game built
+on every start) with HANGMAN_GAME_POOL_SIZE.
+
+Usage:
+    python benchmarks/bench_game_pool.py
+"""
+
+import asyncio
+import statistics
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from config import HANGMAN_GAME_POOL_SIZE  # noqa: E402
+from games.hangman.manager import HangmanGameManager  # noqa: E402
+from games.hangman.models import HangmanPlayer  # noqa: E402
+from services.matchmaking import Matchmaking  # noqa: E402
+
+GAMES = 5_000
+IDLE_SECONDS = 0.0005
+
+
+async def run(pool_size: int) -> tuple[list[float], dict[str, int]]:
+    manager = HangmanGameManager(pool_size=pool_size)
+    manager.fill_pool()
+    matchmaking = Matchmaking()
+
+    async def on_start(game) -> None:
+        manager.start_game(game)
+
+    matchmaking.register_game_type(
+        "hangman", 2, 2, 3600, manager.create_game, on_start
+    )
+
+    timings = []
+    for i in range(GAMES):
+        matchmaking.enqueue_player(HangmanPlayer.create(f"a{i}", None), "hangman")
+        matchmaking.enqueue_player(HangmanPlayer.create(f"b{i}", None), "hangman")
+        started = time.perf_counter()
+        await matchmaking.try_start_game("hangman")
+        timings.append(time.perf_counter() - started)
+        await asyncio.sleep(IDLE_SECONDS)
+    return timings, manager.pool_stats()
+
+
+def main() -> None:
+    print(f"{GAMES} game starts")
+    print(
+        f"{'pool':>6} {'p50 us':>10} {'p99 us':>10} {'mean us':>10}"
+        f" {'hits':>8} {'misses':>8}"
+    )
+    for pool_size in (0, HANGMAN_GAME_POOL_SIZE):
+        timings, stats = asyncio.run(run(pool_size))
+        timings.sort()
+        p50 = statistics.median(timings) * 1e6
+        p99 = timings[int(len(timings) * 0.99)] * 1e6
+        mean = statistics.fmean(timings) * 1e6
+        print(
+            f"{pool_size:>6} {p50:>10.1f} {p99:>10.1f} {mean:>10.1f}"
+            f" {stats['hits']:>8} {stats['misses']:>8}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,163 @@
+"""Count the objects the Hangman guess path allocates per guess.
+
+Plays GUESSES guesses through HangmanGameManager.process_guess and builds
+the guesser's outbound message for each, as handle_guess does. Compares the
+previous path (a result dict per guess, validated message models,
+StationUpdateMessage built from a station info dict) with
+GuessResult.to_message and station_update. The block count keeps every
+result and message alive so tracemalloc can count the memory blocks the
+path leaves for the sender. Timings drop them after each guess, as
+handle_guess does once the message is queued, and are the best of ROUNDS
+interleaved runs, so both paths see the same machine state.
+
+Usage:
+    python benchmarks/bench_guess.py
+"""
+
+import random
+import string
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from config import TOTAL_STATIONS  # noqa: E402
+from games.hangman.manager import HangmanGameManager  # noqa: E402
+from games.hangman.messages import (  # noqa: E402
+    CorrectGuessMessage,
+    StationUpdateMessage,
+    WrongGuessMessage,
+)
+from games.hangman.models import HangmanGame, HangmanPlayer  # noqa: E402
+from models.base import GameStatus  # noqa: E402
+
+GUESSES = 50_000
+ROUNDS = 5
+WORDS = [
+    word for _ in range(TOTAL_STATIONS // 2) for word in ("MURCIELAGOS", "GUITARRAS")
+]
+
+
+class LegacyManager(HangmanGameManager):
+    """The previous dict-based guess path."""
+
+    def process_guess(self, game, player, letter):
+        if game.status != GameStatus.PLAYING:
+            return {"error": "Game is not in playing state"}
+        if player.station_state is None:
+            return {"error": "Player station not initialized"}
+        letter = letter.upper()
+        if not letter.isalpha() or len(letter) != 1:
+            return {"error": "Invalid letter"}
+        station = player.station_state
+        correct = station.guess(letter)
+        result = {
+            "correct": correct,
+            "letter": letter,
+            "revealed": station.revealed,
+            "attempts_left": station.attempts_left,
+            "station_complete": False,
+            "station_failed": False,
+            "game_won": False,
+        }
+        if station.is_complete:
+            result["station_complete"] = True
+            result["word"] = station.word
+            if player.current_station >= TOTAL_STATIONS:
+                result["game_won"] = True
+                game.status = GameStatus.FINISHED
+                game.winner = player.id
+                self._joinable.discard(game.id)
+            else:
+                player.current_station += 1
+                self._init_player_station(game, player)
+        elif station.is_failed:
+            result["station_failed"] = True
+            result["word"] = station.word
+            player.current_station = 1
+            self._init_player_station(game, player)
+        return result
+
+    def messages(self, player, result):
+        if result["correct"]:
+            yield CorrectGuessMessage(
+                letter=result["letter"], revealed=result["revealed"]
+            )
+        else:
+            yield WrongGuessMessage(
+                letter=result["letter"], attempts_left=result["attempts_left"]
+            )
+        if result["station_complete"] or result["station_failed"]:
+            info = {
+                "station": player.current_station,
+                "revealed": player.station_state.revealed,
+                "attempts_left": player.station_state.attempts_left,
+            }
+            yield StationUpdateMessage(**info)
+
+
+class TypedManager(HangmanGameManager):
+    """The GuessResult path."""
+
+    def messages(self, player, result):
+        yield result.to_message()
+        if result.station_complete or result.station_failed:
+            yield self.station_update(player)
+
+
+def play(manager, letters: list[str], keep: bool = True) -> list[tuple]:
+    kept = []
+    game = player = None
+    for letter in letters:
+        if game is None or game.status != GameStatus.PLAYING:
+            game = HangmanGame(id="G", words=WORDS)
+            player = HangmanPlayer(id="p", name="p", websocket=None)
+            game.add_player(player)
+            manager.start_game(game)
+        result = manager.process_guess(game, player, letter)
+        messages = (result, *manager.messages(player, result))
+        if keep:
+            kept.append(messages)
+    return kept
+
+
+def blocks_per_guess(manager, letters: list[str]) -> float:
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    kept = play(manager, letters)
+    after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+    del kept
+    blocks = sum(stat.count_diff for stat in after.compare_to(before, "filename"))
+    return blocks / len(letters)
+
+
+def seconds_per_guess(manager, letters: list[str]) -> float:
+    started = time.perf_counter()
+    play(manager, letters, keep=False)
+    return (time.perf_counter() - started) / len(letters)
+
+
+def main() -> None:
+    random.seed(0)
+    letters = random.choices(string.ascii_uppercase, k=GUESSES)
+    managers = {
+        "dict": LegacyManager(pool_size=0),
+        "typed": TypedManager(pool_size=0),
+    }
+    best = dict.fromkeys(managers, float("inf"))
+    for _ in range(ROUNDS):
+        for name, manager in managers.items():
+            best[name] = min(best[name], seconds_per_guess(manager, letters))
+
+    print(f"{GUESSES} guesses")
+    print(f"{'path':<8} {'blocks/guess':>13} {'us/guess':>10}")
+    for name, manager in managers.items():
+        blocks = blocks_per_guess(manager, letters)
+        print(f"{name:<8} {blocks:>13.1f} {best[name] * 1e6:>10.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,137 @@
+"""Measure heartbeat sweeps over tens of thousands of connections.
+
+Every connection is idle, so each sweep queues a ping on all of them (the
+worst case). For each connection count, reports:
+
+- a one-pass sweep (Heartbeat.sweep): its wall time and the longest single
+  event loop turn during it
+- a spread sweep, as the running heartbeat does it: one round of
+  WS_PING_SWEEP_SLICES ticks over ROUND_SECONDS, and the longest loop turn
+  during the round
+
+Both loop turns include the connections' writer tasks sending the pings.
+The round is shorter than WS_PING_INTERVAL to keep the run short; each
+tick does the same work as with the real interval.
+
+With tens of thousands of freshly built connections, the longest turns
+are full garbage collections walking all of them, whatever the heartbeat
+does. So the spread round is measured twice: as is, and with the
+connections frozen out of the collector (gc.freeze), which leaves the
+heartbeat's own cost. The script fails if that cost has a turn longer
+than MAX_TURN_SECONDS.
+
+Usage:
+    python benchmarks/bench_heartbeat.py
+"""
+
+import asyncio
+import gc
+import sys
+import time
+from pathlib import Path
+from types import SimpleNamespace
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from config import WS_PING_INTERVAL, WS_PING_SWEEP_SLICES  # noqa: E402
+from services.metrics import Metrics  # noqa: E402
+from websocket.connection import Connection  # noqa: E402
+from websocket.heartbeat import Heartbeat  # noqa: E402
+
+CONNECTION_COUNTS = (1_000, 10_000, 50_000)
+ROUND_SECONDS = 3.0
+MAX_TURN_SECONDS = 0.1
+
+
+class NullWebSocket:
+    client_state = SimpleNamespace(name="CONNECTED")
+
+    async def send_text(self, data: str) -> None:
+        pass
+
+
+async def longest_turn(until) -> float:
+    """Longest event loop turn until until() is true."""
+    longest = 0.0
+    while not until():
+        step = time.perf_counter()
+        await asyncio.sleep(0)
+        longest = max(longest, time.perf_counter() - step)
+    return longest
+
+
+async def idle_connections(count: int, metrics: Metrics) -> list[Connection]:
+    connections = [Connection(NullWebSocket(), metrics=metrics) for _ in range(count)]
+    for connection in connections:
+        connection.last_seen -= WS_PING_INTERVAL
+    # Start each connection's writer task before measuring
+    await Heartbeat(lambda: connections, metrics=metrics).sweep()
+    await asyncio.gather(*(connection.flush() for connection in connections))
+    return connections
+
+
+async def one_pass(count: int) -> tuple[float, float]:
+    metrics = Metrics()
+    connections = await idle_connections(count, metrics)
+    heartbeat = Heartbeat(lambda: connections, metrics=metrics)
+
+    start = time.perf_counter()
+    sweep = asyncio.create_task(heartbeat.sweep())
+    longest = await longest_turn(sweep.done)
+    elapsed = time.perf_counter() - start
+
+    await asyncio.gather(*(connection.flush() for connection in connections))
+    for connection in connections:
+        connection.close()
+    return elapsed, longest
+
+
+async def spread(count: int, freeze: bool = False) -> float:
+    metrics = Metrics()
+    connections = await idle_connections(count, metrics)
+    if freeze:
+        gc.collect()
+        gc.freeze()
+    for connection in connections:
+        connection.last_seen = time.monotonic() - ROUND_SECONDS
+    heartbeat = Heartbeat(
+        lambda: connections,
+        interval=ROUND_SECONDS,
+        missed_limit=10,
+        slices=WS_PING_SWEEP_SLICES,
+        metrics=metrics,
+    )
+
+    heartbeat.start()
+    deadline = time.perf_counter() + ROUND_SECONDS
+    longest = await longest_turn(lambda: time.perf_counter() >= deadline)
+    heartbeat.stop()
+    gc.unfreeze()
+
+    await asyncio.gather(*(connection.flush() for connection in connections))
+    for connection in connections:
+        connection.close()
+    return longest
+
+
+async def main() -> None:
+    print(f"{'':>12}{'one pass':>24}{'spread, max turn ms':>26}")
+    print(
+        f"{'connections':>12}{'sweep ms':>10}{'max turn ms':>14}"
+        f"{'as is':>10}{'gc frozen':>16}"
+    )
+    worst = 0.0
+    for count in CONNECTION_COUNTS:
+        elapsed, longest = await one_pass(count)
+        spread_longest = await spread(count)
+        frozen_longest = await spread(count, freeze=True)
+        worst = max(worst, frozen_longest)
+        print(
+            f"{count:>12,}{elapsed * 1000:>10.1f}{longest * 1000:>14.1f}"
+            f"{spread_longest * 1000:>10.1f}{frozen_longest * 1000:>16.1f}"
+        )
+    assert worst < MAX_TURN_SECONDS, f"heartbeat stalled the loop {worst:.3f}s"
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
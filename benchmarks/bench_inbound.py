@@ -0,0 +1,65 @@
+"""Measure inbound decode throughput for guess and spell_cast on one core.
+
+Compares the previous two-pass path (trying the join and leave models, then
+building the game message from the raw dict) with the single discriminated-union decode,
+and reports messages per second for each. Both paths start from the decoded
+JSON payload, as handed to the router.
+
+Usage:
+    python benchmarks/bench_inbound.py
+"""
+
+import sys
+import timeit
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from games.duels.messages import SpellCastMessage  # noqa: E402
+from games.hangman.messages import GuessMessage  # noqa: E402
+from models.messages import JoinMessage, LeaveMessage  # noqa: E402
+from websocket.inbound import decode_inbound  # noqa: E402
+
+ITERATIONS = 200_000
+
+LEGACY_MODELS = {"guess": GuessMessage, "spell_cast": SpellCastMessage}
+
+PAYLOADS = {
+    "guess": {"type": "guess", "letter": "E"},
+    "spell_cast": {"type": "spell_cast", "spell": "ignis"},
+}
+
+
+def legacy_parse(data: dict) -> JoinMessage | LeaveMessage | None:
+    """The removed ClientMessage.parse."""
+    msg_type = data.get("type")
+    try:
+        if msg_type == "join":
+            return JoinMessage(**data)
+        elif msg_type == "leave":
+            return LeaveMessage(**data)
+    except Exception:
+        return None
+    return None
+
+
+def legacy_decode(data: dict):
+    message = legacy_parse(data)
+    if message is None:
+        message = LEGACY_MODELS[data["type"]](**data)
+    return message
+
+
+def main() -> None:
+    print(f"{'message':<12}{'two-pass msg/s':>16}{'single-pass msg/s':>19}{'speedup':>9}")
+    for msg_type, payload in PAYLOADS.items():
+        legacy = timeit.timeit(lambda: legacy_decode(payload), number=ITERATIONS)
+        single = timeit.timeit(lambda: decode_inbound(payload), number=ITERATIONS)
+        print(
+            f"{msg_type:<12}{ITERATIONS / legacy:>16,.0f}"
+            f"{ITERATIONS / single:>19,.0f}{legacy / single:>8.2f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
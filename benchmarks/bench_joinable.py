@@ -0,0 +1,94 @@
+"""Measure late-join placement as the number of Hangman games grows.
+
+Creates GAMES games, of which all but the most recent 1% have finished, and
+places LATE_JOINS late joiners one after another. Compares the previous
+linear scan over every game (building each game's connected player list)
+with the joinable-game index, for both placement policies. The scan is only
+run at sizes where it finishes in reasonable time.
+
+Usage:
+    python benchmarks/bench_joinable.py
+"""
+
+import random
+import sys
+import time
+from pathlib import Path
+from unittest.mock import MagicMock
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from config import MAX_PLAYERS_PER_GAME  # noqa: E402
+from games.hangman.joinable import JoinPolicy  # noqa: E402
+from games.hangman.manager import HangmanGameManager  # noqa: E402
+from games.hangman.models import HangmanGame, HangmanPlayer  # noqa: E402
+from models.base import GameStatus  # noqa: E402
+
+GAMES = (1_000, 10_000, 100_000)
+PLAYERS_PER_GAME = 10
+LATE_JOINS = 1_000
+SCAN_MAX_GAMES = 10_000
+
+
+def scan(manager: HangmanGameManager) -> HangmanGame | None:
+    """The previous find_joinable_game."""
+    for game in manager._games.values():
+        if (
+            game.status == GameStatus.PLAYING
+            and len(game.connected_players) < MAX_PLAYERS_PER_GAME
+        ):
+            return game
+    return None
+
+
+def build(count: int, policy: JoinPolicy) -> HangmanGameManager:
+    random.seed(count)
+    manager = HangmanGameManager(join_policy=policy)
+    socket = MagicMock()
+    active_from = count - max(count // 100, 1)
+    for index in range(count):
+        game = manager.create_game()
+        for i in range(random.randint(2, PLAYERS_PER_GAME)):
+            game.add_player(HangmanPlayer(id=f"{index}-{i}", name="p", websocket=socket))
+        manager.start_game(game)
+        if index < active_from:
+            game.status = GameStatus.FINISHED
+            manager.update_joinable(game)
+    return manager
+
+
+def place_joiners(manager: HangmanGameManager, find) -> float:
+    socket = MagicMock()
+    started = time.perf_counter()
+    for i in range(LATE_JOINS):
+        game = find()
+        if game is not None:
+            player = HangmanPlayer(id=f"late-{i}", name="p", websocket=socket)
+            manager.add_player_to_active_game(game, player)
+    return time.perf_counter() - started
+
+
+def main() -> None:
+    print(f"{LATE_JOINS} late joins, 1% of games still playing")
+    print(f"{'games':>8} {'scan ms':>10} {'fill ms':>10} {'balance ms':>11}")
+    for count in GAMES:
+        scan_cell = f"{'-':>10}"
+        if count <= SCAN_MAX_GAMES:
+            scan_manager = build(count, JoinPolicy.FILL)
+            scan_time = place_joiners(scan_manager, lambda: scan(scan_manager))
+            scan_cell = f"{scan_time * 1000:>10.1f}"
+
+        timings = []
+        for policy in (JoinPolicy.FILL, JoinPolicy.BALANCE):
+            manager = build(count, policy)
+            timings.append(place_joiners(manager, manager.find_joinable_game))
+
+        fill, balance = timings
+        print(
+            f"{count:>8} {scan_cell} {fill * 1000:>10.1f}"
+            f" {balance * 1000:>11.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
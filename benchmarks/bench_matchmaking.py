@@ -0,0 +1,128 @@
+"""Measure matchmaking queue operations under join and leave storms.
+
+Queues QUEUED players for one game type, removes a tenth of them in random
+order, then starts two-player games until the queue is empty. Compares the
+previous list-based queue (a linear duplicate check per join, a rebuilt list
+per leave, a sliced copy per game start) with PlayerQueue. The list-based
+queue is only run at sizes where it finishes in reasonable time.
+
+Usage:
+    python benchmarks/bench_matchmaking.py
+"""
+
+import asyncio
+import random
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from models.base import BaseGame, Player  # noqa: E402
+from services.matchmaking import Matchmaking, QueuedPlayer  # noqa: E402
+
+QUEUED = (1_000, 10_000, 100_000)
+LEGACY_MAX_QUEUED = 10_000
+GAME_SIZE = 2
+
+
+def new_game() -> BaseGame:
+    return BaseGame(id=BaseGame.generate_id(), game_type="bench")
+
+
+class ListQueue:
+    """The previous queue operations, on a plain list."""
+
+    def __init__(self):
+        self.queue: list[QueuedPlayer] = []
+
+    def enqueue(self, player: Player) -> None:
+        if any(qp.player.id == player.id for qp in self.queue):
+            return
+        self.queue.append(QueuedPlayer(player=player, game_type="bench"))
+
+    def remove(self, player_id: str) -> None:
+        self.queue = [qp for qp in self.queue if qp.player.id != player_id]
+
+    def start(self) -> BaseGame:
+        players = self.queue[:GAME_SIZE]
+        self.queue = self.queue[GAME_SIZE:]
+        game = new_game()
+        for queued in players:
+            game.add_player(queued.player)
+        return game
+
+
+def storm(players: list[Player], leavers: list[str]) -> dict[str, float]:
+    timings = {}
+    queue = ListQueue()
+
+    started = time.perf_counter()
+    for player in players:
+        queue.enqueue(player)
+    timings["join"] = time.perf_counter() - started
+
+    started = time.perf_counter()
+    for player_id in leavers:
+        queue.remove(player_id)
+    timings["leave"] = time.perf_counter() - started
+
+    started = time.perf_counter()
+    while queue.queue:
+        queue.start()
+    timings["start"] = time.perf_counter() - started
+    return timings
+
+
+async def matchmaking_storm(
+    players: list[Player], leavers: list[str]
+) -> dict[str, float]:
+    timings = {}
+    matchmaking = Matchmaking()
+
+    async def on_start(game: BaseGame) -> None:
+        pass
+
+    matchmaking.register_game_type(
+        "bench", GAME_SIZE, GAME_SIZE, 3600, new_game, on_start
+    )
+
+    started = time.perf_counter()
+    for player in players:
+        matchmaking.enqueue_player(player, "bench")
+    timings["join"] = time.perf_counter() - started
+
+    started = time.perf_counter()
+    for player_id in leavers:
+        matchmaking.remove_player(player_id)
+    timings["leave"] = time.perf_counter() - started
+
+    started = time.perf_counter()
+    while matchmaking.get_queue_size("bench"):
+        await matchmaking._start_game("bench")
+    timings["start"] = time.perf_counter() - started
+    return timings
+
+
+def report(name: str, count: int, timings: dict[str, float]) -> None:
+    steps = ("join", "leave", "start")
+    cells = " ".join(f"{timings[step] * 1000:>10.1f}" for step in steps)
+    print(f"{name:<12} {count:>8} {cells}")
+
+
+def main() -> None:
+    header = f"{'join ms':>10} {'leave ms':>10} {'start ms':>10}"
+    print(f"{'queue':<12} {'players':>8} {header}")
+    for count in QUEUED:
+        players = [
+            Player(id=f"p{i}", name="bench", websocket=None) for i in range(count)
+        ]
+        leavers = random.sample([player.id for player in players], count // 10)
+
+        if count <= LEGACY_MAX_QUEUED:
+            report("list", count, storm(players, leavers))
+        report("PlayerQueue", count, asyncio.run(matchmaking_storm(players, leavers)))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,102 @@
+"""Measure the memory held per player and per game.
+
+Builds COUNT objects of each kind, keeps them alive, and reports the
+tracemalloc bytes they hold per object:
+
+- a Hangman player in the middle of a station
+- a Hangman game of PLAYERS_PER_GAME such players
+- a Duels player
+- a finished Duels game of three rounds
+
+Usage:
+    python benchmarks/bench_memory.py
+"""
+
+import sys
+import tracemalloc
+from pathlib import Path
+from typing import Callable
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from config import MAX_ATTEMPTS_PER_WORD, TOTAL_STATIONS  # noqa: E402
+from games.duels.models import DuelGame, Spell  # noqa: E402
+from games.hangman.models import HangmanGame, HangmanPlayer, Station  # noqa: E402
+from models.base import GameStatus, Player  # noqa: E402
+from services.word_bank import get_word_bank  # noqa: E402
+
+COUNT = 20_000
+PLAYERS_PER_GAME = 10
+# A tie, then two wins for player 1
+ROUNDS = (
+    (Spell.IGNIS, Spell.IGNIS),
+    (Spell.IGNIS, Spell.VIREL),
+    (Spell.IGNIS, Spell.VIREL),
+)
+
+
+def bytes_per_object(build: Callable[[int], object], count: int = COUNT) -> float:
+    """Traced bytes held per object, with count objects alive."""
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    objects = [build(i) for i in range(count)]
+    held = tracemalloc.get_traced_memory()[0] - before
+    tracemalloc.stop()
+    del objects
+    return held / count
+
+
+def hangman_player(i: int, word: str = "MURCIELAGO") -> HangmanPlayer:
+    player = HangmanPlayer(id=f"player-{i:08d}", name="Jugador", websocket=None)
+    player.station_state = Station(word=word, attempts_left=MAX_ATTEMPTS_PER_WORD)
+    player.station_state.guess("A")
+    player.station_state.guess("X")
+    return player
+
+
+def hangman_game(i: int, words: list[str]) -> HangmanGame:
+    game = HangmanGame(id=f"G{i:07d}", words=words)
+    for n in range(PLAYERS_PER_GAME):
+        game.add_player(hangman_player(i * PLAYERS_PER_GAME + n, words[0]))
+    game.status = GameStatus.PLAYING
+    return game
+
+
+def duel_game(i: int) -> DuelGame:
+    game = DuelGame(id=f"D{i:07d}", game_type="duels")
+    for player_id in (f"a{i}", f"b{i}"):
+        game.add_player(Player(id=player_id, name="Duelista", websocket=None))
+    game.player1_id, game.player2_id = f"a{i}", f"b{i}"
+    for spell1, spell2 in ROUNDS:
+        if game.current_round.is_complete():
+            game.start_new_round()
+        game.process_spell_cast(game.player1_id, spell1)
+        game.process_spell_cast(game.player2_id, spell2)
+        game.resolve_current_round()
+    game.status = GameStatus.FINISHED
+    return game
+
+
+def main() -> None:
+    words = get_word_bank().select_words(TOTAL_STATIONS)
+    rows = [
+        ("hangman player", bytes_per_object(hangman_player)),
+        (
+            f"hangman game ({PLAYERS_PER_GAME} players)",
+            bytes_per_object(lambda i: hangman_game(i, words), COUNT // 10),
+        ),
+        (
+            "duels player",
+            bytes_per_object(
+                lambda i: Player(id=f"player-{i:08d}", name="Duelista", websocket=None)
+            ),
+        ),
+        ("duels game (finished)", bytes_per_object(duel_game)),
+    ]
+    print(f"{'object':<28} {'bytes':>10}")
+    for name, size in rows:
+        print(f"{name:<28} {size:>10.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,127 @@
+"""Measure how duel throughput scales with the number of shard processes.
+
+For each shard count, starts that many shard processes and one driver
+process per shard. Each driver speaks the front-layer link protocol to its
+shard and keeps PAIRS_PER_SHARD duels going: both players cast a random
+spell on every round start and rejoin when the duel is over. Reports the
+duel rounds resolved per second across all shards, after a warm-up.
+
+Each shard and each driver needs its own core for the numbers to mean
+anything: scaling flattens once shards plus drivers exceed the cores
+available. By default only the shard counts that fit are run.
+
+Usage:
+    python benchmarks/bench_sharding.py [shard counts...]
+"""
+
+import asyncio
+import json
+import multiprocessing
+import os
+import random
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from sharding.link import OP_CLOSE, OP_OPEN, OP_TEXT, encode_op, read_op  # noqa: E402
+from sharding.shard import start_shard_processes, stop_shard_processes  # noqa: E402
+
+SHARD_COUNTS = (1, 2, 4, 8, 16)
+PAIRS_PER_SHARD = 3_000
+WARMUP_SECONDS = 8.0
+MEASURE_SECONDS = 10.0
+BASE_PORT = 9400
+SPELLS = ("ignis", "aqua", "virel")
+
+
+def frame(conn_id: int, payload: dict) -> bytes:
+    return encode_op(OP_TEXT, conn_id, json.dumps(payload).encode())
+
+
+async def drive(port: int) -> int:
+    for _ in range(100):
+        try:
+            reader, writer = await asyncio.open_connection("127.0.0.1", port)
+            break
+        except OSError:
+            await asyncio.sleep(0.1)
+    else:
+        raise RuntimeError(f"Shard on port {port} did not start")
+
+    join = {"type": "join", "player_name": "bench", "game_type": "duels"}
+    for conn_id in range(1, PAIRS_PER_SHARD * 2 + 1):
+        writer.write(encode_op(OP_OPEN, conn_id))
+        writer.write(frame(conn_id, join))
+
+    started = time.perf_counter()
+    measure_from = started + WARMUP_SECONDS
+    measure_until = measure_from + MEASURE_SECONDS
+    results = 0
+
+    while time.perf_counter() < measure_until:
+        op, conn_id, payload = await read_op(reader)
+        if op != OP_TEXT:
+            continue
+        msg_type = json.loads(payload)["type"]
+        if msg_type == "round_start":
+            cast = {"type": "spell_cast", "spell": random.choice(SPELLS)}
+            writer.write(frame(conn_id, cast))
+        elif msg_type == "round_result":
+            if time.perf_counter() >= measure_from:
+                results += 1
+        elif msg_type == "duel_over":
+            writer.write(frame(conn_id, {"type": "leave"}))
+            writer.write(frame(conn_id, join))
+        await writer.drain()
+
+    for conn_id in range(1, PAIRS_PER_SHARD * 2 + 1):
+        writer.write(encode_op(OP_CLOSE, conn_id, b"1000"))
+    writer.close()
+    return results // 2  # one result per player per round
+
+
+def run_driver(port: int, results: multiprocessing.Queue) -> None:
+    results.put(asyncio.run(drive(port)))
+
+
+def rounds_per_second(shards: int) -> float:
+    context = multiprocessing.get_context("spawn")
+    processes = start_shard_processes(shards, base_port=BASE_PORT)
+    results = context.Queue()
+    drivers = [
+        context.Process(target=run_driver, args=(BASE_PORT + index, results))
+        for index in range(shards)
+    ]
+    try:
+        for driver in drivers:
+            driver.start()
+        total = sum(results.get() for _ in drivers)
+        for driver in drivers:
+            driver.join()
+    finally:
+        stop_shard_processes(processes)
+    return total / MEASURE_SECONDS
+
+
+def main() -> None:
+    if hasattr(os, "sched_getaffinity"):
+        cores = len(os.sched_getaffinity(0))
+    else:
+        cores = os.cpu_count() or 1
+    counts = [int(arg) for arg in sys.argv[1:]]
+    counts = counts or [n for n in SHARD_COUNTS if n * 2 <= cores] or [1]
+    print(f"{cores} cores available, {PAIRS_PER_SHARD} concurrent duels per shard")
+    print(f"{'shards':>6} {'rounds/s':>10} {'speedup':>8}")
+
+    baseline = None
+    for shards in counts:
+        rate = rounds_per_second(shards)
+        baseline = baseline or rate
+        note = "" if shards * 2 <= cores else "  (more processes than cores)"
+        print(f"{shards:>6} {rate:>10.0f} {rate / baseline:>7.2f}x{note}")
+
+
+if __name__ == "__main__":
+    main()
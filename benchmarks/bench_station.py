@@ -0,0 +1,96 @@
+"""Measure Hangman guesses per second on a single Station.
+
+Plays STATIONS stations of a real word list to the end, guessing letters
+in a shuffled alphabet order, and after every guess reads what
+process_guess reads: revealed, attempts_left, is_complete and is_failed.
+Compares the previous Station, which rescanned and rebuilt the word on
+every read, with the incremental one, which fills in a guessed letter's
+precomputed positions.
+
+Usage:
+    python benchmarks/bench_station.py
+"""
+
+import random
+import string
+import sys
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from games.hangman.models import Station  # noqa: E402
+from services.word_bank import get_word_bank  # noqa: E402
+
+STATIONS = 50_000
+ATTEMPTS = 26
+
+
+@dataclass
+class LegacyStation:
+    """The previous Station."""
+
+    word: str
+    guessed_letters: set[str] = field(default_factory=set)
+    attempts_left: int = 6
+
+    @property
+    def revealed(self) -> str:
+        return " ".join(
+            letter if letter.upper() in self.guessed_letters else "_"
+            for letter in self.word
+        )
+
+    @property
+    def is_complete(self) -> bool:
+        return all(letter.upper() in self.guessed_letters for letter in self.word)
+
+    @property
+    def is_failed(self) -> bool:
+        return self.attempts_left <= 0
+
+    def guess(self, letter: str) -> bool:
+        letter = letter.upper()
+        if letter in self.guessed_letters:
+            return True
+        self.guessed_letters.add(letter)
+        if letter in self.word.upper():
+            return True
+        self.attempts_left -= 1
+        return False
+
+
+def play(station_class, words: list[str], orders: list[list[str]]) -> tuple[int, float]:
+    guesses = 0
+    started = time.perf_counter()
+    for word, order in zip(words, orders):
+        station = station_class(word=word, attempts_left=ATTEMPTS)
+        for letter in order:
+            station.guess(letter)
+            guesses += 1
+            station.revealed
+            station.attempts_left
+            if station.is_complete or station.is_failed:
+                break
+    return guesses, time.perf_counter() - started
+
+
+def main() -> None:
+    random.seed(0)
+    words = get_word_bank().select_words(10)
+    words = [random.choice(words) for _ in range(STATIONS)]
+    orders = [random.sample(string.ascii_uppercase, 26) for _ in range(STATIONS)]
+
+    print(f"{STATIONS} stations played to completion")
+    print(f"{'station':<12} {'guesses':>10} {'ms':>10} {'guesses/s':>12}")
+    for name, station_class in (("legacy", LegacyStation), ("incremental", Station)):
+        guesses, elapsed = play(station_class, words, orders)
+        print(
+            f"{name:<12} {guesses:>10} {elapsed * 1000:>10.1f}"
+            f" {guesses / elapsed:>12,.0f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
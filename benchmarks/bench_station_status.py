@@ -0,0 +1,142 @@
+"""Compare station status bytes per game-minute: full name lists vs deltas.
+
+Simulates one minute of a full Hangman game in which players complete or
+fail stations at random, and counts the bytes sent to all players by:
+
+- the previous station_status format, one full broadcast per change
+- the same format coalesced into 100 ms windows
+- station_delta moves coalesced into 100 ms windows, plus one snapshot
+  per player at game start
+
+Usage:
+    python benchmarks/bench_station_status.py
+"""
+
+import json
+import random
+import sys
+from collections import defaultdict
+from pathlib import Path
+from unittest.mock import MagicMock
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from config import (  # noqa: E402
+    MAX_PLAYERS_PER_GAME,
+    STATION_STATUS_COALESCE_SECONDS,
+    TOTAL_STATIONS,
+)
+from games.hangman.messages import (  # noqa: E402
+    StationDeltaMessage,
+    StationSnapshotMessage,
+)
+from games.hangman.models import HangmanGame, HangmanPlayer  # noqa: E402
+from games.hangman.station_status import StationTracker  # noqa: E402
+
+GAME_SECONDS = 60
+SECONDS_PER_STATION_CHANGE = 8.0
+SEED = 7
+
+
+def build_game() -> HangmanGame:
+    game = HangmanGame.create(["WORD"] * TOTAL_STATIONS)
+    for i in range(MAX_PLAYERS_PER_GAME):
+        game.add_player(HangmanPlayer.create(f"Jugador{i:02d}", MagicMock()))
+    return game
+
+
+def simulate_events(game: HangmanGame) -> list[tuple[float, str, int]]:
+    """Generate (time, player_id, new_station) events for one game-minute."""
+    rng = random.Random(SEED)
+    stations = {player.id: 1 for player in game.players.values()}
+    events = []
+    for player_id in stations:
+        t = rng.expovariate(1 / SECONDS_PER_STATION_CHANGE)
+        while t < GAME_SECONDS:
+            if rng.random() < 0.7:
+                stations[player_id] = min(stations[player_id] + 1, TOTAL_STATIONS)
+            else:
+                stations[player_id] = 1
+            events.append((t, player_id, stations[player_id]))
+            t += rng.expovariate(1 / SECONDS_PER_STATION_CHANGE)
+    return sorted(events)
+
+
+def legacy_payload(game: HangmanGame) -> int:
+    stations: dict[int, list[str]] = {i: [] for i in range(1, TOTAL_STATIONS + 1)}
+    for player in game.connected_players:
+        stations[player.current_station].append(player.name)
+    return len(json.dumps({"type": "station_status", "stations": stations}))
+
+
+def windows(events: list[tuple[float, str, int]]) -> dict[int, list]:
+    grouped: dict[int, list] = defaultdict(list)
+    for event in events:
+        grouped[int(event[0] / STATION_STATUS_COALESCE_SECONDS)].append(event)
+    return dict(sorted(grouped.items()))
+
+
+def reset(game: HangmanGame) -> None:
+    for player in game.players.values():
+        player.current_station = 1
+
+
+def legacy_per_change(game, events) -> tuple[int, int]:
+    reset(game)
+    recipients = game.player_count
+    total = frames = 0
+    for _, player_id, station in events:
+        game.players[player_id].current_station = station
+        total += legacy_payload(game) * recipients
+        frames += recipients
+    return total, frames
+
+
+def legacy_coalesced(game, events) -> tuple[int, int]:
+    reset(game)
+    recipients = game.player_count
+    total = frames = 0
+    for batch in windows(events).values():
+        for _, player_id, station in batch:
+            game.players[player_id].current_station = station
+        total += legacy_payload(game) * recipients
+        frames += recipients
+    return total, frames
+
+
+def delta_coalesced(game, events) -> tuple[int, int]:
+    reset(game)
+    recipients = game.player_count
+    tracker = StationTracker(game)
+    snapshot = StationSnapshotMessage(seq=tracker.seq, players=tracker.snapshot(game))
+    total = len(json.dumps(snapshot.to_dict())) * recipients
+    frames = recipients
+    for batch in windows(events).values():
+        for _, player_id, station in batch:
+            game.players[player_id].current_station = station
+        moves = tracker.advance(game)
+        if moves:
+            delta = StationDeltaMessage(seq=tracker.seq, moves=moves)
+            total += len(json.dumps(delta.to_dict())) * recipients
+            frames += recipients
+    return total, frames
+
+
+def main() -> None:
+    game = build_game()
+    events = simulate_events(game)
+    print(
+        f"{MAX_PLAYERS_PER_GAME} players, {len(events)} station changes "
+        f"in {GAME_SECONDS} s"
+    )
+    for name, strategy in (
+        ("full lists, per change", legacy_per_change),
+        ("full lists, coalesced", legacy_coalesced),
+        ("deltas, coalesced", delta_coalesced),
+    ):
+        total, frames = strategy(game, events)
+        print(f"{name:<24} {total / 1024:10.1f} KiB/game-minute  {frames:7d} frames")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,109 @@
+"""Count queue status frames sent while a lobby fills up.
+
+PLAYERS players join one game type's queue, one every JOIN_INTERVAL
+seconds, and nobody leaves. Compares the previous behaviour, a waiting
+message to every queued player on each join, with the throttled updates of
+GameRouter (the first join reported at once, then at most one pre-encoded
+frame per queue per WAITING_STATUS_COALESCE_SECONDS). Reports the frames
+written to sockets, the time spent producing them and how long the first
+player waited for a queue update.
+
+Usage:
+    python benchmarks/bench_waiting_status.py
+"""
+
+import asyncio
+import sys
+import time
+from pathlib import Path
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from config import WAITING_STATUS_COALESCE_SECONDS  # noqa: E402
+from models.base import Player  # noqa: E402
+from models.messages import WaitingMessage  # noqa: E402
+from services.matchmaking import Matchmaking  # noqa: E402
+from websocket.handler import WebSocketHandler  # noqa: E402
+from websocket.router import GameRouter  # noqa: E402
+
+PLAYERS = (50, 500, 2_000)
+JOIN_INTERVAL = 0.001
+
+
+class CountingWebSocket:
+    """WebSocket stand-in that only counts the frames written to it."""
+
+    frames = 0
+    first_at: float | None = None
+
+    def __init__(self):
+        self.client_state = SimpleNamespace(name="CONNECTED")
+
+    async def send_text(self, data: str) -> None:
+        CountingWebSocket.frames += 1
+        if CountingWebSocket.first_at is None:
+            CountingWebSocket.first_at = time.perf_counter()
+
+
+async def storm(count: int, throttled: bool) -> tuple[int, float, float]:
+    handler = WebSocketHandler()
+    router = GameRouter(handler)
+    matchmaking = Matchmaking()
+    matchmaking.register_game_type(
+        "bench", 2, count + 1, 3600, MagicMock(), AsyncMock()
+    )
+    handler._matchmaking = router._matchmaking = matchmaking
+
+    async def legacy_broadcast() -> None:
+        queue_size = matchmaking.get_queue_size("bench")
+        waiting_msg = WaitingMessage(
+            players_in_queue=queue_size,
+            message=f"Esperando jugadores... ({queue_size} en cola)",
+        )
+        await handler.broadcast_to_queue(waiting_msg, "bench")
+
+    CountingWebSocket.frames = 0
+    CountingWebSocket.first_at = None
+    busy = 0.0
+    first_join = time.perf_counter()
+    for i in range(count):
+        ws = CountingWebSocket()
+        player = Player(id=f"p{i}", name="bench", websocket=ws)
+        handler.register_connection(player.id, ws)
+        matchmaking.enqueue_player(player, "bench")
+
+        started = time.perf_counter()
+        if throttled:
+            router._schedule_waiting_status("bench")
+        else:
+            await legacy_broadcast()
+        busy += time.perf_counter() - started
+        await asyncio.sleep(JOIN_INTERVAL)
+
+    await asyncio.sleep(WAITING_STATUS_COALESCE_SECONDS * 1.5)
+    await handler.flush()
+    return CountingWebSocket.frames, busy, CountingWebSocket.first_at - first_join
+
+
+def main() -> None:
+    print(
+        f"one join every {JOIN_INTERVAL * 1000:.0f} ms,"
+        f" throttle window {WAITING_STATUS_COALESCE_SECONDS * 1000:.0f} ms"
+    )
+    print(
+        f"{'mode':<10} {'players':>8} {'frames':>10} {'busy ms':>10}"
+        f" {'first update ms':>16}"
+    )
+    for count in PLAYERS:
+        for mode, throttled in (("per join", False), ("throttled", True)):
+            frames, busy, first = asyncio.run(storm(count, throttled))
+            print(
+                f"{mode:<10} {count:>8} {frames:>10} {busy * 1000:>10.1f}"
+                f" {first * 1000:>16.1f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
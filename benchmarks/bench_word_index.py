@@ -0,0 +1,101 @@
+"""Measure constrained word queries over growing dictionaries.
+
+Builds random dictionaries of WORDS words and runs QUERIES queries asking
+for words whose distinct-letter count lies in a range and that avoid two
+letters. Compares rescanning the word strings on every query with a
+WordIndex queried through plain lists and through NumPy (when installed),
+and reports the time to build each index. The NumPy index is also built
+over the dictionary compiled to a word pack, whose blob it reads whole.
+Index queries are timed up to the matching positions, which is all
+WordBank.select_words needs; their words are decoded once, to check them.
+
+Usage:
+    python benchmarks/bench_word_index.py
+"""
+
+import random
+import string
+import sys
+import tempfile
+import time
+from collections.abc import Sequence
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from services.word_index import WordIndex, np  # noqa: E402
+from services.word_pack import PackedWords, compile_words  # noqa: E402
+
+WORDS = (10_000, 100_000, 1_000_000)
+QUERIES = 20
+CONSTRAINTS = {"min_distinct": 5, "max_distinct": 7, "avoid": "QX"}
+
+
+def random_words(count: int) -> list[str]:
+    random.seed(count)
+    letters = string.ascii_uppercase
+    return [
+        "".join(random.choices(letters, k=random.randint(3, 14)))
+        for _ in range(count)
+    ]
+
+
+def rescan(words: list[str]) -> list[str]:
+    """Answer the query by looking at every word's letters."""
+    avoid = set(CONSTRAINTS["avoid"])
+    low, high = CONSTRAINTS["min_distinct"], CONSTRAINTS["max_distinct"]
+    return [
+        word
+        for word in words
+        if low <= len(set(word)) <= high and not avoid.intersection(word)
+    ]
+
+
+def per_query(run) -> tuple[float, Sequence]:
+    started = time.perf_counter()
+    for _ in range(QUERIES):
+        result = run()
+    return (time.perf_counter() - started) / QUERIES, result
+
+
+def timed_build(words: Sequence[str], use_numpy: bool) -> tuple[WordIndex, float]:
+    started = time.perf_counter()
+    index = WordIndex(words, use_numpy=use_numpy)
+    return index, time.perf_counter() - started
+
+
+def main() -> None:
+    backends = [("lists", False)] + ([("numpy", True)] if np is not None else [])
+    pack_path = Path(tempfile.mkdtemp()) / "words.qwb"
+    print(f"query: {CONSTRAINTS}")
+    print(
+        f"{'words':>9} {'method':<8} {'build ms':>10} {'query ms':>10}"
+        f" {'matches':>9}"
+    )
+    for count in WORDS:
+        words = random_words(count)
+        elapsed, expected = per_query(lambda: rescan(words))
+        print(
+            f"{count:>9} {'rescan':<8} {'-':>10} {elapsed * 1000:>10.2f}"
+            f" {len(expected):>9}"
+        )
+        compile_words(words, pack_path)
+        pack = PackedWords(pack_path)
+        sources = [(name, words, use_numpy) for name, use_numpy in backends]
+        if np is not None:
+            sources.append(("np pack", pack, True))
+        for name, source, use_numpy in sources:
+            index, build = timed_build(source, use_numpy)
+            elapsed, found = per_query(lambda: index.positions(**CONSTRAINTS))
+            assert [source[i] for i in found] == expected
+            print(
+                f"{count:>9} {name:<8} {build * 1000:>10.1f}"
+                f" {elapsed * 1000:>10.2f} {len(found):>9}"
+            )
+        del index
+        pack.close()
+    pack_path.unlink()
+
+
+if __name__ == "__main__":
+    main()
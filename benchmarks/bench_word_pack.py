@@ -0,0 +1,79 @@
+"""Compare loading a large word list as text and as a compiled word pack.
+
+Writes a random list of WORDS words as a text file and as a word pack, then
+reports, for each format, the time to open a WordBank on it, the tracemalloc
+bytes the open bank holds, and the time to select a game's words. The text
+bank reads and keeps every word; the packed bank maps the file and decodes
+only the words it selects, and its pages are shared by every worker
+process mapping the same file.
+
+Usage:
+    python benchmarks/bench_word_pack.py
+"""
+
+import random
+import string
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from config import TOTAL_STATIONS  # noqa: E402
+from services.word_bank import WordBank  # noqa: E402
+from services.word_pack import compile_file  # noqa: E402
+
+WORDS = 2_000_000
+SELECTIONS = 1_000
+
+
+def write_word_list(path: Path) -> None:
+    random.seed(WORDS)
+    letters = string.ascii_uppercase
+    with open(path, "w", encoding="utf-8") as f:
+        for _ in range(WORDS):
+            f.write("".join(random.choices(letters, k=random.randint(4, 12))))
+            f.write("\n")
+
+
+def measure(path: Path) -> tuple[float, int, float]:
+    tracemalloc.start()
+    started = time.perf_counter()
+    bank = WordBank(path)
+    opened = time.perf_counter() - started
+    held = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+
+    started = time.perf_counter()
+    for _ in range(SELECTIONS):
+        bank.select_words(TOTAL_STATIONS)
+    selected = (time.perf_counter() - started) / SELECTIONS
+    return opened, held, selected
+
+
+def main() -> None:
+    with tempfile.TemporaryDirectory() as tmp:
+        text = Path(tmp) / "words.txt"
+        pack = Path(tmp) / "words.qwb"
+        write_word_list(text)
+        started = time.perf_counter()
+        compile_file(text, pack)
+        compiled = time.perf_counter() - started
+
+        print(f"{WORDS} words, compiled in {compiled:.1f} s")
+        print(
+            f"{'format':<8} {'file MB':>8} {'open ms':>10} {'held MB':>9}"
+            f" {'select us':>10}"
+        )
+        for name, path in (("text", text), ("pack", pack)):
+            opened, held, selected = measure(path)
+            print(
+                f"{name:<8} {path.stat().st_size / 1e6:>8.1f} {opened * 1000:>10.1f}"
+                f" {held / 1e6:>9.2f} {selected * 1e6:>10.1f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
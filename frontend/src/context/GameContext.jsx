@@ -1,4 +1,4 @@
-import { createContext, useContext, useReducer, useEffect, useCallback, useMemo } from 'react';
+import { createContext, useContext, useReducer, useEffect, useCallback, useMemo, useRef } from 'react';
 import useWebSocket from '../hooks/useWebSocket';
 
 const GameStateContext = createContext(null);
@@ -22,7 +22,8 @@ const ActionTypes = {
   UPDATE_STATION: 'UPDATE_STATION',
   ADD_GUESSED_LETTER: 'ADD_GUESSED_LETTER',
   UPDATE_PLAYER_PROGRESS: 'UPDATE_PLAYER_PROGRESS',
-  UPDATE_STATION_STATUS: 'UPDATE_STATION_STATUS',
+  STATION_SNAPSHOT: 'STATION_SNAPSHOT',
+  STATION_DELTA: 'STATION_DELTA',
   ADD_PLAYER: 'ADD_PLAYER',
   SET_GAME_OVER: 'SET_GAME_OVER',
   SET_WAITING_INFO: 'SET_WAITING_INFO',
@@ -58,6 +59,7 @@ const initialState = {
   lastGuess: null, // { letter, correct }
 
   stationStatus: {}, // { stationNumber: [playerNames] }
+  stationPositions: {}, // { playerId: { name, station } }
 
   playersInQueue: 0,
   waitingMessage: '',
@@ -81,6 +83,14 @@ const initialState = {
   },
 };
 
+function groupByStation(positions) {
+  const stations = {};
+  Object.values(positions).forEach(({ name, station }) => {
+    (stations[station] ??= []).push(name);
+  });
+  return stations;
+}
+
 function gameReducer(state, action) {
   switch (action.type) {
     case ActionTypes.SET_PLAYER:
@@ -152,11 +162,35 @@ function gameReducer(state, action) {
         ),
       };
 
-    case ActionTypes.UPDATE_STATION_STATUS:
+    case ActionTypes.STATION_SNAPSHOT: {
+      const positions = {};
+      action.payload.players.forEach(({ id, name, station }) => {
+        positions[id] = { name, station };
+      });
       return {
         ...state,
-        stationStatus: action.payload,
+        stationPositions: positions,
+        stationStatus: groupByStation(positions),
       };
+    }
+
+    case ActionTypes.STATION_DELTA: {
+      const positions = { ...state.stationPositions };
+      action.payload.moves.forEach(({ player_id: id, to }) => {
+        if (to === 0) {
+          delete positions[id];
+          return;
+        }
+        const name = positions[id]?.name ??
+          state.players.find(p => p.id === id)?.name ?? '';
+        positions[id] = { name, station: to };
+      });
+      return {
+        ...state,
+        stationPositions: positions,
+        stationStatus: groupByStation(positions),
+      };
+    }
 
     case ActionTypes.ADD_PLAYER:
       return {
@@ -309,6 +343,12 @@ export function GameProvider({ children }) {
     });
   }, [subscribe]);
 
+  useEffect(() => {
+    return subscribe('resume_failed', () => {
+      dispatch({ type: ActionTypes.RESET_GAME });
+    });
+  }, [subscribe]);
+
   useEffect(() => {
     return subscribe('waiting', (data) => {
       dispatch({
@@ -391,15 +431,31 @@ export function GameProvider({ children }) {
     });
   }, [subscribe]);
 
+  // Last station sequence number applied; null while waiting for a resync
+  const stationSeqRef = useRef(0);
+
   useEffect(() => {
-    return subscribe('station_status', (data) => {
-      dispatch({
-        type: ActionTypes.UPDATE_STATION_STATUS,
-        payload: data.stations,
-      });
+    return subscribe('station_snapshot', (data) => {
+      stationSeqRef.current = data.seq;
+      dispatch({ type: ActionTypes.STATION_SNAPSHOT, payload: data });
     });
   }, [subscribe]);
 
+  useEffect(() => {
+    return subscribe('station_delta', (data) => {
+      if (stationSeqRef.current === null) {
+        return;
+      }
+      if (data.seq !== stationSeqRef.current + 1) {
+        stationSeqRef.current = null;
+        sendMessage({ type: 'station_resync' });
+        return;
+      }
+      stationSeqRef.current = data.seq;
+      dispatch({ type: ActionTypes.STATION_DELTA, payload: data });
+    });
+  }, [subscribe, sendMessage]);
+
   useEffect(() => {
     return subscribe('game_over', (data) => {
       dispatch({
@@ -9,6 +9,8 @@ export function useWebSocket() {
   const wsRef = useRef(null);
   const reconnectTimeoutRef = useRef(null);
   const messageHandlersRef = useRef(new Map());
+  // Resume token and number of frames received since `joined` (pings excluded)
+  const sessionRef = useRef({ token: null, seq: 0 });
 
   const connect = useCallback(() => {
     if (wsRef.current?.readyState === WebSocket.OPEN) {
@@ -19,6 +21,10 @@ export function useWebSocket() {
 
     ws.onopen = () => {
       setIsConnected(true);
+      const { token, seq } = sessionRef.current;
+      if (token) {
+        ws.send(JSON.stringify({ type: 'resume', token, last_seq: seq }));
+      }
     };
 
     ws.onclose = () => {
@@ -35,6 +41,23 @@ export function useWebSocket() {
     ws.onmessage = (event) => {
       try {
         const data = JSON.parse(event.data);
+        if (data.type === 'ping') {
+          ws.send(JSON.stringify({ type: 'pong' }));
+          return;
+        }
+
+        const session = sessionRef.current;
+        if (data.type === 'joined') {
+          session.token = data.resume_token || null;
+          session.seq = 1;
+        } else if (data.type === 'resumed') {
+          session.seq = data.seq;
+        } else if (data.type === 'resume_failed') {
+          session.token = null;
+        } else {
+          session.seq += 1;
+        }
+
         setLastMessage(data);
 
         // Call registered handlers for this message type
@@ -59,6 +82,9 @@ export function useWebSocket() {
   }, []);
 
   const sendMessage = useCallback((message) => {
+    if (message.type === 'leave') {
+      sessionRef.current.token = null;
+    }
     if (wsRef.current?.readyState === WebSocket.OPEN) {
       wsRef.current.send(JSON.stringify(message));
     }
@@ -1,5 +1,7 @@
 """Game configuration constants."""
 
+import os
+
 # Hangman
 MAX_PLAYERS_PER_GAME = 50
 MIN_PLAYERS_TO_START = 2
@@ -7,6 +9,16 @@ TOTAL_STATIONS = 10
 MAX_ATTEMPTS_PER_WORD = 6
 MATCHMAKING_TIMEOUT_SECONDS = 30
 GAME_TYPE_HANGMAN = "hangman"
+STATION_STATUS_COALESCE_SECONDS = 0.1  # Merge station_status changes within this window
+GUESS_BATCH_MAX_LETTERS = 8  # Most letters accepted in one guess_batch frame
+HANGMAN_JOIN_POLICY = "fill"  # Late joins: "fill" the fullest game or "balance"
+HANGMAN_GAME_POOL_SIZE = 4  # New games kept pre-built with their words; 0 disables
+# Word list or compiled word pack (.qwb); "" uses the bundled data/words.txt
+WORD_BANK_FILE = os.environ.get("QUODPOT_WORD_BANK", "")
+
+# Game lifecycle
+GAME_TTL_SECONDS = 300  # Seconds a finished or abandoned game is kept before eviction
+GAME_SWEEP_INTERVAL_SECONDS = 60  # Seconds between eviction sweeps
 
 # Duels
 GAME_TYPE_DUELS = "duels"
@@ -14,6 +26,8 @@ DUELS_MAX_PLAYERS = 2
 DUELS_MIN_PLAYERS = 2
 DUELS_ROUNDS_TO_WIN = 2
 DUELS_MATCHMAKING_TIMEOUT = 10
+DUELS_MATCHMAKER = "event"  # "event": pair on each join, "tick": pair the queue per tick
+DUELS_MATCHMAKER_TICK_SECONDS = 0.1  # Seconds between batch pairings in "tick" mode
 
 # Game mode constants
 GAME_MODE_PVP = "pvp"
@@ -24,4 +38,30 @@ AI_PLAYER_NAME = "Guardián Arcano"
 AI_RESPONSE_DELAY_SECONDS = 1.5  # Simula tiempo de pensamiento
 
 # WebSocket
-WS_PING_INTERVAL = 30
+WS_PING_INTERVAL = 30  # Seconds between heartbeat sweeps
+WS_PING_MISSED_LIMIT = 2  # Idle intervals without a frame before a connection is reaped
+WS_PING_SWEEP_SLICES = 30  # Ticks each heartbeat sweep is spread over within the interval
+WS_OUTBOUND_QUEUE_SIZE = 256  # Frames a client may fall behind before eviction
+WS_OUTBOUND_MAX_LAG_SECONDS = 10.0  # Seconds a client may fall behind before eviction
+WS_SEND_STALL_SECONDS = 1.0  # A single send slower than this counts as a stall
+WAITING_STATUS_COALESCE_SECONDS = 0.5  # At most one queue status update per game type per window
+SESSION_GRACE_SECONDS = 30.0  # How long a dropped player's seat is held for resume
+SESSION_REPLAY_BUFFER_SIZE = 256  # Outbound frames kept per player for replay
+WS_COMPRESSION_ENABLED = True  # Offer "<codec>+deflate" subprotocols
+WS_COMPRESSION_THRESHOLD_BYTES = 1024  # Frames smaller than this are sent uncompressed
+WS_COMPRESSION_LEVEL = 6  # zlib level, 1 (fastest) to 9 (smallest)
+
+# Rate limits: message type -> (tokens per second, burst)
+RATE_LIMITS = {
+    "guess": (5.0, 10),
+    "spell_cast": (2.0, 4),
+}
+RATE_LIMIT_STRIKES = 20  # Dropped messages a client may accumulate before disconnect
+RATE_LIMIT_STRIKE_REFILL_PER_SECOND = 1.0  # Strikes forgiven per second
+
+# Game shards: 0 runs every game in this process; N > 0 runs N shard processes
+# behind a front layer that relays client sockets to them
+SHARD_COUNT = int(os.environ.get("QUODPOT_SHARDS", "0"))
+SHARD_HOST = "127.0.0.1"
+SHARD_BASE_PORT = int(os.environ.get("QUODPOT_SHARD_BASE_PORT", "9100"))  # Shard i listens on base + i
+SHARD_CONNECT_TIMEOUT_SECONDS = 10.0  # How long the front waits for shards to start
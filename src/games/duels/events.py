@@ -41,7 +41,7 @@ class DuelsEventProcessor:
     async def create_pve_game(self, player: Player) -> DuelGame:
         """Create and start a PVE game immediately."""
         manager = get_duels_manager()
-        game = manager.create_pve_game(player, self._pve_service)
+        game = manager.create_pve_game(player, self._pve_service, sender=self._handler)
         return game
 
     async def on_game_start(self, game: DuelGame) -> None:
@@ -53,10 +53,9 @@ class DuelsEventProcessor:
 
         for player_id, player in game.players.items():
             if player_id not in game.player_wrappers:
-                websocket = self._handler._connections.get(player_id)
-                if websocket:
+                if self._handler.is_connected(player_id):
                     game.player_wrappers[player_id] = HumanPlayerWrapper(
-                        player=player, websocket=websocket
+                        player=player, websocket=player.websocket, sender=self._handler
                     )
 
         player1_wrapper = game.player_wrappers.get(player1.id)
@@ -2,6 +2,7 @@
 
 from config import DUELS_ROUNDS_TO_WIN
 from models.base import GameStatus, Player
+from models.player_protocol import MessageSender
 from models.player_wrapper import HumanPlayerWrapper
 from .models import DuelGame, RoundResult, Spell
 
@@ -22,11 +23,18 @@ class DuelsManager:
     def get_game(self, game_id: str) -> DuelGame | None:
         return self._games.get(game_id)
 
+    @property
+    def games(self) -> list[DuelGame]:
+        """Get every game the manager holds, finished ones included."""
+        return list(self._games.values())
+
     def remove_game(self, game_id: str) -> None:
         if game_id in self._games:
             del self._games[game_id]
 
-    def create_pve_game(self, human_player: Player, ai_service) -> DuelGame:
+    def create_pve_game(
+        self, human_player: Player, ai_service, sender: MessageSender | None = None
+    ) -> DuelGame:
         """Create a PVE game with AI opponent."""
         game = DuelGame(
             id=DuelGame.generate_id(),
@@ -49,7 +57,8 @@ class DuelsManager:
 
         game.player_wrappers[human_player.id] = HumanPlayerWrapper(
             player=human_player,
-            websocket=human_player.websocket
+            websocket=human_player.websocket,
+            sender=sender,
         )
         game.player_wrappers[ai_wrapper.id] = ai_wrapper
 
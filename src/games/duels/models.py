@@ -1,7 +1,7 @@
 """Duels game models."""
 
+import time
 from dataclasses import dataclass, field
-from datetime import datetime
 from enum import Enum
 
 from models.base import BaseGame, Player
@@ -19,14 +19,14 @@ class RoundResult(str, Enum):
     TIE = "tie"
 
 
-@dataclass
+@dataclass(slots=True)
 class SpellCast:
     player_id: str
     spell: Spell
-    timestamp: datetime = field(default_factory=datetime.now)
+    timestamp: float = field(default_factory=time.monotonic)
 
 
-@dataclass
+@dataclass(slots=True)
 class Round:
     round_number: int
     player1_cast: SpellCast | None = None
@@ -58,7 +58,7 @@ class Round:
         return wins[(spell1, spell2)]
 
 
-@dataclass
+@dataclass(slots=True)
 class DuelGame(BaseGame):
     rounds: list[Round] = field(default_factory=list)
     player1_id: str = ""
@@ -2,53 +2,77 @@ from typing import Any
 
 from fastapi import WebSocket
 
-from config import TOTAL_STATIONS
+from config import STATION_STATUS_COALESCE_SECONDS, TOTAL_STATIONS
 from models.base import GameStatus
 from models.messages import ErrorMessage
+from services.coalescer import Coalescer
 
-from .manager import get_hangman_manager
+from .manager import GuessResult, get_hangman_manager
 from .messages import (
-    CorrectGuessMessage,
     GameOverMessage,
     GameStartMessage,
+    GuessBatchMessage,
+    GuessBatchResultMessage,
     GuessMessage,
     PlayerJoinedMessage,
     PlayerProgressMessage,
     StationCompleteMessage,
+    StationDeltaMessage,
     StationFailedMessage,
-    StationStatusMessage,
-    StationUpdateMessage,
-    WrongGuessMessage,
+    StationSnapshotMessage,
 )
 from .models import HangmanGame, HangmanPlayer
+from .station_status import StationTracker
 
 
 class HangmanEventProcessor:
     """Processes Hangman-specific WebSocket events."""
 
-    def __init__(self, handler: "WebSocketHandler"):
+    def __init__(
+        self,
+        handler: "WebSocketHandler",
+        station_status_window: float = STATION_STATUS_COALESCE_SECONDS,
+    ):
         self._handler = handler
+        self._station_status = Coalescer(station_status_window, name="station_status")
+        self._station_trackers: dict[str, StationTracker] = {}
 
-    def _get_station_status(self, game: HangmanGame) -> dict[int, list[str]]:
-        """Get the distribution of players across stations."""
-        stations: dict[int, list[str]] = {}
-        for i in range(1, TOTAL_STATIONS + 1):
-            stations[i] = []
+    def _schedule_station_status(self, game: HangmanGame) -> None:
+        """Schedule a station delta broadcast, merged with other recent changes."""
 
-        for player in game.connected_players:
-            station = player.current_station
-            if station in stations:
-                stations[station].append(player.name)
+        async def broadcast() -> None:
+            await self._broadcast_station_delta(game)
 
-        return stations
+        self._station_status.schedule(game.id, broadcast)
 
-    async def _broadcast_station_status(self, game: HangmanGame) -> None:
-        """Broadcast the current station status to all players in a game."""
-        stations = self._get_station_status(game)
-        await self._handler.broadcast_to_game(
-            game,
-            StationStatusMessage(stations=stations),
-        )
+    async def _broadcast_station_delta(self, game: HangmanGame) -> None:
+        """Broadcast station moves since the last delta to all players in a game."""
+        tracker = self._station_trackers.get(game.id)
+        if tracker is None or game.status != GameStatus.PLAYING:
+            return
+
+        moves = tracker.advance(game)
+        if moves and game.connected_players:
+            await self._handler.broadcast_to_game(
+                game,
+                StationDeltaMessage(seq=tracker.seq, moves=moves),
+            )
+
+    def _station_snapshot(self, game: HangmanGame) -> StationSnapshotMessage | None:
+        """Build a full station snapshot consistent with the last delta sent."""
+        tracker = self._station_trackers.get(game.id)
+        if tracker is None:
+            return None
+        return StationSnapshotMessage(seq=tracker.seq, players=tracker.snapshot(game))
+
+    def _end_station_tracking(self, game: HangmanGame) -> None:
+        """Stop station updates for a game that has finished."""
+        self._station_status.cancel(game.id)
+        self._station_trackers.pop(game.id, None)
+
+    def forget_game(self, game: HangmanGame) -> None:
+        """Drop the per-game state of an evicted game."""
+        self._end_station_tracking(game)
 
     async def handle_join(
         self, websocket: WebSocket, player_name: str, matchmaking
@@ -80,12 +104,14 @@ class HangmanEventProcessor:
             ),
         )
 
-        station_info = manager.get_player_station_info(player)
         await self._handler.send_to_websocket(
-            player.websocket,
-            StationUpdateMessage(**station_info),
+            player.websocket, manager.station_update(player)
         )
 
+        snapshot = self._station_snapshot(game)
+        if snapshot is not None:
+            await self._handler.send_to_websocket(player.websocket, snapshot)
+
         await self._handler.broadcast_to_game_except(
             game,
             PlayerJoinedMessage(
@@ -96,61 +122,96 @@ class HangmanEventProcessor:
             except_player_id=player.id,
         )
 
-        await self._broadcast_station_status(game)
+        self._schedule_station_status(game)
 
-    async def handle_guess(
-        self, player_id: str, message: GuessMessage, matchmaking
-    ) -> None:
-        """Handle a letter guess."""
+    def _guessing_player(
+        self, player_id: str, matchmaking
+    ) -> tuple[HangmanGame, HangmanPlayer] | None:
+        """Find the game and player for a guess, if the game is in progress."""
         manager = get_hangman_manager()
 
         game_id = matchmaking.get_player_game(player_id)
         if not game_id:
-            return
+            return None
 
         game = manager.get_game(game_id)
         if not game or game.status != GameStatus.PLAYING:
-            return
+            return None
 
         player = game.get_player(player_id)
         if not player:
+            return None
+
+        return game, player
+
+    async def handle_guess(
+        self, player_id: str, message: GuessMessage, matchmaking
+    ) -> None:
+        """Handle a letter guess."""
+        found = self._guessing_player(player_id, matchmaking)
+        if found is None:
             return
+        game, player = found
 
-        result = manager.process_guess(game, player, message.letter)
+        result = get_hangman_manager().process_guess(game, player, message.letter)
 
-        if "error" in result:
+        if result.error is not None:
             await self._handler.send_to_player(
-                player_id, ErrorMessage(message=result["error"])
+                player_id, ErrorMessage(message=result.error)
             )
             return
 
-        if result["correct"]:
-            await self._handler.send_to_player(
-                player_id,
-                CorrectGuessMessage(
-                    letter=result["letter"],
-                    revealed=result["revealed"],
-                ),
-            )
-        else:
+        await self._handler.send_to_player(player_id, result.to_message())
+
+        await self._handle_station_outcome(game, player, result)
+
+    async def handle_guess_batch(
+        self, player_id: str, message: GuessBatchMessage, matchmaking
+    ) -> None:
+        """Handle several guesses sent in one frame."""
+        found = self._guessing_player(player_id, matchmaking)
+        if found is None:
+            return
+        game, player = found
+
+        batch = get_hangman_manager().process_guesses(game, player, message.letters)
+
+        if batch.error is not None:
             await self._handler.send_to_player(
-                player_id,
-                WrongGuessMessage(
-                    letter=result["letter"],
-                    attempts_left=result["attempts_left"],
-                ),
+                player_id, ErrorMessage(message=batch.error)
             )
+            return
+
+        result = batch.result
+        await self._handler.send_to_player(
+            player_id,
+            GuessBatchResultMessage(
+                guesses=batch.guesses,
+                revealed=result.revealed,
+                attempts_left=result.attempts_left,
+            ),
+        )
+
+        await self._handle_station_outcome(game, player, result)
+
+    async def _handle_station_outcome(
+        self, game: HangmanGame, player: HangmanPlayer, result: GuessResult
+    ) -> None:
+        """Send station completion or failure updates after a guess."""
+        manager = get_hangman_manager()
+        player_id = player.id
 
-        if result["station_complete"]:
+        if result.station_complete:
             await self._handler.send_to_player(
                 player_id,
                 StationCompleteMessage(
                     station=player.current_station - 1,  # Previous station completed
-                    word=result["word"],
+                    word=result.word,
                 ),
             )
 
-            if result["game_won"]:
+            if result.game_won:
+                self._end_station_tracking(game)
                 await self._handler.broadcast_to_game(
                     game,
                     GameOverMessage(
@@ -160,10 +221,8 @@ class HangmanEventProcessor:
                     ),
                 )
             else:
-                station_info = manager.get_player_station_info(player)
                 await self._handler.send_to_player(
-                    player_id,
-                    StationUpdateMessage(**station_info),
+                    player_id, manager.station_update(player)
                 )
 
                 await self._handler.broadcast_to_game_except(
@@ -176,21 +235,19 @@ class HangmanEventProcessor:
                     except_player_id=player_id,
                 )
 
-                await self._broadcast_station_status(game)
+                self._schedule_station_status(game)
 
-        elif result["station_failed"]:
+        elif result.station_failed:
             await self._handler.send_to_player(
                 player_id,
                 StationFailedMessage(
                     reset_to=1,
-                    word=result["word"],
+                    word=result.word,
                 ),
             )
 
-            station_info = manager.get_player_station_info(player)
             await self._handler.send_to_player(
-                player_id,
-                StationUpdateMessage(**station_info),
+                player_id, manager.station_update(player)
             )
 
             await self._handler.broadcast_to_game_except(
@@ -203,7 +260,7 @@ class HangmanEventProcessor:
                 except_player_id=player_id,
             )
 
-            await self._broadcast_station_status(game)
+            self._schedule_station_status(game)
 
     async def on_game_start(self, game: HangmanGame) -> None:
         """Called when a Hangman game starts from matchmaking."""
@@ -220,13 +277,28 @@ class HangmanEventProcessor:
         )
 
         for player in game.connected_players:
-            station_info = manager.get_player_station_info(player)
             await self._handler.send_to_player(
-                player.id,
-                StationUpdateMessage(**station_info),
+                player.id, manager.station_update(player)
             )
 
-        await self._broadcast_station_status(game)
+        self._station_trackers[game.id] = StationTracker(game)
+        await self._handler.broadcast_to_game(game, self._station_snapshot(game))
+
+    async def handle_station_resync(self, player_id: str, matchmaking) -> None:
+        """Send a full station snapshot to a client that detected a gap."""
+        manager = get_hangman_manager()
+
+        game_id = matchmaking.get_player_game(player_id)
+        if not game_id:
+            return
+
+        game = manager.get_game(game_id)
+        if not game or game.status != GameStatus.PLAYING:
+            return
+
+        snapshot = self._station_snapshot(game)
+        if snapshot is not None:
+            await self._handler.send_to_player(player_id, snapshot)
 
     async def handle_leave(self, player_id: str, matchmaking) -> None:
         """Handle a Hangman player leaving."""
@@ -237,6 +309,6 @@ class HangmanEventProcessor:
             game = manager.get_game(game_id)
             if game:
                 game.remove_player(player_id)
+                manager.update_joinable(game)
                 if game.connected_players:
-                    await self._broadcast_station_status(game)
-                    await self._broadcast_station_status(game)
+                    self._schedule_station_status(game)
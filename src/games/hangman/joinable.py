@@ -0,0 +1,81 @@
+"""Index of Hangman games that late joiners can be placed in."""
+
+from enum import Enum
+
+from config import MAX_PLAYERS_PER_GAME
+from models.base import GameStatus
+
+from .models import HangmanGame
+
+
+class JoinPolicy(str, Enum):
+    """Which joinable game a late joiner is placed in."""
+    FILL = "fill"  # The fullest game, so games reach capacity quickly
+    BALANCE = "balance"  # The emptiest game, so players spread evenly
+
+
+class JoinableGames:
+    """PLAYING games with free slots, bucketed by connected player count.
+
+    Each bucket is an insertion-ordered dict and a bitmask records which
+    buckets are non-empty, so updates and lookups are O(1) however many
+    games exist. Within a bucket the longest-indexed game is picked first.
+    Games whose players have all left are not offered.
+
+    The manager calls update() whenever a game's status or players change;
+    find() also re-files any game it finds out of date.
+    """
+
+    def __init__(
+        self,
+        capacity: int = MAX_PLAYERS_PER_GAME,
+        policy: JoinPolicy = JoinPolicy.FILL,
+    ):
+        self._capacity = capacity
+        self._policy = policy
+        self._buckets: list[dict[str, HangmanGame]] = [{} for _ in range(capacity)]
+        self._levels: dict[str, int] = {}
+        self._occupied = 0
+
+    def __len__(self) -> int:
+        return len(self._levels)
+
+    def update(self, game: HangmanGame) -> None:
+        """File a game under its current player count, or drop it if full."""
+        level = game.player_count if game.status == GameStatus.PLAYING else 0
+        current = self._levels.get(game.id)
+        if current == level:
+            return
+        if current is not None:
+            self._remove(game.id, current)
+        if 0 < level < self._capacity:
+            self._buckets[level][game.id] = game
+            self._levels[game.id] = level
+            self._occupied |= 1 << level
+
+    def discard(self, game_id: str) -> None:
+        """Drop a game from the index."""
+        level = self._levels.get(game_id)
+        if level is not None:
+            self._remove(game_id, level)
+
+    def find(self, policy: JoinPolicy | None = None) -> HangmanGame | None:
+        """Get the game a late joiner should be placed in, if any."""
+        policy = policy or self._policy
+        while self._occupied:
+            if policy == JoinPolicy.FILL:
+                level = self._occupied.bit_length() - 1
+            else:
+                level = (self._occupied & -self._occupied).bit_length() - 1
+            game = next(iter(self._buckets[level].values()))
+            if game.status == GameStatus.PLAYING and game.player_count == level:
+                return game
+            self.update(game)
+        return None
+
+    def _remove(self, game_id: str, level: int) -> None:
+        bucket = self._buckets[level]
+        del bucket[game_id]
+        del self._levels[game_id]
+        if not bucket:
+            self._occupied &= ~(1 << level)
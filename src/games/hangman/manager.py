@@ -1,31 +1,110 @@
-from config import MAX_ATTEMPTS_PER_WORD, MAX_PLAYERS_PER_GAME, TOTAL_STATIONS
+from dataclasses import dataclass
+
+from config import (
+    HANGMAN_GAME_POOL_SIZE,
+    HANGMAN_JOIN_POLICY,
+    MAX_ATTEMPTS_PER_WORD,
+    MAX_PLAYERS_PER_GAME,
+    TOTAL_STATIONS,
+)
 from models.base import GameStatus
 from services.word_bank import get_word_bank
+from .joinable import JoinableGames, JoinPolicy
+from .messages import CorrectGuessMessage, StationUpdateMessage, WrongGuessMessage
 from .models import HangmanGame, HangmanPlayer, Station
+from .pool import GamePool
+
+
+@dataclass(slots=True)
+class GuessResult:
+    """Outcome of one guess.
+
+    When error is set the guess was rejected and no other field applies.
+    word is only set once the station is complete or failed.
+    """
+
+    letter: str = ""
+    correct: bool = False
+    revealed: str = ""
+    attempts_left: int = 0
+    station_complete: bool = False
+    station_failed: bool = False
+    game_won: bool = False
+    word: str = ""
+    error: str | None = None
+
+    def to_message(self) -> CorrectGuessMessage | WrongGuessMessage:
+        """The message telling the guesser whether the letter was right."""
+        if self.correct:
+            return CorrectGuessMessage(letter=self.letter, revealed=self.revealed)
+        return WrongGuessMessage(letter=self.letter, attempts_left=self.attempts_left)
+
+
+@dataclass(slots=True)
+class GuessBatchResult:
+    """Outcome of a guess batch.
+
+    guesses lists the applied letters as {"letter", "correct"}; result is
+    the outcome of the last one, or the rejection of the first letter.
+    """
+
+    guesses: list[dict[str, str | bool]]
+    result: GuessResult
+
+    @property
+    def error(self) -> str | None:
+        return None if self.guesses else self.result.error
 
 
 class HangmanGameManager:
     """Manages Hangman game sessions and logic."""
 
-    def __init__(self):
+    def __init__(
+        self,
+        join_policy: JoinPolicy = JoinPolicy(HANGMAN_JOIN_POLICY),
+        pool_size: int = HANGMAN_GAME_POOL_SIZE,
+    ):
         self._games: dict[str, HangmanGame] = {}
+        self._joinable = JoinableGames(MAX_PLAYERS_PER_GAME, join_policy)
+        self._pool = GamePool(self._build_game, pool_size)
 
-    def create_game(self) -> HangmanGame:
-        """Create a new game with random words."""
+    @staticmethod
+    def _build_game() -> HangmanGame:
         word_bank = get_word_bank()
         words = word_bank.select_words(TOTAL_STATIONS)
-        game = HangmanGame.create(words)
+        return HangmanGame.create(words)
+
+    def create_game(self) -> HangmanGame:
+        """Create a new game with random words, taken from the pool if possible.
+
+        Pooled games are not held by the manager until they are taken.
+        """
+        game = self._pool.take()
         self._games[game.id] = game
         return game
 
+    def fill_pool(self) -> None:
+        """Build pooled games until the pool is full."""
+        self._pool.fill()
+
+    def pool_stats(self) -> dict[str, int]:
+        """Get the game pool's size, games ready, and hit and miss counts."""
+        return self._pool.stats()
+
     def get_game(self, game_id: str) -> HangmanGame | None:
         """Get a game by ID."""
         return self._games.get(game_id)
 
+    @property
+    def games(self) -> list[HangmanGame]:
+        """Get every game the manager holds, finished ones included."""
+        return list(self._games.values())
+
     def remove_game(self, game_id: str) -> None:
         """Remove a game from the manager."""
         if game_id in self._games:
             del self._games[game_id]
+        self._joinable.discard(game_id)
 
     def start_game(self, game: HangmanGame) -> None:
         """Start a game and initialize all players."""
@@ -33,6 +112,7 @@ class HangmanGameManager:
 
         for player in game.players.values():
             self._init_player_station(game, player)
+        self._joinable.update(game)
 
     def _init_player_station(self, game: HangmanGame, player: HangmanPlayer) -> None:
         """Initialize a player's current station."""
@@ -41,87 +121,98 @@ class HangmanGameManager:
 
     def process_guess(
         self, game: HangmanGame, player: HangmanPlayer, letter: str
-    ) -> dict:
-        """
-        Process a letter guess from a player.
-
-        Returns a dict with the result:
-        {
-            "correct": bool,
-            "letter": str,
-            "revealed": str,
-            "attempts_left": int,
-            "station_complete": bool,
-            "station_failed": bool,
-            "game_won": bool,
-            "word": str (only if station complete or failed)
-        }
+    ) -> GuessResult:
+        """Process a letter guess from a player.
+
+        Rejected guesses return a GuessResult whose error is set.
         """
         if game.status != GameStatus.PLAYING:
-            return {"error": "Game is not in playing state"}
+            return GuessResult(error="Game is not in playing state")
 
-        if player.station_state is None:
-            return {"error": "Player station not initialized"}
+        station = player.station_state
+        if station is None:
+            return GuessResult(error="Player station not initialized")
 
         letter = letter.upper()
 
-        if not letter.isalpha() or len(letter) != 1:
-            return {"error": "Invalid letter"}
+        if len(letter) != 1 or not letter.isalpha():
+            return GuessResult(error="Invalid letter")
 
-        station = player.station_state
         correct = station.guess(letter)
-
-        result = {
-            "correct": correct,
-            "letter": letter,
-            "revealed": station.revealed,
-            "attempts_left": station.attempts_left,
-            "station_complete": False,
-            "station_failed": False,
-            "game_won": False,
-        }
+        result = GuessResult(letter, correct, station.revealed, station.attempts_left)
 
         if station.is_complete:
-            result["station_complete"] = True
-            result["word"] = station.word
+            result.station_complete = True
+            result.word = station.word
 
             if player.current_station >= TOTAL_STATIONS:
-                result["game_won"] = True
+                result.game_won = True
                 game.status = GameStatus.FINISHED
                 game.winner = player.id
+                self._joinable.discard(game.id)
             else:
                 player.current_station += 1
                 self._init_player_station(game, player)
 
         elif station.is_failed:
-            result["station_failed"] = True
-            result["word"] = station.word
+            result.station_failed = True
+            result.word = station.word
 
             player.current_station = 1
             self._init_player_station(game, player)
 
         return result
 
-    def get_player_station_info(self, player: HangmanPlayer) -> dict:
-        """Get the current station info for a player."""
-        if player.station_state is None:
-            return {}
+    def process_guesses(
+        self, game: HangmanGame, player: HangmanPlayer, letters: list[str]
+    ) -> GuessBatchResult:
+        """Process several guesses from a player in order.
+
+        Stops after the guess that completes or fails the station, since the
+        remaining letters were meant for that word. The batch's result is
+        that of the last applied guess, or the error of the first letter if
+        it could not be applied.
+        """
+        guesses: list[dict[str, str | bool]] = []
+        result: GuessResult | None = None
+
+        for letter in letters:
+            outcome = self.process_guess(game, player, letter)
+            if outcome.error is not None:
+                if not guesses:
+                    result = outcome
+                break
+
+            result = outcome
+            guesses.append({"letter": outcome.letter, "correct": outcome.correct})
+            if result.station_complete or result.station_failed:
+                break
+
+        return GuessBatchResult(guesses, result or GuessResult(error="Invalid letter"))
 
-        return {
-            "station": player.current_station,
-            "revealed": player.station_state.revealed,
-            "attempts_left": player.station_state.attempts_left,
-        }
+    def station_update(self, player: HangmanPlayer) -> StationUpdateMessage:
+        """Get the station_update message for a player's current station.
+
+        The player's station must have been initialized.
+        """
+        station = player.station_state
+        return StationUpdateMessage(
+            station=player.current_station,
+            revealed=station.revealed,
+            attempts_left=station.attempts_left,
+        )
 
     def find_joinable_game(self) -> HangmanGame | None:
-        """Find an active game in PLAYING status that has room for more players."""
-        for game in self._games.values():
-            if (
-                game.status == GameStatus.PLAYING
-                and game.player_count < MAX_PLAYERS_PER_GAME
-            ):
-                return game
-        return None
+        """Find an active game in PLAYING status that has room for more players.
+
+        The game is picked by the manager's join policy from an index kept
+        up to date as games start, fill up, lose players and finish.
+        """
+        return self._joinable.find()
+
+    def update_joinable(self, game: HangmanGame) -> None:
+        """Re-index a game after its players or status changed."""
+        self._joinable.update(game)
 
     def add_player_to_active_game(
         self, game: HangmanGame, player: HangmanPlayer
@@ -129,6 +220,7 @@ class HangmanGameManager:
         """Add a player to an active game and initialize their station."""
         game.add_player(player)
         self._init_player_station(game, player)
+        self._joinable.update(game)
 
     @property
     def active_games(self) -> list[HangmanGame]:
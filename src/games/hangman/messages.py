@@ -1,13 +1,28 @@
-from typing import Any, Literal
+from typing import Annotated, Any, Literal
 
 from pydantic import BaseModel, Field
 
+from config import GUESS_BATCH_MAX_LETTERS
+
 
 class GuessMessage(BaseModel):
     type: Literal["guess"] = "guess"
     letter: str = Field(..., min_length=1, max_length=1)
 
 
+class GuessBatchMessage(BaseModel):
+    """Several guesses typed before the previous result arrived, in order."""
+
+    type: Literal["guess_batch"] = "guess_batch"
+    letters: list[Annotated[str, Field(min_length=1, max_length=1)]] = Field(
+        ..., min_length=1, max_length=GUESS_BATCH_MAX_LETTERS
+    )
+
+
+class StationResyncMessage(BaseModel):
+    type: Literal["station_resync"] = "station_resync"
+
+
 class ServerMessage(BaseModel):
     """Base class for server messages."""
 
@@ -42,6 +57,21 @@ class WrongGuessMessage(ServerMessage):
     attempts_left: int
 
 
+class GuessBatchResultMessage(ServerMessage):
+    """Combined result of a guess batch.
+
+    guesses lists the applied letters as {"letter", "correct"}. Letters after
+    a completed or failed station were meant for the old word and are not
+    applied. revealed and attempts_left describe the station the guesses were
+    made on.
+    """
+
+    type: Literal["guess_batch_result"] = "guess_batch_result"
+    guesses: list[dict[str, str | bool]]
+    revealed: str
+    attempts_left: int
+
+
 class StationCompleteMessage(ServerMessage):
     type: Literal["station_complete"] = "station_complete"
     station: int
@@ -75,8 +105,21 @@ class GameOverMessage(ServerMessage):
     words: list[str]
 
 
-class StationStatusMessage(ServerMessage):
-    """Broadcast message with player distribution across stations."""
+class StationSnapshotMessage(ServerMessage):
+    """Full player distribution across stations, sent on join and resync."""
+
+    type: Literal["station_snapshot"] = "station_snapshot"
+    seq: int
+    players: list[dict[str, str | int]]
+
+
+class StationDeltaMessage(ServerMessage):
+    """Player moves between stations since the previous sequence number.
+
+    Each move is {"player_id", "from", "to"}; station 0 means the player
+    entered (from) or left (to) the game.
+    """
 
-    type: Literal["station_status"] = "station_status"
-    stations: dict[int, list[str]]
+    type: Literal["station_delta"] = "station_delta"
+    seq: int
+    moves: list[dict[str, str | int]]
@@ -1,30 +1,69 @@
+from collections.abc import Iterable, KeysView
 from dataclasses import dataclass, field
+from functools import lru_cache
 
 from fastapi import WebSocket
 
 from models.base import BaseGame, GameStatus, Player
 
 
-@dataclass
+@lru_cache(maxsize=4096)
+def _word_layout(word: str) -> tuple[str, dict[str, tuple[tuple[int, str], ...]]]:
+    """The fully hidden revealed string of a word, and where each of its
+    upper-case letters goes in that string, shared by its stations."""
+    positions: dict[str, list[tuple[int, str]]] = {}
+    for index, char in enumerate(word):
+        positions.setdefault(char.upper(), []).append((2 * index, char))
+    hidden = " ".join("_" * len(word))
+    return hidden, {letter: tuple(spots) for letter, spots in positions.items()}
+
+
+@dataclass(slots=True)
 class Station:
-    """Represents a player's current station state."""
+    """Represents a player's current station state.
+
+    The positions of each letter of the word are worked out once per word
+    and shared by every station on it. A station keeps its revealed string
+    and a count of the letters it still has to find: a correct guess fills
+    in only its letter's positions, and completion is a comparison with
+    zero.
+    """
 
     word: str
-    guessed_letters: set[str] = field(default_factory=set)
     attempts_left: int = 6
+    _guessed: dict[str, None] = field(default_factory=dict, init=False, repr=False)
+    _positions: dict[str, tuple[tuple[int, str], ...]] = field(
+        init=False, repr=False, compare=False
+    )
+    _remaining: int = field(init=False, repr=False, compare=False)
+    _revealed: str = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        self._revealed, self._positions = _word_layout(self.word)
+        self._remaining = len(self._positions)
+
+    @property
+    def guessed_letters(self) -> KeysView[str]:
+        """Letters guessed so far, right or wrong, as a read-only view."""
+        return self._guessed.keys()
+
+    @guessed_letters.setter
+    def guessed_letters(self, letters: Iterable[str]) -> None:
+        self._guessed = {}
+        self._revealed, _ = _word_layout(self.word)
+        self._remaining = len(self._positions)
+        for letter in letters:
+            self._record(letter.upper())
 
     @property
     def revealed(self) -> str:
         """Return the word with unguessed letters as underscores."""
-        return " ".join(
-            letter if letter.upper() in self.guessed_letters else "_"
-            for letter in self.word
-        )
+        return self._revealed
 
     @property
     def is_complete(self) -> bool:
         """Check if the word has been fully guessed."""
-        return all(letter.upper() in self.guessed_letters for letter in self.word)
+        return self._remaining == 0
 
     @property
     def is_failed(self) -> bool:
@@ -37,19 +76,33 @@ class Station:
         Returns True if the letter is in the word, False otherwise.
         """
         letter = letter.upper()
-        if letter in self.guessed_letters:
+        if letter in self._guessed:
             return True
 
-        self.guessed_letters.add(letter)
-
-        if letter in self.word.upper():
+        if self._record(letter):
             return True
         else:
             self.attempts_left -= 1
             return False
 
+    def _record(self, letter: str) -> bool:
+        """Mark an upper-case letter as guessed; True if it is in the word."""
+        if letter in self._guessed:
+            return letter in self._positions
+        self._guessed[letter] = None
+        spots = self._positions.get(letter)
+        if spots is None:
+            return False
+
+        self._remaining -= 1
+        revealed = list(self._revealed)
+        for index, char in spots:
+            revealed[index] = char
+        self._revealed = "".join(revealed)
+        return True
+
 
-@dataclass
+@dataclass(slots=True)
 class HangmanPlayer(Player):
     """Hangman-specific player with station tracking."""
 
@@ -68,14 +121,14 @@ class HangmanPlayer(Player):
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class HangmanGame(BaseGame):
     """Hangman game with words and stations."""
 
     words: list[str] = field(default_factory=list)
 
     def __init__(self, id: str, words: list[str]):
-        super().__init__(id=id, game_type="hangman")
+        BaseGame.__init__(self, id=id, game_type="hangman")
         self.words = words
 
     @classmethod
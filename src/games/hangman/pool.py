@@ -0,0 +1,101 @@
+"""Pool of pre-built Hangman games, refilled off the game start path."""
+
+import asyncio
+import logging
+import time
+from collections import deque
+from typing import Callable
+
+from config import HANGMAN_GAME_POOL_SIZE
+from services.metrics import Metrics, get_metrics
+
+from .models import HangmanGame
+
+logger = logging.getLogger(__name__)
+
+
+class GamePool:
+    """Keeps up to size new games, words already selected, ready to hand out.
+
+    take() returns a pooled game when one is available (a hit) and builds
+    one on the spot otherwise (a miss). Every take schedules a background
+    refill that builds games one at a time, yielding to the event loop
+    between them, so refilling never delays the join that emptied the pool.
+    A size of 0 disables pooling.
+    """
+
+    def __init__(
+        self,
+        factory: Callable[[], HangmanGame],
+        size: int = HANGMAN_GAME_POOL_SIZE,
+        metrics: Metrics | None = None,
+    ):
+        self._factory = factory
+        self._size = size
+        self._games: deque[HangmanGame] = deque()
+        self._refill_task: asyncio.Task | None = None
+        self._metrics = metrics or get_metrics()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._games)
+
+    @property
+    def size(self) -> int:
+        return self._size
+
+    def take(self) -> HangmanGame:
+        """Get a new game, from the pool if possible."""
+        if self._games:
+            game = self._games.popleft()
+            game.created_at = time.monotonic()
+            self.hits += 1
+            self._metrics.increment("hangman_pool_hits")
+        else:
+            game = self._factory()
+            if self._size:
+                self.misses += 1
+                self._metrics.increment("hangman_pool_misses")
+        self.refill()
+        return game
+
+    def fill(self) -> None:
+        """Build games until the pool is full."""
+        while len(self._games) < self._size:
+            self._games.append(self._factory())
+
+    def refill(self) -> None:
+        """Start refilling the pool in the background, if it is not full.
+
+        Does nothing outside a running event loop; take() still works, it
+        just misses until the pool is filled.
+        """
+        if len(self._games) >= self._size:
+            return
+        if self._refill_task is not None and not self._refill_task.done():
+            return
+        try:
+            self._refill_task = asyncio.get_running_loop().create_task(
+                self._refill()
+            )
+        except RuntimeError:
+            pass
+
+    async def _refill(self) -> None:
+        while len(self._games) < self._size:
+            await asyncio.sleep(0)
+            try:
+                self._games.append(self._factory())
+            except Exception as e:
+                logger.error(f"Building a pooled game failed: {e}", exc_info=True)
+                return
+
+    def stats(self) -> dict[str, int]:
+        """Pool size, games ready, and hit and miss counts."""
+        return {
+            "size": self._size,
+            "available": len(self._games),
+            "hits": self.hits,
+            "misses": self.misses,
+        }
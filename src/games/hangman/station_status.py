@@ -0,0 +1,57 @@
+"""Sequence-numbered tracking of player positions across stations."""
+
+from .models import HangmanGame
+
+STATION_NONE = 0
+
+
+class StationTracker:
+    """Station positions as last broadcast to a game's players.
+
+    Clients hold a copy of these positions built from a snapshot and the
+    deltas that follow it. Each non-empty delta increments seq, so a client
+    that sees a gap in sequence numbers knows to request a resync.
+    """
+
+    def __init__(self, game: HangmanGame):
+        self.seq = 0
+        self._positions: dict[str, int] = self._current_positions(game)
+
+    @staticmethod
+    def _current_positions(game: HangmanGame) -> dict[str, int]:
+        return {player.id: player.current_station for player in game.connected_players}
+
+    def advance(self, game: HangmanGame) -> list[dict[str, str | int]]:
+        """Compute the moves since the last advance and record them.
+
+        Returns:
+            The list of {"player_id", "from", "to"} moves; empty if nothing
+            changed, in which case seq is not incremented.
+        """
+        current = self._current_positions(game)
+        moves: list[dict[str, str | int]] = []
+
+        for player_id, station in current.items():
+            previous = self._positions.get(player_id, STATION_NONE)
+            if previous != station:
+                moves.append({"player_id": player_id, "from": previous, "to": station})
+
+        for player_id, previous in self._positions.items():
+            if player_id not in current:
+                moves.append(
+                    {"player_id": player_id, "from": previous, "to": STATION_NONE}
+                )
+
+        self._positions = current
+        if moves:
+            self.seq += 1
+        return moves
+
+    def snapshot(self, game: HangmanGame) -> list[dict[str, str | int]]:
+        """Get the recorded positions, with player names, as of seq."""
+        players = []
+        for player_id, station in self._positions.items():
+            player = game.get_player(player_id)
+            if player is not None:
+                players.append({"id": player_id, "name": player.name, "station": station})
+        return players
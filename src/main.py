@@ -1,5 +1,6 @@
 """FastAPI application entry point."""
 
+from contextlib import asynccontextmanager
 from pathlib import Path
 
 import uvicorn
@@ -8,12 +9,43 @@ from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import FileResponse
 from fastapi.staticfiles import StaticFiles
 
+from config import SHARD_COUNT
+from games.hangman.manager import get_hangman_manager
+from services.codec import compression_stats
+from services.lifecycle import get_game_lifecycle
+from services.metrics import get_metrics
+from sharding.front import get_front
+from sharding.shard import start_shard_processes, stop_shard_processes
 from websocket.handler import get_ws_handler
 
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Stop the WebSocket handler's background tasks when the app shuts down.
+
+    With shards configured, start the shard processes and the front layer
+    that relays sockets to them instead.
+    """
+    if SHARD_COUNT:
+        processes = start_shard_processes(SHARD_COUNT)
+        front = get_front()
+        try:
+            await front.start()
+            yield
+            await front.close()
+        finally:
+            stop_shard_processes(processes)
+        return
+
+    yield
+    await get_ws_handler().close()
+
+
 app = FastAPI(
     title="Multi-Game Platform",
     description="Multiplayer gaming platform featuring Hangman and Arcane Duels",
     version="0.2.0",
+    lifespan=lifespan,
 )
 
 STATIC_DIR = Path(__file__).parent / "static"
@@ -33,12 +65,27 @@ async def health_check():
     return {"status": "ok", "games": ["hangman", "duels"]}
 
 
+@app.get("/metrics")
+async def metrics():
+    """Server performance counters."""
+    metrics = get_metrics()
+    return {
+        **metrics.snapshot(),
+        "compression": compression_stats(metrics),
+        "games": get_game_lifecycle().stats(),
+        "hangman_pool": get_hangman_manager().pool_stats(),
+    }
+
+
 app.mount("/assets", StaticFiles(directory=STATIC_DIR / "assets"), name="assets")
 
 
 @app.websocket("/ws")
 async def websocket_endpoint(websocket: WebSocket):
     """WebSocket endpoint for game connections."""
+    if SHARD_COUNT:
+        await get_front().handle_connection(websocket)
+        return
     handler = get_ws_handler()
     await handler.handle_connection(websocket)
 
@@ -1,11 +1,15 @@
 from .base import Player, BaseGame, GameStatus
 from .messages import (
-    ClientMessage,
     JoinMessage,
     LeaveMessage,
+    PongMessage,
+    ResumeMessage,
     ServerMessage,
     JoinedMessage,
+    ResumedMessage,
+    ResumeFailedMessage,
     WaitingMessage,
+    PingMessage,
     ErrorMessage,
 )
 
@@ -13,11 +17,15 @@ __all__ = [
     "Player",
     "BaseGame",
     "GameStatus",
-    "ClientMessage",
     "JoinMessage",
     "LeaveMessage",
+    "PongMessage",
+    "ResumeMessage",
     "ServerMessage",
     "JoinedMessage",
+    "ResumedMessage",
+    "ResumeFailedMessage",
     "WaitingMessage",
+    "PingMessage",
     "ErrorMessage",
 ]
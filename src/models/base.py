@@ -1,8 +1,8 @@
 """Base models for shared game functionality."""
 
 from dataclasses import dataclass, field
-from datetime import datetime
 from enum import Enum
+import time
 import uuid
 
 from fastapi import WebSocket
@@ -15,7 +15,7 @@ class GameStatus(str, Enum):
     FINISHED = "finished"
 
 
-@dataclass
+@dataclass(slots=True)
 class Player:
     """Base class for a player in any game."""
     id: str
@@ -33,7 +33,7 @@ class Player:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class BaseGame:
     """Base class for all game types."""
     id: str
@@ -41,7 +41,7 @@ class BaseGame:
     status: GameStatus = GameStatus.WAITING
     players: dict[str, Player] = field(default_factory=dict)
     winner: str | None = None
-    created_at: datetime = field(default_factory=datetime.now)
+    created_at: float = field(default_factory=time.monotonic)
 
     @classmethod
     def generate_id(cls) -> str:
@@ -69,4 +69,4 @@ class BaseGame:
     @property
     def player_count(self) -> int:
         """Get the number of connected players."""
-        return len(self.connected_players)
+        return sum(1 for p in self.players.values() if p.connected)
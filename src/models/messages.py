@@ -16,23 +16,14 @@ class LeaveMessage(BaseModel):
     type: Literal["leave"] = "leave"
 
 
-class ClientMessage(BaseModel):
-    """Union type for common client messages."""
+class ResumeMessage(BaseModel):
+    type: Literal["resume"] = "resume"
+    token: str = Field(..., min_length=1, max_length=64)
+    last_seq: int = Field(..., ge=0)
 
-    type: str
 
-    @classmethod
-    def parse(cls, data: dict) -> JoinMessage | LeaveMessage | None:
-        """Parse a raw message into the appropriate type."""
-        msg_type = data.get("type")
-        try:
-            if msg_type == "join":
-                return JoinMessage(**data)
-            elif msg_type == "leave":
-                return LeaveMessage(**data)
-        except Exception:
-            return None
-        return None
+class PongMessage(BaseModel):
+    type: Literal["pong"] = "pong"
 
 
 class ServerMessage(BaseModel):
@@ -49,6 +40,24 @@ class JoinedMessage(ServerMessage):
     player_id: str
     game_id: str
     player_name: str
+    resume_token: str = ""
+
+
+class ResumedMessage(ServerMessage):
+    """Sent after the missed frames have been replayed.
+
+    seq is the number of this frame in the session's sequence.
+    """
+
+    type: Literal["resumed"] = "resumed"
+    player_id: str
+    seq: int
+    replayed: int
+
+
+class ResumeFailedMessage(ServerMessage):
+    type: Literal["resume_failed"] = "resume_failed"
+    message: str
 
 
 class WaitingMessage(ServerMessage):
@@ -57,6 +66,10 @@ class WaitingMessage(ServerMessage):
     message: str
 
 
+class PingMessage(ServerMessage):
+    type: Literal["ping"] = "ping"
+
+
 class ErrorMessage(ServerMessage):
     type: Literal["error"] = "error"
     message: str
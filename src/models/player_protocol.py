@@ -13,6 +13,15 @@ class MessageReceiver(Protocol):
         ...
 
 
+@runtime_checkable
+class MessageSender(Protocol):
+    """Protocol for entities that deliver messages to players by ID."""
+
+    async def send_to_player(self, player_id: str, message: ServerMessage) -> None:
+        """Queue a message for delivery to a player."""
+        ...
+
+
 @runtime_checkable
 class PlayerIdentity(Protocol):
     """Protocol for core player identity."""
@@ -4,6 +4,8 @@ from dataclasses import dataclass
 from fastapi import WebSocket
 from models.base import Player
 from models.messages import ServerMessage
+from models.player_protocol import MessageSender
+from services.codec import JSON_CODEC, Codec
 
 
 @dataclass
@@ -12,6 +14,8 @@ class HumanPlayerWrapper:
 
     player: Player
     websocket: WebSocket
+    sender: MessageSender | None = None
+    codec: Codec = JSON_CODEC
 
     @property
     def id(self) -> str:
@@ -26,16 +30,26 @@ class HumanPlayerWrapper:
         return self.player.connected
 
     async def send_message(self, message: ServerMessage) -> None:
-        """Send message via WebSocket."""
-        if not self.websocket or not self.connected:
+        """Send message via the sender's outbound queue, or the WebSocket."""
+        if not self.connected:
             return
-        
+
+        if self.sender is not None:
+            await self.sender.send_to_player(self.id, message)
+            return
+
+        if not self.websocket:
+            return
+
         if self.websocket.client_state.name != "CONNECTED":
             return
 
         try:
-            import json
-            await self.websocket.send_text(json.dumps(message.to_dict()))
+            data = self.codec.encode(message.to_dict())
+            if self.codec.binary:
+                await self.websocket.send_bytes(data)
+            else:
+                await self.websocket.send_text(data)
         except Exception:
             pass
 
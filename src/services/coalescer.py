@@ -0,0 +1,90 @@
+"""Per-key coalescing of bursts of updates into one call per time window."""
+
+import asyncio
+import logging
+from typing import Awaitable, Callable
+
+from services.metrics import get_metrics
+
+logger = logging.getLogger(__name__)
+
+
+class Coalescer:
+    """Merges calls scheduled for the same key within a time window.
+
+    The first schedule() for a key starts a timer; further schedules for
+    that key before the timer fires are merged into it. When the window
+    elapses the most recently scheduled callback runs once, so it should
+    read the latest state rather than capture it.
+
+    With leading set, the first schedule() runs its callback right away
+    instead and opens the window. Schedules within the window are merged
+    into one call when it closes, which opens the next window; a window
+    with no schedules ends the run, so a key never gets more than one
+    call per window.
+    """
+
+    def __init__(
+        self, window_seconds: float, name: str = "coalescer", leading: bool = False
+    ):
+        self._window = window_seconds
+        self._name = name
+        self._leading = leading
+        self._tasks: dict[str, asyncio.Task] = {}
+        self._callbacks: dict[str, Callable[[], Awaitable[None]]] = {}
+        self._metrics = get_metrics()
+
+    def schedule(self, key: str, callback: Callable[[], Awaitable[None]]) -> None:
+        """Schedule a callback for a key, merging it with any pending one."""
+        if key in self._callbacks:
+            self._metrics.increment(f"{self._name}_coalesced")
+        if key in self._tasks:
+            self._callbacks[key] = callback
+        elif self._leading:
+            self._tasks[key] = asyncio.create_task(self._fire_leading(key, callback))
+        else:
+            self._callbacks[key] = callback
+            self._tasks[key] = asyncio.create_task(self._fire_after_window(key))
+
+    def cancel(self, key: str) -> None:
+        """Drop any pending callback for a key without running it."""
+        task = self._tasks.pop(key, None)
+        self._callbacks.pop(key, None)
+        if task is not None:
+            task.cancel()
+
+    def is_pending(self, key: str) -> bool:
+        """Check whether a call is pending, or a window is open, for a key."""
+        return key in self._tasks
+
+    async def _fire_after_window(self, key: str) -> None:
+        await asyncio.sleep(self._window)
+        self._tasks.pop(key, None)
+        callback = self._callbacks.pop(key, None)
+        if callback is not None:
+            await self._fire(key, callback)
+
+    async def _fire_leading(
+        self, key: str, callback: Callable[[], Awaitable[None]]
+    ) -> None:
+        try:
+            while callback is not None:
+                # Schedules made before the task first ran need no call of their own
+                callback = self._callbacks.pop(key, callback)
+                await self._fire(key, callback)
+                await asyncio.sleep(self._window)
+                callback = self._callbacks.pop(key, None)
+        finally:
+            if self._tasks.get(key) is asyncio.current_task():
+                del self._tasks[key]
+
+    async def _fire(self, key: str, callback: Callable[[], Awaitable[None]]) -> None:
+        self._metrics.increment(f"{self._name}_flushed")
+        try:
+            await callback()
+        except Exception as e:
+            logger.error(
+                f"Coalesced callback failed: {e}",
+                extra={"coalescer": self._name, "key": key},
+                exc_info=True,
+            )
@@ -0,0 +1,214 @@
+"""Wire codecs for WebSocket frames, negotiated through the subprotocol header.
+
+Clients pick a codec by subprotocol name. Appending "+deflate" to a codec
+name (e.g. "quodpot.msgpack+deflate") opts the connection into compression
+of large frames.
+"""
+
+import json
+import time
+import zlib
+from abc import ABC, abstractmethod
+from typing import Any
+
+from config import (
+    WS_COMPRESSION_ENABLED,
+    WS_COMPRESSION_LEVEL,
+    WS_COMPRESSION_THRESHOLD_BYTES,
+)
+from services.metrics import Metrics, get_metrics
+
+try:
+    import msgpack
+except ImportError:  # pragma: no cover - optional dependency
+    msgpack = None
+
+
+class CodecError(ValueError):
+    """Raised when a frame cannot be decoded."""
+
+
+class Codec(ABC):
+    """Encodes outbound payloads and decodes inbound frames."""
+
+    name: str
+    binary: bool
+
+    @abstractmethod
+    def encode(self, data: dict[str, Any]) -> str | bytes:
+        """Encode a payload into frame data."""
+
+    @abstractmethod
+    def decode(self, raw: str | bytes) -> Any:
+        """Decode frame data into a payload."""
+
+
+class JsonCodec(Codec):
+    """Text JSON frames, the default for every client."""
+
+    name = "quodpot.json"
+    binary = False
+
+    def encode(self, data: dict[str, Any]) -> str:
+        return json.dumps(data)
+
+    def decode(self, raw: str | bytes) -> Any:
+        try:
+            return json.loads(raw)
+        except (json.JSONDecodeError, UnicodeDecodeError) as e:
+            raise CodecError("Invalid JSON") from e
+
+
+class MsgPackCodec(Codec):
+    """Binary MessagePack frames for bandwidth and CPU constrained clients."""
+
+    name = "quodpot.msgpack"
+    binary = True
+
+    def encode(self, data: dict[str, Any]) -> bytes:
+        return msgpack.packb(data, use_bin_type=True)
+
+    def decode(self, raw: str | bytes) -> Any:
+        if isinstance(raw, str):
+            raise CodecError("Expected a binary MessagePack frame")
+        try:
+            return msgpack.unpackb(raw, raw=False, strict_map_key=False)
+        except (ValueError, msgpack.UnpackException) as e:
+            raise CodecError("Invalid MessagePack") from e
+
+
+DEFLATE_SUFFIX = "+deflate"
+FLAG_RAW = 0x00
+FLAG_DEFLATE = 0x01
+MAX_INFLATED_BYTES = 1 << 20
+
+_COMPRESS_PREFIXES = {
+    "frames": "ws_compress_frames_",
+    "bytes_in": "ws_compress_bytes_in_",
+    "bytes_out": "ws_compress_bytes_out_",
+    "cpu_us": "ws_compress_cpu_us_",
+}
+
+
+class DeflateCodec(Codec):
+    """Wraps another codec and deflates frames above a size threshold.
+
+    Every frame is binary and starts with a one-byte flag: FLAG_RAW for a
+    plain inner encoding, FLAG_DEFLATE for a zlib stream. Small frames are
+    left raw because deflate costs more CPU than it saves bytes on them.
+    Bytes in and out and CPU time are recorded per message type.
+    """
+
+    binary = True
+
+    def __init__(
+        self,
+        inner: Codec,
+        threshold: int = WS_COMPRESSION_THRESHOLD_BYTES,
+        level: int = WS_COMPRESSION_LEVEL,
+        metrics: Metrics | None = None,
+    ):
+        self.inner = inner
+        self.name = inner.name + DEFLATE_SUFFIX
+        self.threshold = threshold
+        self.level = level
+        self._metrics = metrics
+
+    def encode(self, data: dict[str, Any]) -> bytes:
+        raw = self.inner.encode(data)
+        if isinstance(raw, str):
+            raw = raw.encode()
+        if len(raw) < self.threshold:
+            return bytes((FLAG_RAW,)) + raw
+
+        started = time.perf_counter()
+        compressed = zlib.compress(raw, self.level)
+        elapsed_us = int((time.perf_counter() - started) * 1_000_000)
+
+        metrics = self._metrics or get_metrics()
+        message_type = data.get("type", "unknown")
+        metrics.increment(_COMPRESS_PREFIXES["frames"] + message_type)
+        metrics.increment(_COMPRESS_PREFIXES["bytes_in"] + message_type, len(raw))
+        metrics.increment(
+            _COMPRESS_PREFIXES["bytes_out"] + message_type, len(compressed)
+        )
+        metrics.increment(_COMPRESS_PREFIXES["cpu_us"] + message_type, elapsed_us)
+        return bytes((FLAG_DEFLATE,)) + compressed
+
+    def decode(self, raw: str | bytes) -> Any:
+        if isinstance(raw, str) or not raw:
+            raise CodecError("Expected a binary compressed frame")
+
+        flag, body = raw[0], raw[1:]
+        if flag == FLAG_DEFLATE:
+            inflater = zlib.decompressobj()
+            try:
+                body = inflater.decompress(body, MAX_INFLATED_BYTES)
+            except zlib.error as e:
+                raise CodecError("Invalid compressed frame") from e
+            if inflater.unconsumed_tail:
+                raise CodecError("Compressed frame too large")
+        elif flag != FLAG_RAW:
+            raise CodecError("Unknown frame flag")
+        return self.inner.decode(body)
+
+
+def compression_stats(metrics: Metrics) -> dict[str, dict[str, float]]:
+    """Summarize compression counters per message type.
+
+    Returns:
+        {message_type: {frames, bytes_in, bytes_out, ratio, cpu_us}}, where
+        ratio is compressed size over original size.
+    """
+    stats: dict[str, dict[str, float]] = {}
+    for name, value in metrics.snapshot()["counters"].items():
+        for field, prefix in _COMPRESS_PREFIXES.items():
+            if name.startswith(prefix):
+                entry = stats.setdefault(
+                    name[len(prefix):], dict.fromkeys(_COMPRESS_PREFIXES, 0)
+                )
+                entry[field] = value
+                break
+    for entry in stats.values():
+        entry["ratio"] = (
+            entry["bytes_out"] / entry["bytes_in"] if entry["bytes_in"] else 1.0
+        )
+    return stats
+
+
+JSON_CODEC = JsonCodec()
+
+_CODECS: dict[str, Codec] = {JSON_CODEC.name: JSON_CODEC}
+if msgpack is not None:
+    _CODECS[MsgPackCodec.name] = MsgPackCodec()
+if WS_COMPRESSION_ENABLED:
+    for _codec in list(_CODECS.values()):
+        _CODECS[_codec.name + DEFLATE_SUFFIX] = DeflateCodec(_codec)
+
+
+def available_codecs() -> list[str]:
+    """Get the subprotocol names of every codec this server supports."""
+    return list(_CODECS)
+
+
+def get_codec(name: str) -> Codec | None:
+    """Get a codec by its subprotocol name."""
+    return _CODECS.get(name)
+
+
+def negotiate_codec(requested: list[str]) -> tuple[Codec, str | None]:
+    """Pick a codec from the client's requested subprotocols.
+
+    Args:
+        requested: Subprotocols offered by the client, in preference order
+
+    Returns:
+        (codec, subprotocol) where subprotocol is the name to echo in the
+        handshake, or None when the client did not ask for a known codec and
+        the JSON default is used.
+    """
+    for name in requested:
+        codec = _CODECS.get(name)
+        if codec is not None:
+            return codec, name
+    return JSON_CODEC, None
@@ -0,0 +1,163 @@
+"""Eviction of finished and abandoned games."""
+
+import asyncio
+import logging
+import time
+from dataclasses import dataclass
+from typing import Callable, Iterable
+
+from config import GAME_SWEEP_INTERVAL_SECONDS, GAME_TTL_SECONDS
+from models.base import BaseGame, GameStatus
+from services.metrics import Metrics, get_metrics
+
+logger = logging.getLogger(__name__)
+
+SWEEP_BATCH_SIZE = 1000
+
+
+@dataclass
+class TrackedGameType:
+    """How to list, remove and clean up after the games of one type."""
+
+    games: Callable[[], Iterable[BaseGame]]
+    remove_game: Callable[[str], None]
+    on_evict: Callable[[BaseGame], None] | None = None
+    evicted: int = 0
+
+
+class GameLifecycle:
+    """Evicts games that are over once they have been over for ttl seconds.
+
+    A game is over when it has finished or every player has left it. A
+    single task sweeps every tracked game once per interval, yielding to the
+    event loop every batch_size games. Evicting a game removes it from its
+    manager and calls the game type's on_evict hook, which drops the
+    player records kept elsewhere, so everything goes in the same pass.
+    """
+
+    def __init__(
+        self,
+        ttl: float = GAME_TTL_SECONDS,
+        interval: float = GAME_SWEEP_INTERVAL_SECONDS,
+        batch_size: int = SWEEP_BATCH_SIZE,
+        clock: Callable[[], float] = time.monotonic,
+        metrics: Metrics | None = None,
+    ):
+        self._ttl = ttl
+        self._interval = interval
+        self._batch_size = batch_size
+        self._clock = clock
+        self._metrics = metrics or get_metrics()
+        self._tracked: dict[str, TrackedGameType] = {}
+        self._over_since: dict[tuple[str, str], float] = {}
+        self._task: asyncio.Task | None = None
+
+    def track(
+        self,
+        game_type: str,
+        games: Callable[[], Iterable[BaseGame]],
+        remove_game: Callable[[str], None],
+        on_evict: Callable[[BaseGame], None] | None = None,
+    ) -> None:
+        """Sweep the games of a type, replacing any previous registration."""
+        previous = self._tracked.get(game_type)
+        self._tracked[game_type] = TrackedGameType(
+            games, remove_game, on_evict, previous.evicted if previous else 0
+        )
+
+    @property
+    def running(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    def start(self) -> None:
+        """Start the sweep task if it is not already running."""
+        if not self.running:
+            self._task = asyncio.create_task(self._run())
+
+    def stop(self) -> None:
+        """Stop the sweep task."""
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+
+    def stats(self) -> dict[str, dict[str, int]]:
+        """Live and evicted game counts per game type."""
+        return {
+            game_type: {
+                "live": sum(1 for _ in tracked.games()),
+                "evicted": tracked.evicted,
+            }
+            for game_type, tracked in self._tracked.items()
+        }
+
+    async def _run(self) -> None:
+        while True:
+            await asyncio.sleep(self._interval)
+            try:
+                await self.sweep()
+            except Exception as e:
+                logger.error(f"Game sweep failed: {e}", exc_info=True)
+
+    async def sweep(self, now: float | None = None) -> int:
+        """Evict the games that have been over for at least ttl seconds.
+
+        Returns:
+            Number of games evicted
+        """
+        now = self._clock() if now is None else now
+        over_since: dict[tuple[str, str], float] = {}
+        evicted = 0
+        seen = 0
+
+        for game_type, tracked in self._tracked.items():
+            for game in list(tracked.games()):
+                seen += 1
+                if seen % self._batch_size == 0:
+                    await asyncio.sleep(0)
+                if not self._is_over(game):
+                    continue
+
+                key = (game_type, game.id)
+                since = self._over_since.get(key, now)
+                if now - since < self._ttl:
+                    over_since[key] = since
+                    continue
+
+                self._evict(game_type, tracked, game)
+                evicted += 1
+
+        self._over_since = over_since
+        if evicted:
+            self._metrics.increment("games_evicted", evicted)
+            logger.info(f"Evicted {evicted} finished or abandoned games")
+        return evicted
+
+    @staticmethod
+    def _is_over(game: BaseGame) -> bool:
+        return game.status == GameStatus.FINISHED or game.player_count == 0
+
+    def _evict(
+        self, game_type: str, tracked: TrackedGameType, game: BaseGame
+    ) -> None:
+        tracked.remove_game(game.id)
+        tracked.evicted += 1
+        if tracked.on_evict is not None:
+            try:
+                tracked.on_evict(game)
+            except Exception as e:
+                logger.error(
+                    f"Cleanup after evicting game failed: {e}",
+                    extra={"game_id": game.id, "game_type": game_type},
+                    exc_info=True,
+                )
+
+
+_game_lifecycle: GameLifecycle | None = None
+
+
+def get_game_lifecycle() -> GameLifecycle:
+    """Get the global game lifecycle instance."""
+    global _game_lifecycle
+    if _game_lifecycle is None:
+        _game_lifecycle = GameLifecycle()
+    return _game_lifecycle
@@ -1,9 +1,12 @@
 """Matchmaking service for player queue management with multi-game support."""
 
 import asyncio
+import logging
+from collections import OrderedDict
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Awaitable, Callable
+from itertools import islice
+from typing import Awaitable, Callable, Iterator
 
 from config import (
     MATCHMAKING_TIMEOUT_SECONDS,
@@ -12,6 +15,8 @@ from config import (
 )
 from models.base import BaseGame, GameStatus, Player
 
+logger = logging.getLogger(__name__)
+
 
 @dataclass
 class QueuedPlayer:
@@ -22,6 +27,49 @@ class QueuedPlayer:
     joined_at: datetime = field(default_factory=datetime.now)
 
 
+class PlayerQueue:
+    """Players waiting for a game type, in arrival order, indexed by player ID.
+
+    Membership tests, removal and appending are O(1), and taking the first
+    n players is O(n), so join and leave storms stay linear.
+    """
+
+    __slots__ = ("_entries",)
+
+    def __init__(self):
+        self._entries: OrderedDict[str, QueuedPlayer] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, player_id: str) -> bool:
+        return player_id in self._entries
+
+    def __iter__(self) -> Iterator[QueuedPlayer]:
+        return iter(self._entries.values())
+
+    def append(self, queued: QueuedPlayer) -> bool:
+        """Add a player at the back, unless already queued.
+
+        Returns:
+            True if the player was added
+        """
+        player_id = queued.player.id
+        if player_id in self._entries:
+            return False
+        self._entries[player_id] = queued
+        return True
+
+    def remove(self, player_id: str) -> QueuedPlayer | None:
+        """Remove a player, wherever they are in the queue."""
+        return self._entries.pop(player_id, None)
+
+    def pop_front(self, count: int) -> list[QueuedPlayer]:
+        """Remove and return up to count players from the front."""
+        count = min(count, len(self._entries))
+        return [self._entries.popitem(last=False)[1] for _ in range(count)]
+
+
 @dataclass
 class GameTypeConfig:
     """Configuration for a specific game type."""
@@ -30,19 +78,22 @@ class GameTypeConfig:
     max_players: int
     timeout_seconds: int
     game_creator: Callable[[], BaseGame]
+    tick_seconds: float | None = None
 
 
 class Matchmaking:
     """Manages the matchmaking queue and game creation for multiple game types."""
 
     def __init__(self):
-        self._queues: dict[str, list[QueuedPlayer]] = {}
+        self._queues: dict[str, PlayerQueue] = {}
         self._player_games: dict[str, str] = {}
         self._player_types: dict[str, str] = {}
         self._timeout_tasks: dict[str, asyncio.Task] = {}
+        self._tick_tasks: dict[str, asyncio.Task] = {}
         self._callbacks: dict[str, Callable[[BaseGame], Awaitable[None]]] = {}
         self._configs: dict[str, GameTypeConfig] = {}
         self._joinable_game_finders: dict[str, Callable[[], BaseGame | None]] = {}
+        self._queue_listeners: list[Callable[[str, int], None]] = []
 
     def register_game_type(
         self,
@@ -53,19 +104,58 @@ class Matchmaking:
         game_creator: Callable[[], BaseGame],
         on_game_start: Callable[[BaseGame], Awaitable[None]],
         joinable_game_finder: Callable[[], BaseGame | None] | None = None,
+        tick_seconds: float | None = None,
     ) -> None:
-        """Register a new game type with its configuration."""
+        """Register a new game type with its configuration.
+
+        With tick_seconds set, the game type is matched in batches: joins
+        through enqueue_player or add_player never start a game (add_player
+        may still late-join an active one), and every tick_seconds the whole
+        queue is split into games at once (see start_ready_games). Otherwise
+        a game starts as soon as a join fills one.
+        """
         self._configs[game_type] = GameTypeConfig(
             min_players=min_players,
             max_players=max_players,
             timeout_seconds=timeout_seconds,
             game_creator=game_creator,
+            tick_seconds=tick_seconds,
         )
         self._callbacks[game_type] = on_game_start
-        self._queues[game_type] = []
+        self._queues[game_type] = PlayerQueue()
         if joinable_game_finder:
             self._joinable_game_finders[game_type] = joinable_game_finder
 
+    def add_queue_listener(self, listener: Callable[[str, int], None]) -> None:
+        """Call listener with (game_type, queue size) whenever a queue changes.
+
+        Listeners are also called after every join (see report_join) and
+        once a game started from the queue is running.
+        """
+        self._queue_listeners.append(listener)
+
+    def report_join(self, game_type: str) -> None:
+        """Tell queue listeners about a join.
+
+        Late joins and PvE games fill a seat without changing the queue,
+        but listeners still need to see the join.
+        """
+        if game_type in self._queues:
+            self._queue_changed(game_type)
+
+    def joinable_seats(self, game_type: str) -> int:
+        """Free seats in the active game a player of a type would late-join."""
+        finder = self._joinable_game_finders.get(game_type)
+        game = finder() if finder is not None else None
+        if game is None:
+            return 0
+        return max(self._configs[game_type].max_players - game.player_count, 0)
+
+    def _queue_changed(self, game_type: str) -> None:
+        size = len(self._queues[game_type])
+        for listener in self._queue_listeners:
+            listener(game_type, size)
+
     def try_join_active_game(self, player: Player, game_type: str) -> BaseGame | None:
         """Try to place a player directly into an active game."""
         finder = self._joinable_game_finders.get(game_type)
@@ -99,7 +189,7 @@ class Matchmaking:
         config = self._configs[game_type]
         queue = self._queues[game_type]
 
-        if any(qp.player.id == player.id for qp in queue):
+        if player.id in queue:
             return None, False
 
         game = self.try_join_active_game(player, game_type)
@@ -109,6 +199,11 @@ class Matchmaking:
         queued = QueuedPlayer(player=player, game_type=game_type)
         queue.append(queued)
         self._player_types[player.id] = game_type
+        self._queue_changed(game_type)
+
+        if config.tick_seconds:
+            self._start_tick(game_type)
+            return None, False
 
         if len(queue) == config.min_players and game_type not in self._timeout_tasks:
             self._timeout_tasks[game_type] = asyncio.create_task(
@@ -135,12 +230,13 @@ class Matchmaking:
             return False
 
         queue = self._queues[game_type]
-        if any(qp.player.id == player.id for qp in queue):
+        if not queue.append(QueuedPlayer(player=player, game_type=game_type)):
             return False
 
-        queued = QueuedPlayer(player=player, game_type=game_type)
-        queue.append(queued)
         self._player_types[player.id] = game_type
+        self._queue_changed(game_type)
+        if self._configs[game_type].tick_seconds:
+            self._start_tick(game_type)
         return True
 
     async def try_start_game(self, game_type: str) -> BaseGame | None:
@@ -148,6 +244,7 @@ class Matchmaking:
 
         Pairs with enqueue_player() for games that need manual start control.
         Starts game if queue size >= max_players, or after timeout if >= min_players.
+        Game types matched on a tick never start here.
 
         Returns:
             The game if started, None if still waiting for more players.
@@ -157,6 +254,8 @@ class Matchmaking:
 
         config = self._configs[game_type]
         queue = self._queues[game_type]
+        if config.tick_seconds:
+            return None
 
         if len(queue) == config.min_players and game_type not in self._timeout_tasks:
             self._timeout_tasks[game_type] = asyncio.create_task(
@@ -175,10 +274,11 @@ class Matchmaking:
             return
 
         queue = self._queues[game_type]
-        self._queues[game_type] = [qp for qp in queue if qp.player.id != player_id]
+        if queue.remove(player_id) is not None:
+            self._queue_changed(game_type)
 
         config = self._configs.get(game_type)
-        if config and len(self._queues[game_type]) < config.min_players:
+        if config and len(queue) < config.min_players:
             if game_type in self._timeout_tasks:
                 self._timeout_tasks[game_type].cancel()
                 del self._timeout_tasks[game_type]
@@ -194,12 +294,96 @@ class Matchmaking:
 
         try:
             await asyncio.sleep(config.timeout_seconds)
-            queue = self._queues.get(game_type, [])
-            if len(queue) >= config.min_players:
+            queue = self._queues.get(game_type)
+            if queue is not None and len(queue) >= config.min_players:
                 await self._start_game(game_type)
         except asyncio.CancelledError:
             pass
 
+    def _start_tick(self, game_type: str) -> None:
+        """Start the tick task of a game type if it is not already running."""
+        if game_type not in self._tick_tasks:
+            self._tick_tasks[game_type] = asyncio.create_task(self._tick(game_type))
+
+    async def _tick(self, game_type: str) -> None:
+        """Start the ready games of a type every tick while players queue.
+
+        A failed tick is logged and the next one tries again, so the queue
+        keeps being matched.
+        """
+        config = self._configs[game_type]
+        try:
+            while True:
+                await asyncio.sleep(config.tick_seconds)
+                if not self._queues[game_type]:
+                    return
+                try:
+                    await self.start_ready_games(game_type)
+                except Exception as e:
+                    logger.error(
+                        f"Matchmaking tick failed: {e}",
+                        extra={"game_type": game_type},
+                        exc_info=e,
+                    )
+        except asyncio.CancelledError:
+            pass
+        finally:
+            if self._tick_tasks.get(game_type) is asyncio.current_task():
+                del self._tick_tasks[game_type]
+
+    async def start_ready_games(self, game_type: str) -> list[BaseGame]:
+        """Split the queue of a game type into as many games as it fills.
+
+        Players are grouped max_players at a time in arrival order. The
+        remainder also starts a game once it has min_players and its
+        longest-waiting player has waited timeout_seconds. All games are
+        created before any is started, and the on_game_start callbacks run
+        concurrently, so a large queue costs one pass rather than one
+        start per game. Players leave the queue only once every game has
+        been created, so a failing game_creator leaves them queued.
+
+        Returns:
+            The games started
+        """
+        config = self._configs.get(game_type)
+        if not config:
+            raise ValueError(f"Unknown game type: {game_type}")
+
+        queue = self._queues[game_type]
+        count = len(queue) - len(queue) % config.max_players
+        remainder = len(queue) - count
+        if remainder >= config.min_players:
+            oldest = next(islice(queue, count, None))
+            waited = (datetime.now() - oldest.joined_at).total_seconds()
+            if waited >= config.timeout_seconds:
+                count += remainder
+        if count == 0:
+            return []
+
+        games = [config.game_creator() for _ in range(0, count, config.max_players)]
+        queued = queue.pop_front(count)
+        for index, game in enumerate(games):
+            start = index * config.max_players
+            for entry in queued[start : start + config.max_players]:
+                game.add_player(entry.player)
+                self._player_games[entry.player.id] = game.id
+            game.status = GameStatus.PLAYING
+
+        callback = self._callbacks.get(game_type)
+        if callback:
+            results = await asyncio.gather(
+                *(callback(game) for game in games), return_exceptions=True
+            )
+            for game, result in zip(games, results):
+                if isinstance(result, Exception):
+                    logger.error(
+                        f"Starting game failed: {result}",
+                        extra={"game_id": game.id, "game_type": game_type},
+                        exc_info=result,
+                    )
+        self._queue_changed(game_type)
+        return games
+
     async def _start_game(self, game_type: str) -> BaseGame:
         """Create and start a game with queued players."""
         config = self._configs.get(game_type)
@@ -210,11 +394,8 @@ class Matchmaking:
             self._timeout_tasks[game_type].cancel()
             del self._timeout_tasks[game_type]
 
-        queue = self._queues[game_type]
-        players_to_start = queue[: config.max_players]
-        self._queues[game_type] = queue[config.max_players :]
-
         game = config.game_creator()
+        players_to_start = self._queues[game_type].pop_front(config.max_players)
 
         for queued in players_to_start:
             game.add_player(queued.player)
@@ -223,8 +404,12 @@ class Matchmaking:
         game.status = GameStatus.PLAYING
 
         callback = self._callbacks.get(game_type)
-        if callback:
-            await callback(game)
+        try:
+            if callback:
+                await callback(game)
+        finally:
+            # Reported once the game runs, so listeners see its free seats
+            self._queue_changed(game_type)
 
         return game
 
@@ -243,13 +428,26 @@ class Matchmaking:
         if player_id in self._player_types:
             del self._player_types[player_id]
 
+    def forget_game(self, game: BaseGame) -> None:
+        """Drop the player associations of a game that no longer exists.
+
+        Players who have since queued for another game keep their game type.
+        """
+        for player_id in game.players:
+            if self._player_games.get(player_id) != game.id:
+                continue
+            del self._player_games[player_id]
+            queue = self._queues.get(self._player_types.get(player_id, ""), ())
+            if player_id not in queue:
+                self._player_types.pop(player_id, None)
+
     def get_queue_size(self, game_type: str) -> int:
         """Get the current queue size for a game type."""
-        return len(self._queues.get(game_type, []))
+        return len(self._queues.get(game_type, ()))
 
     def get_queued_players(self, game_type: str) -> list[Player]:
         """Get all players in the queue for a game type."""
-        queue = self._queues.get(game_type, [])
+        queue = self._queues.get(game_type, ())
         return [qp.player for qp in queue]
 
     @property
@@ -0,0 +1,96 @@
+"""In-process counters for server performance metrics."""
+
+import time
+from collections import deque
+from typing import Callable
+
+RATE_WINDOW_SECONDS = 60
+
+
+class _RateWindow:
+    """Per-second buckets of increments over a sliding window."""
+
+    __slots__ = ("_window", "_buckets")
+
+    def __init__(self, window: int):
+        self._window = window
+        self._buckets: deque[list[int]] = deque()
+
+    def add(self, now: float, amount: int) -> None:
+        second = int(now)
+        if self._buckets and self._buckets[-1][0] == second:
+            self._buckets[-1][1] += amount
+        else:
+            self._buckets.append([second, amount])
+        self._prune(second)
+
+    def total(self, now: float) -> int:
+        self._prune(int(now))
+        return sum(count for _, count in self._buckets)
+
+    def _prune(self, second: int) -> None:
+        oldest = second - self._window
+        while self._buckets and self._buckets[0][0] <= oldest:
+            self._buckets.popleft()
+
+
+class Metrics:
+    """Named monotonic counters with per-second rates over a sliding window."""
+
+    def __init__(
+        self,
+        window_seconds: int = RATE_WINDOW_SECONDS,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self._window = window_seconds
+        self._clock = clock
+        self._started = clock()
+        self._counters: dict[str, int] = {}
+        self._rates: dict[str, _RateWindow] = {}
+
+    def increment(self, name: str, amount: int = 1) -> None:
+        """Add amount to a counter."""
+        if amount <= 0:
+            return
+        self._counters[name] = self._counters.get(name, 0) + amount
+        window = self._rates.get(name)
+        if window is None:
+            window = self._rates[name] = _RateWindow(self._window)
+        window.add(self._clock(), amount)
+
+    def value(self, name: str) -> int:
+        """Get the total value of a counter."""
+        return self._counters.get(name, 0)
+
+    def rate(self, name: str) -> float:
+        """Get the per-second rate of a counter over the sliding window."""
+        window = self._rates.get(name)
+        if window is None:
+            return 0.0
+        now = self._clock()
+        span = min(self._window, max(now - self._started, 1.0))
+        return window.total(now) / span
+
+    def snapshot(self) -> dict[str, dict[str, float]]:
+        """Get all counters and their current rates."""
+        return {
+            "counters": dict(self._counters),
+            "rates_per_second": {name: self.rate(name) for name in self._counters},
+        }
+
+    def reset(self) -> None:
+        """Clear every counter."""
+        self._started = self._clock()
+        self._counters.clear()
+        self._rates.clear()
+
+
+_metrics: Metrics | None = None
+
+
+def get_metrics() -> Metrics:
+    """Get the global metrics instance."""
+    global _metrics
+    if _metrics is None:
+        _metrics = Metrics()
+    return _metrics
@@ -0,0 +1,92 @@
+"""Token-bucket rate limiting for client messages."""
+
+import time
+from dataclasses import dataclass
+from enum import Enum
+from typing import Callable
+
+from config import RATE_LIMIT_STRIKE_REFILL_PER_SECOND, RATE_LIMIT_STRIKES, RATE_LIMITS
+
+
+@dataclass(slots=True)
+class TokenBucket:
+    """Holds up to capacity tokens, refilled at rate tokens per second."""
+
+    rate: float
+    capacity: float
+    tokens: float
+    updated: float
+
+    def take(self, now: float, cost: int = 1) -> bool:
+        """Take cost tokens if available."""
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+        if self.tokens < cost:
+            return False
+        self.tokens -= cost
+        return True
+
+
+class RateLimitDecision(str, Enum):
+    """Outcome of a rate limit check."""
+    ALLOW = "allow"
+    DROP = "drop"
+    DISCONNECT = "disconnect"
+
+
+class RateLimiter:
+    """Per-key, per-message-type token buckets with a strike budget.
+
+    Each (key, message type) pair in limits gets its own bucket. A message
+    that finds its bucket empty is dropped and costs a strike; a key that
+    runs out of strikes should be disconnected. Message types without a
+    limit are always allowed.
+    """
+
+    def __init__(
+        self,
+        limits: dict[str, tuple[float, int]] = RATE_LIMITS,
+        strikes: int = RATE_LIMIT_STRIKES,
+        strike_refill: float = RATE_LIMIT_STRIKE_REFILL_PER_SECOND,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self._limits = limits
+        self._strikes = strikes
+        self._strike_refill = strike_refill
+        self._clock = clock
+        self._buckets: dict[tuple[str, str], TokenBucket] = {}
+        self._strike_buckets: dict[str, TokenBucket] = {}
+
+    def check(self, key: str, msg_type: str, cost: int = 1) -> RateLimitDecision:
+        """Charge cost messages of a type to a key's budget.
+
+        Returns:
+            ALLOW if the message may be processed, DROP if it is over budget,
+            DISCONNECT if the key has also run out of strikes
+        """
+        limit = self._limits.get(msg_type)
+        if limit is None:
+            return RateLimitDecision.ALLOW
+
+        now = self._clock()
+        bucket = self._buckets.get((key, msg_type))
+        if bucket is None:
+            rate, burst = limit
+            bucket = self._buckets[(key, msg_type)] = TokenBucket(rate, burst, burst, now)
+        if bucket.take(now, cost):
+            return RateLimitDecision.ALLOW
+
+        strikes = self._strike_buckets.get(key)
+        if strikes is None:
+            strikes = self._strike_buckets[key] = TokenBucket(
+                self._strike_refill, self._strikes, self._strikes, now
+            )
+        if strikes.take(now):
+            return RateLimitDecision.DROP
+        return RateLimitDecision.DISCONNECT
+
+    def forget(self, key: str) -> None:
+        """Drop all buckets for a key."""
+        for msg_type in self._limits:
+            self._buckets.pop((key, msg_type), None)
+        self._strike_buckets.pop(key, None)
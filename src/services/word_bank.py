@@ -1,18 +1,34 @@
 """Word bank service for loading and selecting game words."""
 
 import random
+from collections.abc import Sequence
 from pathlib import Path
 
+from config import WORD_BANK_FILE
+from services.word_index import WordIndex
+from services.word_pack import PackedWords, is_word_pack, normalize_words
+
 
 class WordBank:
-    """Manages the pool of words for the hangman game."""
+    """Manages the pool of words for the hangman game.
+
+    The words file is either a text word list or a compiled word pack
+    (see services.word_pack), which is memory-mapped instead of read. A
+    WordIndex of the words is built the first time words are selected by
+    constraints, so they are not rescanned on every query.
+    """
 
     def __init__(self, words_file: Path | None = None):
         """Initialize the word bank with words from a file."""
         if words_file is None:
-            words_file = Path(__file__).parent.parent / "data" / "words.txt"
+            words_file = (
+                Path(WORD_BANK_FILE)
+                if WORD_BANK_FILE
+                else Path(__file__).parent.parent / "data" / "words.txt"
+            )
 
-        self._words: list[str] = []
+        self._words: Sequence[str] = []
+        self._index: WordIndex | None = None
         self._load_words(words_file)
 
     def _load_words(self, words_file: Path) -> None:
@@ -20,24 +36,40 @@ class WordBank:
         if not words_file.exists():
             raise FileNotFoundError(f"Words file not found: {words_file}")
 
-        with open(words_file, "r", encoding="utf-8") as f:
-            self._words = [
-                line.strip().upper()
-                for line in f
-                if line.strip() and line.strip().isalpha()
-            ]
+        if is_word_pack(words_file):
+            self._words = PackedWords(words_file)
+        else:
+            with open(words_file, "r", encoding="utf-8") as f:
+                self._words = list(normalize_words(f))
 
         if len(self._words) < 10:
             raise ValueError("Words file must contain at least 10 words")
 
-    def select_words(self, count: int = 10) -> list[str]:
-        """Select random words for a game."""
-        if count > len(self._words):
+    def select_words(self, count: int = 10, **constraints) -> list[str]:
+        """Select random words for a game.
+
+        Keyword arguments are WordIndex.positions constraints that every
+        selected word must meet, e.g. min_distinct=5 or avoid="XZ". Only
+        the selected words are read from the word list.
+        """
+        if constraints:
+            positions = self.index.positions(**constraints)
+        else:
+            positions = range(len(self._words))
+        if count > len(positions):
             raise ValueError(
-                f"Cannot select {count} words, only {len(self._words)} available"
+                f"Cannot select {count} words, only {len(positions)} available"
             )
 
-        return random.sample(self._words, count)
+        chosen = random.sample(range(len(positions)), count)
+        return [self._words[int(positions[i])] for i in chosen]
+
+    @property
+    def index(self) -> WordIndex:
+        """Get the letter index of the words, building it on first use."""
+        if self._index is None:
+            self._index = WordIndex(self._words)
+        return self._index
 
     @property
     def total_words(self) -> int:
@@ -0,0 +1,226 @@
+"""Letter-bitmask index over a word list, queryable by constraints."""
+
+from collections.abc import Sequence
+from string import ascii_uppercase
+from typing import Any
+
+from services.word_pack import PackedWords
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - optional dependency
+    np = None
+
+LETTER_BITS = {letter: 1 << i for i, letter in enumerate(ascii_uppercase)}
+ALL_LETTERS = (1 << len(LETTER_BITS)) - 1
+
+
+def letter_mask(letters: str) -> int:
+    """26-bit mask of the letters A to Z that appear in a string.
+
+    Letters outside A to Z set no bit.
+    """
+    mask = 0
+    for letter in letters.upper():
+        mask |= LETTER_BITS.get(letter, 0)
+    return mask
+
+
+def _list_columns(words: Sequence[str]) -> dict[str, list]:
+    """The index columns, computed word by word."""
+    masks = [letter_mask(word) for word in words]
+    total = max(len(words), 1)
+    frequency = [
+        sum(1 for mask in masks if mask & bit) / total for bit in LETTER_BITS.values()
+    ]
+    return {
+        "mask": masks,
+        "distinct": [len(set(word.upper())) for word in words],
+        "length": [len(word) for word in words],
+        "score": [
+            sum(f for i, f in enumerate(frequency) if mask >> i & 1) for mask in masks
+        ],
+    }
+
+
+def _code_points(words: Sequence[str]) -> tuple[Any, Any, Any]:
+    """The upper-cased code points of the words, back to back.
+
+    Returns:
+        The code points, how many of them belong to each word, and each
+        word's length
+    """
+    if isinstance(words, PackedWords):
+        blob = words.blob()
+        # Every byte but UTF-8 continuation bytes (10xxxxxx) starts a character
+        starts = (np.frombuffer(blob, dtype=np.uint8) & 0xC0) != 0x80
+        characters = np.concatenate(([0], np.cumsum(starts)))
+        lengths = np.diff(characters[np.array(words.offsets, dtype=np.intp)])
+        text = blob.decode("utf-8")
+    else:
+        lengths = np.fromiter(map(len, words), dtype=np.intp, count=len(words))
+        text = "".join(words)
+
+    upper = text.upper()
+    spans = lengths
+    if len(upper) != len(text):
+        # A letter upper-cases to several (ß to SS), so split word by word
+        upper_words = [word.upper() for word in words]
+        upper = "".join(upper_words)
+        spans = np.fromiter(map(len, upper_words), dtype=np.intp, count=len(words))
+    return np.frombuffer(upper.encode("utf-32-le"), dtype="<u4"), spans, lengths
+
+
+def _array_columns(words: Sequence[str]) -> dict[str, Any]:
+    """The index columns, computed with NumPy over all the words at once."""
+    codes, spans, lengths = _code_points(words)
+    count = len(lengths)
+    # Code points outside A to Z shift to bit 26 or above, cleared below
+    offsets = codes - np.uint32(ord("A"))
+    flags = np.left_shift(np.uint32(1), np.minimum(offsets, 31))
+    # A trailing zero gives empty words at the end a valid start
+    flags = np.append(flags, np.uint32(0))
+    starts = np.cumsum(spans) - spans
+    masks = np.bitwise_or.reduceat(flags, starts) & np.uint32(ALL_LETTERS)
+    masks[spans == 0] = 0
+
+    total = max(count, 1)
+    distinct = np.zeros(count, dtype=np.intp)
+    scores = np.zeros(count)
+    for bit in range(len(LETTER_BITS)):
+        has_letter = (masks >> bit) & 1
+        distinct += has_letter
+        scores += has_letter * (has_letter.sum() / total)
+
+    # Count the distinct letters outside A to Z as (word, code point) pairs
+    others = offsets >= len(LETTER_BITS)
+    if others.any():
+        owners = np.repeat(np.arange(count), spans)[others]
+        pairs = np.unique((owners << 21) | codes[others])
+        distinct += np.bincount(pairs >> 21, minlength=count)
+
+    return {
+        "mask": masks,
+        "distinct": distinct.astype(np.uint16),
+        "length": lengths.astype(np.uint16),
+        "score": scores,
+    }
+
+
+class WordIndex:
+    """Per-word letter mask, distinct-letter count, length and frequency score.
+
+    The score of a word is the sum, over its distinct letters, of the share
+    of words in the list that contain that letter: high scores mean common
+    letters, so words that are easier to guess. Everything is computed once
+    when the index is built: with NumPy over the code points of all the
+    words at once (a word pack's blob is read whole rather than word by
+    word), or word by word in plain lists when NumPy is not installed (or
+    use_numpy is False). Queries then combine the constraints with
+    vectorized comparisons or list scans, and return word positions, so
+    only the words a caller actually picks need reading.
+    """
+
+    def __init__(self, words: Sequence[str], use_numpy: bool | None = None):
+        if use_numpy is None:
+            use_numpy = np is not None
+        elif use_numpy and np is None:
+            raise RuntimeError("NumPy is not installed")
+
+        self._words = words
+        self._use_numpy = use_numpy
+        self._columns: dict[str, Any] = (
+            _array_columns(words) if use_numpy else _list_columns(words)
+        )
+
+    def __len__(self) -> int:
+        return len(self._words)
+
+    @property
+    def vectorized(self) -> bool:
+        """Whether queries run on NumPy arrays."""
+        return self._use_numpy
+
+    def info(self, position: int) -> dict[str, int | float]:
+        """The indexed values of the word at a position."""
+        return {
+            name: column[position].item() if self._use_numpy else column[position]
+            for name, column in self._columns.items()
+        }
+
+    def positions(
+        self,
+        *,
+        min_distinct: int | None = None,
+        max_distinct: int | None = None,
+        min_length: int | None = None,
+        max_length: int | None = None,
+        min_score: float | None = None,
+        max_score: float | None = None,
+        avoid: str = "",
+        include: str = "",
+    ) -> Sequence[int]:
+        """Positions of the words meeting every given constraint, in order.
+
+        The positions are a NumPy array when the index is vectorized.
+
+        Args:
+            min_distinct, max_distinct: Inclusive bounds on distinct letters
+            min_length, max_length: Inclusive bounds on word length
+            min_score, max_score: Inclusive bounds on the frequency score
+            avoid: Letters none of which may appear in the word
+            include: Letters all of which must appear in the word
+        """
+        bounds = [
+            ("distinct", min_distinct, max_distinct),
+            ("length", min_length, max_length),
+            ("score", min_score, max_score),
+        ]
+        avoid_mask = letter_mask(avoid)
+        include_mask = letter_mask(include)
+
+        if self._use_numpy:
+            return self._positions_numpy(bounds, avoid_mask, include_mask)
+        return self._positions_lists(bounds, avoid_mask, include_mask)
+
+    def query(self, **constraints) -> list[str]:
+        """Words meeting every constraint of positions(), in list order."""
+        return [self._words[i] for i in self.positions(**constraints)]
+
+    def _positions_numpy(
+        self, bounds: list[tuple], avoid_mask: int, include_mask: int
+    ) -> Any:
+        selected = np.ones(len(self._words), dtype=bool)
+        for name, low, high in bounds:
+            column = self._columns[name]
+            if low is not None:
+                selected &= column >= low
+            if high is not None:
+                selected &= column <= high
+
+        masks = self._columns["mask"]
+        if avoid_mask:
+            selected &= (masks & np.uint32(avoid_mask)) == 0
+        if include_mask:
+            selected &= (masks & np.uint32(include_mask)) == include_mask
+        return np.flatnonzero(selected)
+
+    def _positions_lists(
+        self, bounds: list[tuple], avoid_mask: int, include_mask: int
+    ) -> Sequence[int]:
+        positions = range(len(self._words))
+        for name, low, high in bounds:
+            column = self._columns[name]
+            if low is not None:
+                positions = [i for i in positions if column[i] >= low]
+            if high is not None:
+                positions = [i for i in positions if column[i] <= high]
+
+        masks = self._columns["mask"]
+        if avoid_mask:
+            positions = [i for i in positions if not masks[i] & avoid_mask]
+        if include_mask:
+            positions = [
+                i for i in positions if masks[i] & include_mask == include_mask
+            ]
+        return positions
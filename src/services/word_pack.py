@@ -0,0 +1,171 @@
+"""Compiled word lists, memory-mapped so workers share them.
+
+A word pack is a header, an offsets table and a UTF-8 blob:
+
+    magic     4 bytes  b"QPWB"
+    version   uint32   2
+    count     uint32   number of words
+    offsets   uint32 * (count + 1), where word i is blob[offsets[i]:offsets[i + 1]]
+    blob      the words, UTF-8 encoded, back to back, at most 4 GiB
+
+All integers are little-endian. Opening a pack maps the file read-only and
+reads only the header, so it costs the same for ten words or ten million,
+and every process mapping the same file shares its pages. Words are
+decoded one at a time as they are read.
+
+Compile a word list (one word per line) with:
+
+    python -m services.word_pack words.txt words.qwb
+"""
+
+import argparse
+import mmap
+import struct
+import sys
+from array import array
+from collections.abc import Sequence
+from pathlib import Path
+from typing import Iterable, Iterator, overload
+
+MAGIC = b"QPWB"
+VERSION = 2
+HEADER = struct.Struct("<4sII")
+OFFSET = struct.Struct("<I")
+MAX_BLOB_BYTES = 2**32 - 1
+SUFFIX = ".qwb"
+
+
+class WordPackError(ValueError):
+    """Raised when a file is not a valid word pack."""
+
+
+def normalize_words(lines: Iterable[str]) -> Iterator[str]:
+    """The playable words of a word list: stripped, upper-cased, letters only."""
+    for line in lines:
+        word = line.strip()
+        if word and word.isalpha():
+            yield word.upper()
+
+
+def compile_words(words: Iterable[str], target: Path) -> int:
+    """Write words to a word pack.
+
+    Returns:
+        Number of words written
+
+    Raises:
+        WordPackError: If the words take more than 4 GiB
+    """
+    offsets = array("I", [0])
+    blob = bytearray()
+    for word in words:
+        blob += word.encode("utf-8")
+        if len(blob) > MAX_BLOB_BYTES:
+            raise WordPackError("Word list too large for a word pack")
+        offsets.append(len(blob))
+
+    if sys.byteorder == "big":  # pragma: no cover
+        offsets.byteswap()
+
+    count = len(offsets) - 1
+    with open(target, "wb") as f:
+        f.write(HEADER.pack(MAGIC, VERSION, count))
+        f.write(offsets.tobytes())
+        f.write(blob)
+    return count
+
+
+def compile_file(source: Path, target: Path) -> int:
+    """Compile a text word list, one word per line, into a word pack."""
+    with open(source, "r", encoding="utf-8") as f:
+        return compile_words(normalize_words(f), target)
+
+
+class PackedWords(Sequence):
+    """The words of a word pack, read from a read-only memory map."""
+
+    def __init__(self, path: Path):
+        with open(path, "rb") as f:
+            try:
+                self._map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            except ValueError as e:
+                raise WordPackError(f"Empty word pack: {path}") from e
+
+        if len(self._map) < HEADER.size:
+            raise WordPackError(f"Truncated word pack: {path}")
+        magic, version, count = HEADER.unpack_from(self._map)
+        if magic != MAGIC or version != VERSION:
+            raise WordPackError(f"Not a version {VERSION} word pack: {path}")
+
+        self._count = count
+        blob_start = HEADER.size + (count + 1) * OFFSET.size
+        if len(self._map) < blob_start:
+            raise WordPackError(f"Truncated word pack: {path}")
+
+        self._blob_start = blob_start
+        # The offsets are read in place through a view of the map
+        view = memoryview(self._map)[HEADER.size : blob_start]
+        if sys.byteorder == "little":
+            self._offsets: Sequence[int] = view.cast("I")
+        else:  # pragma: no cover
+            self._offsets = array("I", view)
+            self._offsets.byteswap()
+        view.release()
+
+    def __len__(self) -> int:
+        return self._count
+
+    @overload
+    def __getitem__(self, position: int) -> str: ...
+
+    @overload
+    def __getitem__(self, position: slice) -> list[str]: ...
+
+    def __getitem__(self, position: int | slice) -> str | list[str]:
+        if isinstance(position, slice):
+            return [self[i] for i in range(*position.indices(self._count))]
+        if position < 0:
+            position += self._count
+        if not 0 <= position < self._count:
+            raise IndexError("word pack index out of range")
+
+        start = self._blob_start + self._offsets[position]
+        end = self._blob_start + self._offsets[position + 1]
+        return self._map[start:end].decode("utf-8")
+
+    @property
+    def offsets(self) -> Sequence[int]:
+        """Byte offsets of the words in the blob, one more than the words."""
+        return self._offsets
+
+    def blob(self) -> bytes:
+        """A copy of the blob: the UTF-8 encoded words, back to back."""
+        return self._map[self._blob_start :]
+
+    def close(self) -> None:
+        """Unmap the file."""
+        if isinstance(self._offsets, memoryview):
+            self._offsets.release()
+        self._map.close()
+
+
+def is_word_pack(path: Path) -> bool:
+    """Check whether a file starts with the word pack magic."""
+    with open(path, "rb") as f:
+        return f.read(len(MAGIC)) == MAGIC
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(
+        description="Compile a word list into a memory-mappable word pack."
+    )
+    parser.add_argument("source", type=Path, help="Word list, one word per line")
+    parser.add_argument("target", type=Path, help=f"Word pack to write ({SUFFIX})")
+    args = parser.parse_args(argv)
+
+    count = compile_file(args.source, args.target)
+    print(f"Wrote {count} words to {args.target}")
+
+
+if __name__ == "__main__":
+    main()
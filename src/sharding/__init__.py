@@ -0,0 +1,4 @@
+from sharding.front import FrontLayer, ShardPlacement
+from sharding.shard import Shard
+
+__all__ = ["FrontLayer", "ShardPlacement", "Shard"]
@@ -0,0 +1,377 @@
+"""Front layer: terminates client WebSockets and relays them to game shards.
+
+Each client is relayed to one shard at a time. The shard is chosen when the
+client joins a game, or resumes a session, and the client stays there for
+as long as it plays, so every frame about a game reaches the shard that owns
+it. Frames are forwarded as opaque bytes. The front decodes a frame only
+when it could move the client: any frame before the client is bound, and
+afterwards only frames that contain the bytes "join". Guesses and spells
+are never decoded here.
+"""
+
+import asyncio
+import itertools
+import json
+import logging
+from dataclasses import dataclass
+
+from fastapi import WebSocket
+
+from config import (
+    SHARD_BASE_PORT,
+    SHARD_CONNECT_TIMEOUT_SECONDS,
+    SHARD_COUNT,
+    SHARD_HOST,
+    WS_OUTBOUND_MAX_LAG_SECONDS,
+)
+from services.codec import Codec, CodecError, negotiate_codec
+from services.metrics import Metrics, get_metrics
+from sharding.link import (
+    OP_BYTES,
+    OP_CLOSE,
+    OP_EVENT,
+    OP_OPEN,
+    OP_TEXT,
+    LinkError,
+    encode_op,
+    read_op,
+)
+from sharding.shard import TOKEN_SEPARATOR
+from websocket.connection import Connection
+from websocket.frames import EncodedFrame
+
+logger = logging.getLogger(__name__)
+
+WS_CLOSE_INTERNAL_ERROR = 1011
+# Every join frame contains its type literally, in JSON and in MessagePack
+JOIN_MARKER = b"join"
+
+
+def shard_of_token(token: object, shard_count: int) -> int | None:
+    """Get the shard that issued a resume token, if it names a valid one."""
+    if not isinstance(token, str):
+        return None
+    prefix, separator, _ = token.partition(TOKEN_SEPARATOR)
+    if not separator or not prefix.isdigit():
+        return None
+    index = int(prefix)
+    return index if index < shard_count else None
+
+
+class ShardPlacement:
+    """Picks the shard for each new player.
+
+    A player joining a game type goes to the shard whose running game of
+    that type has the most free seats, so late joins land in a game as they
+    do in a single process. Failing that, it goes to the shard with the
+    most players already waiting for that type, so queues fill up in one
+    place; when nobody is waiting, the new game goes to the least-loaded
+    shard. Load is the number of clients relayed to a shard.
+
+    Shards report queue sizes and free seats after every join and queue
+    change. Between reports, joins still in flight are counted locally;
+    the next report replaces those counts, so joins that never queue (late
+    joins, PvE games) do not skew placement for good.
+    """
+
+    def __init__(self, shard_count: int):
+        self._clients = [0] * shard_count
+        self._queued: dict[str, list[int]] = {}
+        self._joinable: dict[str, list[int]] = {}
+
+    @property
+    def loads(self) -> list[int]:
+        """Clients relayed to each shard."""
+        return list(self._clients)
+
+    def least_loaded(self) -> int:
+        return min(range(len(self._clients)), key=self._clients.__getitem__)
+
+    def for_join(self, game_type: str) -> int:
+        """Choose the shard for a player joining a game type."""
+        joinable = self._counts(self._joinable, game_type)
+        shard = max(range(len(joinable)), key=joinable.__getitem__)
+        if joinable[shard] > 0:
+            joinable[shard] -= 1
+            return shard
+
+        queued = self._counts(self._queued, game_type)
+        shard = max(range(len(queued)), key=queued.__getitem__)
+        if queued[shard] == 0:
+            shard = self.least_loaded()
+        queued[shard] += 1
+        return shard
+
+    def queue_changed(
+        self, shard: int, game_type: str, size: int, joinable: int = 0
+    ) -> None:
+        """Record the queue size and free seats reported by a shard."""
+        self._counts(self._queued, game_type)[shard] = size
+        self._counts(self._joinable, game_type)[shard] = joinable
+
+    def _counts(self, counts: dict[str, list[int]], game_type: str) -> list[int]:
+        return counts.setdefault(game_type, [0] * len(self._clients))
+
+    def bound(self, shard: int) -> None:
+        self._clients[shard] += 1
+
+    def unbound(self, shard: int) -> None:
+        self._clients[shard] -= 1
+
+
+@dataclass(eq=False)
+class RelayedClient:
+    """A client socket in the front layer and the shard it is relayed to."""
+
+    conn_id: int
+    subprotocol: str
+    connection: Connection
+    shard: int | None = None
+
+
+class ShardLink:
+    """Link from the front layer to one shard."""
+
+    def __init__(self, index: int, host: str, port: int, front: "FrontLayer"):
+        self.index = index
+        self._host = host
+        self._port = port
+        self._front = front
+        self._writer: asyncio.StreamWriter | None = None
+        self._task: asyncio.Task | None = None
+
+    async def connect(self, timeout: float = SHARD_CONNECT_TIMEOUT_SECONDS) -> None:
+        """Connect to the shard, retrying while it starts up."""
+        deadline = asyncio.get_running_loop().time() + timeout
+        while True:
+            try:
+                reader, self._writer = await asyncio.open_connection(
+                    self._host, self._port
+                )
+                break
+            except OSError as e:
+                if asyncio.get_running_loop().time() >= deadline:
+                    address = f"{self._host}:{self._port}"
+                    raise LinkError(
+                        f"Cannot reach shard {self.index} at {address}: {e}"
+                    ) from e
+                await asyncio.sleep(0.1)
+        self._task = asyncio.create_task(self._read_loop(reader))
+
+    def send(self, op: int, conn_id: int, payload: bytes = b"") -> None:
+        if self._writer is not None:
+            self._writer.write(encode_op(op, conn_id, payload))
+
+    async def close(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+        if self._writer is not None:
+            self._writer.close()
+        self._writer = None
+
+    async def _read_loop(self, reader: asyncio.StreamReader) -> None:
+        try:
+            while True:
+                op, conn_id, payload = await read_op(reader)
+                if op == OP_EVENT:
+                    self._front.on_shard_event(self.index, json.loads(payload))
+                else:
+                    self._front.on_shard_frame(self.index, op, conn_id, payload)
+        except LinkError as e:
+            logger.error(f"Lost link to shard {self.index}: {e}")
+            self._writer = None
+            self._front.on_shard_lost(self.index)
+
+
+class FrontLayer:
+    """Terminates client WebSockets and relays their frames to shards.
+
+    Outbound frames from a shard go through the same bounded per-client
+    queue as in a single process, so slow clients are evicted here; the
+    shard then runs its normal disconnect path.
+    """
+
+    def __init__(
+        self, addresses: list[tuple[str, int]], metrics: Metrics | None = None
+    ):
+        self._metrics = metrics or get_metrics()
+        self._links = [
+            ShardLink(index, host, port, self)
+            for index, (host, port) in enumerate(addresses)
+        ]
+        self._placement = ShardPlacement(len(addresses))
+        self._clients: dict[int, RelayedClient] = {}
+        self._conn_ids = itertools.count(1)
+        self._background_tasks: set[asyncio.Task] = set()
+
+    @property
+    def placement(self) -> ShardPlacement:
+        return self._placement
+
+    async def start(self) -> None:
+        """Connect to every shard."""
+        await asyncio.gather(*(link.connect() for link in self._links))
+        logger.info(f"Front layer connected to {len(self._links)} shards")
+
+    async def close(self) -> None:
+        for link in self._links:
+            await link.close()
+
+    async def handle_connection(self, websocket: WebSocket) -> None:
+        """Relay a client WebSocket until it disconnects."""
+        codec, subprotocol = negotiate_codec(websocket.scope.get("subprotocols", []))
+        await websocket.accept(subprotocol=subprotocol)
+        conn_id = next(self._conn_ids)
+        client = RelayedClient(
+            conn_id=conn_id,
+            subprotocol=subprotocol or "",
+            connection=Connection(
+                websocket,
+                codec=codec,
+                on_evict=lambda _: self._on_evict(conn_id),
+                metrics=self._metrics,
+            ),
+        )
+        self._clients[client.conn_id] = client
+
+        try:
+            while True:
+                message = await websocket.receive()
+                if message["type"] == "websocket.disconnect":
+                    break
+
+                text = message.get("text")
+                if text is not None:
+                    op, payload = OP_TEXT, text.encode()
+                elif message.get("bytes") is not None:
+                    op, payload = OP_BYTES, message["bytes"]
+                else:
+                    continue
+
+                shard = self._shard_for(client, payload, text, codec)
+                if shard != client.shard:
+                    self._bind(client, shard)
+                self._links[shard].send(op, client.conn_id, payload)
+        finally:
+            client.connection.close()
+            del self._clients[client.conn_id]
+            self._unbind(client)
+
+    def _shard_for(
+        self, client: RelayedClient, payload: bytes, text: str | None, codec: Codec
+    ) -> int:
+        """Choose the shard for a client's frame.
+
+        Joins are placed by game type and resumes go to the shard that
+        issued the token; anything else stays on the client's current shard.
+        A bound client's frame is decoded only if it may be a new join;
+        resumes arrive on new, unbound sockets. A compressed join from a
+        bound client is not spotted and stays on its shard, which still
+        serves it.
+        """
+        if client.shard is not None and JOIN_MARKER not in payload:
+            return client.shard
+
+        self._metrics.increment("front_frames_decoded")
+        try:
+            data = codec.decode(text if text is not None else payload)
+        except CodecError:
+            data = None
+
+        if isinstance(data, dict):
+            msg_type = data.get("type")
+            if msg_type == "join":
+                return self._placement.for_join(str(data.get("game_type")))
+            if msg_type == "resume":
+                shard = shard_of_token(data.get("token"), len(self._links))
+                if shard is not None:
+                    return shard
+
+        if client.shard is not None:
+            return client.shard
+        return self._placement.least_loaded()
+
+    def _bind(self, client: RelayedClient, shard: int) -> None:
+        """Relay a client to a shard, leaving the previous one."""
+        if client.shard is not None:
+            self._metrics.increment("shard_rebinds")
+        self._unbind(client)
+        client.shard = shard
+        self._placement.bound(shard)
+        self._links[shard].send(OP_OPEN, client.conn_id, client.subprotocol.encode())
+
+    def _unbind(self, client: RelayedClient, notify: bool = True) -> None:
+        if client.shard is None:
+            return
+        if notify:
+            self._links[client.shard].send(OP_CLOSE, client.conn_id, b"1000")
+        self._placement.unbound(client.shard)
+        client.shard = None
+
+    def _on_evict(self, conn_id: int) -> None:
+        """Tell the shard about a client evicted for falling behind."""
+        client = self._clients.get(conn_id)
+        if client is not None:
+            self._unbind(client)
+
+    def on_shard_frame(
+        self, shard: int, op: int, conn_id: int, payload: bytes
+    ) -> None:
+        """Queue a frame a shard sent to one of its clients."""
+        client = self._clients.get(conn_id)
+        if client is None or client.shard != shard:
+            return
+
+        connection = client.connection
+        if op == OP_CLOSE:
+            self._unbind(client, notify=False)
+            code = int(payload or 1000)
+            self._run_in_background(self._close_client(connection, code))
+            return
+
+        data = payload.decode() if op == OP_TEXT else payload
+        connection.enqueue(EncodedFrame.relayed(connection.codec, data))
+
+    def on_shard_event(self, shard: int, event: dict) -> None:
+        if event.get("event") == "queue":
+            self._placement.queue_changed(
+                shard, event["game_type"], event["queued"], event.get("joinable", 0)
+            )
+
+    def on_shard_lost(self, shard: int) -> None:
+        """Close the clients of a shard whose link went down."""
+        for client in list(self._clients.values()):
+            if client.shard == shard:
+                self._unbind(client, notify=False)
+                self._run_in_background(
+                    self._close_client(client.connection, WS_CLOSE_INTERNAL_ERROR)
+                )
+
+    async def _close_client(self, connection: Connection, code: int) -> None:
+        """Close a client's socket once its queued frames are written."""
+        try:
+            await asyncio.wait_for(connection.flush(), WS_OUTBOUND_MAX_LAG_SECONDS)
+            await connection.websocket.close(code=code)
+        except Exception as e:
+            logger.debug(
+                f"Failed to close relayed client: {e!r}", extra={"close_code": code}
+            )
+        connection.close()
+
+    def _run_in_background(self, coro) -> None:
+        task = asyncio.create_task(coro)
+        self._background_tasks.add(task)
+        task.add_done_callback(self._background_tasks.discard)
+
+
+_front: FrontLayer | None = None
+
+
+def get_front() -> FrontLayer:
+    """Get the global front layer, relaying to the configured shards."""
+    global _front
+    if _front is None:
+        _front = FrontLayer(
+            [(SHARD_HOST, SHARD_BASE_PORT + index) for index in range(SHARD_COUNT)]
+        )
+    return _front
@@ -0,0 +1,58 @@
+"""Framing for the link between the front layer and a shard process.
+
+Every operation is a fixed header followed by a payload:
+
+    payload length (u32) | op (u8) | connection id (u32) | payload
+
+The front opens a virtual connection per client socket and relays its frames
+unchanged; the shard relays outbound frames back the same way. Events carry
+JSON and use connection id 0.
+"""
+
+import asyncio
+import json
+import struct
+from typing import Any
+
+OP_OPEN = 1  # payload: negotiated subprotocol ("" for plain JSON)
+OP_TEXT = 2  # payload: UTF-8 text frame
+OP_BYTES = 3  # payload: binary frame
+OP_CLOSE = 4  # payload: close code as ASCII digits
+OP_EVENT = 5  # payload: JSON object, shard -> front
+
+HEADER = struct.Struct("!IBI")
+MAX_PAYLOAD_BYTES = 1 << 24
+
+
+class LinkError(ConnectionError):
+    """Raised when the peer closes the link or sends a malformed operation."""
+
+
+def encode_op(op: int, conn_id: int, payload: bytes = b"") -> bytes:
+    """Encode one operation."""
+    return HEADER.pack(len(payload), op, conn_id) + payload
+
+
+def encode_event(event: dict[str, Any]) -> bytes:
+    """Encode a shard event."""
+    return encode_op(OP_EVENT, 0, json.dumps(event).encode())
+
+
+async def read_op(reader: asyncio.StreamReader) -> tuple[int, int, bytes]:
+    """Read one operation.
+
+    Returns:
+        (op, connection id, payload)
+
+    Raises:
+        LinkError: If the link was closed or the header is invalid
+    """
+    try:
+        header = await reader.readexactly(HEADER.size)
+        length, op, conn_id = HEADER.unpack(header)
+        if length > MAX_PAYLOAD_BYTES:
+            raise LinkError(f"Link payload of {length} bytes exceeds limit")
+        payload = await reader.readexactly(length) if length else b""
+    except asyncio.IncompleteReadError as e:
+        raise LinkError("Link closed") from e
+    return op, conn_id, payload
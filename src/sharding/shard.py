@@ -0,0 +1,237 @@
+"""Shard process: runs the game server for the clients a front layer relays.
+
+A shard owns every game started on it. The front layer keeps each client on
+one shard, so a game's players, its matchmaking queue and their sessions all
+live in the same process and the game code runs unchanged.
+"""
+
+import asyncio
+import logging
+import multiprocessing
+from multiprocessing.process import BaseProcess
+
+from starlette.websockets import WebSocketState
+
+from config import SHARD_BASE_PORT, SHARD_HOST
+from services.matchmaking import Matchmaking, get_matchmaking
+from sharding.link import (
+    OP_BYTES,
+    OP_CLOSE,
+    OP_OPEN,
+    OP_TEXT,
+    LinkError,
+    encode_event,
+    encode_op,
+    read_op,
+)
+from websocket.handler import WebSocketHandler
+
+logger = logging.getLogger(__name__)
+
+TOKEN_SEPARATOR = "."
+WS_CLOSE_GOING_AWAY = 1001
+
+
+def token_prefix(index: int) -> str:
+    """Prefix of the resume tokens issued by a shard."""
+    return f"{index}{TOKEN_SEPARATOR}"
+
+
+class RemoteSocket:
+    """WebSocket stand-in for a client whose socket lives in the front layer.
+
+    Implements the part of the WebSocket interface the handler uses: frames
+    from the client are fed in by the shard, and frames sent to it are
+    written to the link.
+    """
+
+    def __init__(self, conn_id: int, subprotocol: str, writer: asyncio.StreamWriter):
+        self.conn_id = conn_id
+        self.scope = {"subprotocols": [subprotocol] if subprotocol else []}
+        self.client_state = WebSocketState.CONNECTING
+        self._writer = writer
+        self._inbox: asyncio.Queue[dict] = asyncio.Queue()
+
+    async def accept(self, subprotocol: str | None = None) -> None:
+        self.client_state = WebSocketState.CONNECTED
+
+    async def receive(self) -> dict:
+        return await self._inbox.get()
+
+    async def send_text(self, data: str) -> None:
+        await self._send(OP_TEXT, data.encode())
+
+    async def send_bytes(self, data: bytes) -> None:
+        await self._send(OP_BYTES, data)
+
+    async def close(self, code: int = 1000) -> None:
+        """Close the client's socket in the front layer."""
+        if self.client_state == WebSocketState.DISCONNECTED:
+            return
+        if not self._writer.is_closing():
+            self._writer.write(encode_op(OP_CLOSE, self.conn_id, str(code).encode()))
+        self.disconnected(code)
+
+    def feed(self, op: int, payload: bytes) -> None:
+        """Deliver a frame the client sent."""
+        if op == OP_TEXT:
+            message = {"type": "websocket.receive", "text": payload.decode()}
+        else:
+            message = {"type": "websocket.receive", "bytes": payload}
+        self._inbox.put_nowait(message)
+
+    def disconnected(self, code: int = 1000) -> None:
+        """Record that the client is gone."""
+        if self.client_state == WebSocketState.DISCONNECTED:
+            return
+        self.client_state = WebSocketState.DISCONNECTED
+        self._inbox.put_nowait({"type": "websocket.disconnect", "code": code})
+
+    async def _send(self, op: int, payload: bytes) -> None:
+        if self._writer.is_closing():
+            raise ConnectionError("Front link closed")
+        self._writer.write(encode_op(op, self.conn_id, payload))
+        await self._writer.drain()
+
+
+class Shard:
+    """Game server for one slice of the games, fed by front layer links.
+
+    Tells every front about its matchmaking queues and joinable seats after
+    each join and queue change, so that new players are sent where a game
+    has room or others are already waiting.
+    """
+
+    def __init__(
+        self,
+        index: int,
+        handler: WebSocketHandler | None = None,
+        matchmaking: Matchmaking | None = None,
+    ):
+        self.index = index
+        self._handler = handler or WebSocketHandler(
+            session_token_prefix=token_prefix(index)
+        )
+        self._links: set[asyncio.StreamWriter] = set()
+        self._tasks: set[asyncio.Task] = set()
+        self._server: asyncio.Server | None = None
+        self._matchmaking = matchmaking or get_matchmaking()
+        self._matchmaking.add_queue_listener(self._on_queue_changed)
+
+    @property
+    def port(self) -> int:
+        """Port the shard is listening on."""
+        return self._server.sockets[0].getsockname()[1]
+
+    async def serve(self, host: str = SHARD_HOST, port: int = 0) -> asyncio.Server:
+        """Start accepting front layer links."""
+        self._server = await asyncio.start_server(self._serve_link, host, port)
+        logger.info(f"Shard {self.index} listening on {host}:{self.port}")
+        return self._server
+
+    async def close(self) -> None:
+        """Stop accepting links and drop the open ones."""
+        if self._server is not None:
+            self._server.close()
+        for writer in list(self._links):
+            writer.close()
+        for task in list(self._tasks):
+            task.cancel()
+        await self._handler.close()
+
+    async def _serve_link(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        sockets: dict[int, RemoteSocket] = {}
+        self._links.add(writer)
+        try:
+            while True:
+                op, conn_id, payload = await read_op(reader)
+                if op == OP_OPEN:
+                    socket = sockets[conn_id] = RemoteSocket(
+                        conn_id, payload.decode(), writer
+                    )
+                    self._spawn(self._run_socket(sockets, socket))
+                elif op in (OP_TEXT, OP_BYTES):
+                    socket = sockets.get(conn_id)
+                    if socket is not None:
+                        socket.feed(op, payload)
+                elif op == OP_CLOSE:
+                    socket = sockets.pop(conn_id, None)
+                    if socket is not None:
+                        socket.disconnected(int(payload or 1000))
+        except LinkError as e:
+            logger.info(f"Front link closed: {e}", extra={"shard": self.index})
+        finally:
+            self._links.discard(writer)
+            for socket in sockets.values():
+                socket.disconnected(WS_CLOSE_GOING_AWAY)
+            writer.close()
+
+    async def _run_socket(
+        self, sockets: dict[int, RemoteSocket], socket: RemoteSocket
+    ) -> None:
+        try:
+            await self._handler.handle_connection(socket)
+        finally:
+            if sockets.get(socket.conn_id) is socket:
+                del sockets[socket.conn_id]
+
+    def _spawn(self, coro) -> None:
+        task = asyncio.create_task(coro)
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    def _on_queue_changed(self, game_type: str, size: int) -> None:
+        event = encode_event(
+            {
+                "event": "queue",
+                "game_type": game_type,
+                "queued": size,
+                "joinable": self._matchmaking.joinable_seats(game_type),
+            }
+        )
+        for writer in self._links:
+            if not writer.is_closing():
+                writer.write(event)
+
+
+def run_shard(index: int, host: str = SHARD_HOST, port: int = SHARD_BASE_PORT) -> None:
+    """Run a shard until the process is stopped."""
+
+    async def serve() -> None:
+        server = await Shard(index).serve(host, port)
+        await server.serve_forever()
+
+    try:
+        asyncio.run(serve())
+    except KeyboardInterrupt:
+        pass
+
+
+def start_shard_processes(
+    count: int, host: str = SHARD_HOST, base_port: int = SHARD_BASE_PORT
+) -> list[BaseProcess]:
+    """Start count shard processes; shard i listens on base_port + i."""
+    context = multiprocessing.get_context("spawn")
+    processes = []
+    for index in range(count):
+        process = context.Process(
+            target=run_shard,
+            args=(index, host, base_port + index),
+            name=f"shard-{index}",
+            daemon=True,
+        )
+        process.start()
+        processes.append(process)
+    return processes
+
+
+def stop_shard_processes(processes: list[BaseProcess], timeout: float = 5.0) -> None:
+    """Stop shard processes, killing those that do not exit in time."""
+    for process in processes:
+        process.terminate()
+    for process in processes:
+        process.join(timeout)
+        if process.is_alive():
+            process.kill()
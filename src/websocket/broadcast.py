@@ -0,0 +1,16 @@
+"""Broadcast outcome reporting."""
+
+from dataclasses import dataclass, field
+
+
+@dataclass
+class BroadcastResult:
+    """Outcome of a broadcast to a set of players."""
+
+    sent: list[str] = field(default_factory=list)
+    failed: list[str] = field(default_factory=list)
+
+    @property
+    def ok(self) -> bool:
+        """Whether the message was queued for every recipient."""
+        return not self.failed
@@ -0,0 +1,187 @@
+"""Per-connection outbound queue drained by a dedicated writer task."""
+
+import asyncio
+import logging
+import time
+from typing import Callable
+
+from fastapi import WebSocket
+
+from config import (
+    WS_OUTBOUND_MAX_LAG_SECONDS,
+    WS_OUTBOUND_QUEUE_SIZE,
+    WS_SEND_STALL_SECONDS,
+)
+from services.codec import JSON_CODEC, Codec
+from services.metrics import Metrics, get_metrics
+from websocket.frames import EncodedFrame
+
+logger = logging.getLogger(__name__)
+
+WS_CLOSE_TRY_AGAIN_LATER = 1013
+
+
+class Connection:
+    """A client WebSocket with its own bounded outbound queue.
+
+    Producers call enqueue(), which never awaits the socket. A writer task
+    sends queued frames in order. Clients that fall more than max_queue
+    frames or max_lag seconds behind are evicted: the socket is closed and
+    on_evict is called so the player goes through the normal leave path.
+    """
+
+    def __init__(
+        self,
+        websocket: WebSocket,
+        codec: Codec = JSON_CODEC,
+        max_queue: int = WS_OUTBOUND_QUEUE_SIZE,
+        max_lag: float = WS_OUTBOUND_MAX_LAG_SECONDS,
+        stall_after: float = WS_SEND_STALL_SECONDS,
+        on_evict: Callable[["Connection"], None] | None = None,
+        metrics: Metrics | None = None,
+    ):
+        self.websocket = websocket
+        self.codec = codec
+        self.player_id: str | None = None
+        self.closed = False
+        self.last_seen = time.monotonic()
+        self._max_lag = max_lag
+        self._stall_after = stall_after
+        self._on_evict = on_evict
+        self._metrics = metrics or get_metrics()
+        self._queue: asyncio.Queue[tuple[float, EncodedFrame]] = asyncio.Queue(
+            maxsize=max_queue
+        )
+        self._writer: asyncio.Task | None = None
+        self._closer: asyncio.Task | None = None
+
+    @property
+    def pending(self) -> int:
+        """Number of frames waiting to be written."""
+        return self._queue.qsize()
+
+    def touch(self) -> None:
+        """Record that the client sent a frame."""
+        self.last_seen = time.monotonic()
+
+    def enqueue(self, frame: EncodedFrame) -> bool:
+        """Queue a frame for sending without waiting for the socket.
+
+        Returns:
+            True if the frame was queued, False if the connection is closed
+            or was evicted because its queue is full.
+        """
+        if self.closed:
+            return False
+
+        try:
+            self._queue.put_nowait((time.monotonic(), frame))
+        except asyncio.QueueFull:
+            self.evict("queue_full")
+            return False
+
+        if self._writer is None:
+            self._writer = asyncio.create_task(self._drain())
+        return True
+
+    async def flush(self) -> None:
+        """Wait until every queued frame has been written or dropped."""
+        await self._queue.join()
+
+    def evict(self, reason: str) -> None:
+        """Disconnect a client that cannot keep up with its outbound queue."""
+        if self.closed:
+            return
+
+        self._metrics.increment("ws_evictions")
+        self._metrics.increment(f"ws_evictions_{reason}")
+        logger.warning(
+            f"Evicting slow consumer: {reason}",
+            extra={"player_id": self.player_id, "pending": self.pending},
+        )
+        self._shutdown()
+        self._closer = asyncio.create_task(self._close_socket())
+
+        if self._on_evict:
+            self._on_evict(self)
+
+    def close(self) -> None:
+        """Stop the writer and drop any queued frames."""
+        if not self.closed:
+            self._shutdown()
+
+    def _shutdown(self) -> None:
+        self.closed = True
+        if self._writer is not None and self._writer is not asyncio.current_task():
+            self._writer.cancel()
+        self._drop_pending()
+
+    def _drop_pending(self) -> None:
+        while not self._queue.empty():
+            self._queue.get_nowait()
+            self._queue.task_done()
+
+    async def _drain(self) -> None:
+        while not self.closed:
+            enqueued_at, frame = await self._queue.get()
+            try:
+                if time.monotonic() - enqueued_at > self._max_lag:
+                    self.evict("lagging")
+                    return
+
+                if not await self._write(frame, enqueued_at):
+                    return
+            finally:
+                self._queue.task_done()
+
+    async def _write(self, frame: EncodedFrame, enqueued_at: float) -> bool:
+        send = asyncio.ensure_future(self._send(frame))
+        try:
+            done, _ = await asyncio.wait({send}, timeout=self._stall_after)
+
+            if not done:
+                self._metrics.increment("ws_send_stalls")
+                remaining = self._max_lag - (time.monotonic() - enqueued_at)
+                done, _ = await asyncio.wait({send}, timeout=max(remaining, 0))
+                if not done:
+                    send.cancel()
+                    self.evict("lagging")
+                    return False
+        except asyncio.CancelledError:
+            send.cancel()
+            raise
+
+        if not send.result():
+            self._shutdown()
+            return False
+        return True
+
+    async def _send(self, frame: EncodedFrame) -> bool:
+        if self.websocket.client_state.name != "CONNECTED":
+            return False
+
+        try:
+            data = frame.data_for(self.codec)
+            if self.codec.binary:
+                await self.websocket.send_bytes(data)
+            else:
+                await self.websocket.send_text(data)
+        except Exception as e:
+            logger.debug(
+                f"Failed to send message: {e}",
+                extra={"player_id": self.player_id, "message_type": frame.message_type},
+            )
+            return False
+        return True
+
+    async def _close_socket(self) -> None:
+        try:
+            await asyncio.wait_for(
+                self.websocket.close(code=WS_CLOSE_TRY_AGAIN_LATER),
+                self._stall_after,
+            )
+        except Exception as e:
+            logger.debug(
+                f"Failed to close evicted socket: {e!r}",
+                extra={"player_id": self.player_id},
+            )
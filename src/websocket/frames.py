@@ -0,0 +1,45 @@
+"""Pre-encoded outbound frames."""
+
+from dataclasses import dataclass, field
+from typing import Any
+
+from models.messages import ServerMessage
+from services.codec import JSON_CODEC, Codec
+
+
+@dataclass(frozen=True, slots=True)
+class EncodedFrame:
+    """A server message serialized once and sent as-is to many sockets.
+
+    The message is dumped to a payload once. Each codec's encoding of that
+    payload is produced on first use and shared by every connection that
+    negotiated the same codec.
+    """
+
+    message_type: str
+    payload: dict[str, Any]
+    _encodings: dict[str, str | bytes] = field(
+        default_factory=dict, repr=False, compare=False
+    )
+
+    @classmethod
+    def encode(cls, message: ServerMessage) -> "EncodedFrame":
+        """Serialize a server message into a frame."""
+        return cls(message_type=message.type, payload=message.to_dict())
+
+    @classmethod
+    def relayed(cls, codec: Codec, data: str | bytes) -> "EncodedFrame":
+        """Wrap data another process has already encoded with codec."""
+        return cls(message_type="", payload={}, _encodings={codec.name: data})
+
+    def data_for(self, codec: Codec) -> str | bytes:
+        """Get the frame data for a codec, encoding it on first use."""
+        data = self._encodings.get(codec.name)
+        if data is None:
+            data = self._encodings[codec.name] = codec.encode(self.payload)
+        return data
+
+    @property
+    def text(self) -> str:
+        """The frame encoded as JSON text."""
+        return self.data_for(JSON_CODEC)
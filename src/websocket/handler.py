@@ -1,15 +1,28 @@
 """WebSocket connection handler."""
 
-import json
+import asyncio
 import logging
 
 from fastapi import WebSocket, WebSocketDisconnect
 
-from config import GAME_TYPE_HANGMAN
+from config import (
+    GAME_TYPE_HANGMAN,
+    WS_OUTBOUND_MAX_LAG_SECONDS,
+    WS_OUTBOUND_QUEUE_SIZE,
+    WS_SEND_STALL_SECONDS,
+)
 from models.base import BaseGame
-from models.messages import ErrorMessage, ServerMessage
+from models.messages import ErrorMessage, ResumedMessage, ServerMessage
+from services.codec import JSON_CODEC, Codec, CodecError, negotiate_codec
+from services.lifecycle import get_game_lifecycle
 from services.matchmaking import get_matchmaking
+from services.metrics import get_metrics
+from websocket.broadcast import BroadcastResult
+from websocket.connection import Connection
+from websocket.frames import EncodedFrame
+from websocket.heartbeat import Heartbeat
 from websocket.router import GameRouter
+from websocket.session import SessionStore
 
 logger = logging.getLogger(__name__)
 
@@ -22,67 +35,160 @@ class WebSocketHandler:
     game-specific logic.
     """
 
-    def __init__(self):
-        self._connections: dict[str, WebSocket] = {}
+    def __init__(
+        self,
+        max_queue: int = WS_OUTBOUND_QUEUE_SIZE,
+        max_lag: float = WS_OUTBOUND_MAX_LAG_SECONDS,
+        stall_after: float = WS_SEND_STALL_SECONDS,
+        session_token_prefix: str = "",
+    ):
+        self._connections: dict[str, Connection] = {}
+        self._sockets: dict[WebSocket, Connection] = {}
+        self._max_queue = max_queue
+        self._max_lag = max_lag
+        self._stall_after = stall_after
+        self._background_tasks: set[asyncio.Task] = set()
+        self._metrics = get_metrics()
+        self._heartbeat = Heartbeat(self._sockets.values, metrics=self._metrics)
+        self._sessions = SessionStore(token_prefix=session_token_prefix)
         self._game_router = GameRouter(self)
         self._matchmaking = get_matchmaking()
+        self._lifecycle = get_game_lifecycle()
+
+    async def close(self) -> None:
+        """Stop the heartbeat and game lifecycle started by the first connection."""
+        self._heartbeat.stop()
+        self._lifecycle.stop()
 
     async def handle_connection(self, websocket: WebSocket) -> None:
         """Handle a new WebSocket connection.
 
+        The wire codec is negotiated from the client's requested
+        subprotocols; clients that request none use JSON text frames.
+
         Args:
             websocket: The WebSocket connection to handle
         """
-        await websocket.accept()
+        codec, subprotocol = negotiate_codec(websocket.scope.get("subprotocols", []))
+        await websocket.accept(subprotocol=subprotocol)
+        connection = self._connection_for(websocket, codec)
+        self._heartbeat.start()
+        self._lifecycle.start()
         player_id: str | None = None
 
-        logger.info("New WebSocket connection accepted")
+        logger.info(
+            "New WebSocket connection accepted", extra={"codec": codec.name}
+        )
 
         try:
-            async for message in websocket.iter_text():
-                player_id = await self._process_message(websocket, message, player_id)
+            while True:
+                message = await websocket.receive()
+                if message["type"] == "websocket.disconnect":
+                    raise WebSocketDisconnect(message.get("code", 1000))
+                connection.touch()
+
+                raw = message.get("text")
+                if raw is None:
+                    raw = message.get("bytes")
+                if raw is None:
+                    continue
+
+                player_id = await self._process_message(
+                    websocket, raw, player_id, codec
+                )
 
         except WebSocketDisconnect:
             logger.info(
                 "WebSocket disconnected",
                 extra={"player_id": player_id} if player_id else {},
             )
-            if player_id:
-                await self._handle_disconnect(player_id)
+        finally:
+            connection.close()
+            self._sockets.pop(websocket, None)
+            if player_id and self._connections.get(player_id) is connection:
+                await self._connection_lost(player_id)
+
+    def _connection_for(
+        self, websocket: WebSocket, codec: Codec = JSON_CODEC
+    ) -> Connection:
+        """Get the outbound connection for a socket, creating it if needed."""
+        connection = self._sockets.get(websocket)
+        if connection is None:
+            connection = Connection(
+                websocket,
+                codec=codec,
+                max_queue=self._max_queue,
+                max_lag=self._max_lag,
+                stall_after=self._stall_after,
+                on_evict=self._on_evict,
+                metrics=self._metrics,
+            )
+            self._sockets[websocket] = connection
+        return connection
+
+    def _on_evict(self, connection: Connection) -> None:
+        """Handle the loss of a player whose connection was evicted."""
+        self._sockets.pop(connection.websocket, None)
+        player_id = connection.player_id
+        if player_id and self._connections.get(player_id) is connection:
+            self._run_in_background(self._connection_lost(player_id))
+
+    def _run_in_background(self, coro) -> None:
+        task = asyncio.create_task(coro)
+        self._background_tasks.add(task)
+        task.add_done_callback(self._background_tasks.discard)
+
+    async def _connection_lost(self, player_id: str) -> None:
+        """Hold a dropped player's session for resume, or run the leave path."""
+        self._connections.pop(player_id, None)
+        if self._sessions.detach(player_id, lambda: self._expire_session(player_id)):
+            self._metrics.increment("sessions_detached")
+            logger.info(
+                "Player connection lost, holding session for resume",
+                extra={"player_id": player_id},
+            )
+            return
+        await self._handle_disconnect(player_id)
+
+    def _expire_session(self, player_id: str) -> None:
+        """Run the leave path for a player who did not resume in time."""
+        self._metrics.increment("sessions_expired")
+        self._run_in_background(self._handle_disconnect(player_id))
 
     async def _process_message(
-        self, websocket: WebSocket, message: str, player_id: str | None
+        self,
+        websocket: WebSocket,
+        message: str | bytes,
+        player_id: str | None,
+        codec: Codec = JSON_CODEC,
     ) -> str | None:
         """Process a single message from the WebSocket.
 
         Args:
             websocket: The WebSocket connection
-            message: Raw message text
+            message: Raw frame data
             player_id: Current player ID if authenticated
+            codec: The codec negotiated for this connection
 
         Returns:
             Updated player_id (may be set on first join)
         """
         try:
-            data = json.loads(message)
-        except json.JSONDecodeError as e:
-            logger.warning(f"Received invalid JSON: {e}", extra={"message": message})
-            await self.send_error(websocket, "Invalid JSON")
+            data = codec.decode(message)
+        except CodecError as e:
+            logger.warning(f"Received undecodable frame: {e}", extra={"codec": codec.name})
+            await self.send_error(websocket, str(e))
+            return player_id
+
+        if not isinstance(data, dict):
+            await self.send_error(websocket, "Invalid message")
             return player_id
 
         result = await self._game_router.process(websocket, data, player_id)
 
         if result and "player_id" in result:
             new_player_id = result["player_id"]
-            if (
-                new_player_id in self._connections
-                and self._connections[new_player_id] != websocket
-            ):
-                logger.warning(
-                    f"Player {new_player_id} reconnecting, replacing old connection",
-                    extra={"player_id": new_player_id},
-                )
-            self._connections[new_player_id] = websocket
+            self.register_connection(new_player_id, websocket)
             logger.info("Player connected", extra={"player_id": new_player_id})
             return new_player_id
 
@@ -98,15 +204,11 @@ class WebSocketHandler:
             player_id: The ID of the player disconnecting
         """
         self._connections.pop(player_id, None)
+        self._sessions.close(player_id)
         fake_leave = {"type": "leave"}
-        websocket = self._connections.get(player_id)
 
         try:
-            await self._game_router.process(
-                websocket if websocket else None,
-                fake_leave,
-                player_id,
-            )
+            await self._game_router.process(None, fake_leave, player_id)
         except Exception as e:
             logger.error(
                 f"Error during disconnect cleanup, doing manual cleanup: {e}",
@@ -118,18 +220,128 @@ class WebSocketHandler:
 
     def register_connection(self, player_id: str, websocket: WebSocket) -> None:
         """Register a player's WebSocket connection."""
-        self._connections[player_id] = websocket
+        connection = self._connection_for(websocket)
+        previous = self._connections.get(player_id)
+        if previous is not None and previous is not connection:
+            logger.warning(
+                f"Player {player_id} reconnecting, replacing old connection",
+                extra={"player_id": player_id},
+            )
+        connection.player_id = player_id
+        self._connections[player_id] = connection
+
+    def open_session(self, player_id: str, websocket: WebSocket) -> str:
+        """Register a player's connection and start a resumable session.
+
+        Frames sent to the player from now on are numbered and kept for
+        replay.
+
+        Returns:
+            The resume token for the client
+        """
+        self.register_connection(player_id, websocket)
+        return self._sessions.open(player_id).token
+
+    def end_session(self, player_id: str) -> None:
+        """End a player's session so a later disconnect is not resumable."""
+        self._sessions.close(player_id)
+
+    async def resume_session(
+        self, websocket: WebSocket, token: str, last_seq: int
+    ) -> str | None:
+        """Reattach a reconnecting client to its session.
 
-    async def send_to_player(self, player_id: str, message: ServerMessage) -> None:
+        Replays the frames numbered after last_seq, then sends a resumed
+        message. A session whose missed frames are no longer buffered cannot
+        be resumed and is ended through the leave path.
+
+        Returns:
+            The resumed player's ID, or None if the session cannot be resumed
+        """
+        session = self._sessions.by_token(token)
+        if session is None:
+            return None
+
+        player_id = session.player_id
+        frames = session.frames_after(last_seq)
+        if frames is None:
+            self._metrics.increment("sessions_resume_failed")
+            previous = self._connections.get(player_id)
+            await self._handle_disconnect(player_id)
+            if previous is not None:
+                previous.evict("resume_failed")
+            return None
+
+        self._sessions.attach(session)
+        previous = self._connections.get(player_id)
+        connection = self._connection_for(websocket)
+        self.register_connection(player_id, websocket)
+        if previous is not None and previous is not connection:
+            previous.evict("replaced")
+
+        for frame in frames:
+            connection.enqueue(frame)
+        self._deliver(
+            player_id,
+            self._encode(
+                ResumedMessage(
+                    player_id=player_id, seq=session.seq + 1, replayed=len(frames)
+                )
+            ),
+        )
+
+        self._metrics.increment("sessions_resumed")
+        self._metrics.increment("sessions_frames_replayed", len(frames))
+        logger.info(
+            f"Player resumed session, replayed {len(frames)} frames",
+            extra={"player_id": player_id},
+        )
+        return player_id
+
+    def disconnect(self, player_id: str, reason: str) -> None:
+        """Close a player's connection and run the leave path."""
+        self._sessions.close(player_id)
+        connection = self._connections.get(player_id)
+        if connection is not None:
+            connection.evict(reason)
+
+    def is_connected(self, player_id: str) -> bool:
+        """Check whether a player can be reached on this handler.
+
+        A player whose session is held for resume counts as connected, since
+        frames sent to them are replayed when they reconnect.
+        """
+        connection = self._connections.get(player_id)
+        if connection is not None and not connection.closed:
+            return True
+        return self._sessions.get(player_id) is not None
+
+    def _deliver(self, player_id: str, frame: EncodedFrame) -> bool:
+        """Record a frame in the player's session and queue it if connected.
+
+        Returns:
+            True if the frame was queued on a live connection
+        """
+        session = self._sessions.get(player_id)
+        if session is not None:
+            session.record(frame)
+        connection = self._connections.get(player_id)
+        return connection is not None and connection.enqueue(frame)
+
+    async def send_to_player(
+        self, player_id: str, message: ServerMessage | EncodedFrame
+    ) -> None:
         """Send a message to a specific player by their ID.
 
+        The message is queued on the player's connection; this never waits
+        for the socket write.
+
         Args:
             player_id: The ID of the player to send to
-            message: The message to send
+            message: The message, or an already encoded frame, to send
         """
-        websocket = self._connections.get(player_id)
-        if websocket:
-            await self.send_to_websocket(websocket, message)
+        if player_id in self._connections or self._sessions.get(player_id) is not None:
+            self._deliver(player_id, self._encode(message))
         else:
             logger.debug(
                 f"Cannot send to player {player_id}: not connected",
@@ -137,52 +349,119 @@ class WebSocketHandler:
             )
 
     async def send_to_websocket(
-        self, websocket: WebSocket, message: ServerMessage
+        self, websocket: WebSocket, message: ServerMessage | EncodedFrame
     ) -> None:
         """Send a message directly to a WebSocket connection.
 
         Args:
             websocket: The WebSocket to send to
-            message: The message to send
+            message: The message, or an already encoded frame, to send
         """
         if websocket is None:
             return
+        connection = self._connection_for(websocket)
+        player_id = connection.player_id
+        if player_id and self._connections.get(player_id) is connection:
+            self._deliver(player_id, self._encode(message))
+        else:
+            connection.enqueue(self._encode(message))
 
-        if websocket.client_state.name != "CONNECTED":
-            return
+    async def flush(self) -> None:
+        """Wait until every connection has written its queued frames."""
+        await asyncio.gather(
+            *(connection.flush() for connection in list(self._sockets.values()))
+        )
 
-        try:
-            await websocket.send_text(json.dumps(message.to_dict()))
-        except Exception as e:
+    def _encode(
+        self, message: ServerMessage | EncodedFrame, recipients: int = 1
+    ) -> EncodedFrame:
+        """Encode a message once for the given number of recipients.
+
+        Records how many serializations were performed and how many were
+        avoided by sharing the frame between recipients.
+        """
+        if isinstance(message, EncodedFrame):
+            self._metrics.increment("ws_serializations_saved", recipients)
+            return message
+
+        frame = EncodedFrame.encode(message)
+        self._metrics.increment("ws_serializations")
+        self._metrics.increment("ws_serializations_saved", recipients - 1)
+        return frame
+
+    def _fan_out(
+        self, player_ids: list[str], message: ServerMessage | EncodedFrame
+    ) -> BroadcastResult:
+        """Queue a message on several players' connections.
+
+        The message is encoded once and the same frame is queued for every
+        recipient. Players without a live connection, or whose queue
+        overflowed, are reported as failed; frames for players whose session
+        is held for resume are still kept for replay.
+        """
+        result = BroadcastResult()
+        if not player_ids:
+            return result
+
+        frame = self._encode(message, recipients=len(player_ids))
+        for player_id in player_ids:
+            if self._deliver(player_id, frame):
+                result.sent.append(player_id)
+            else:
+                result.failed.append(player_id)
+
+        if result.failed:
             logger.debug(
-                f"Failed to send message: {e}",
-                extra={"message_type": type(message).__name__},
+                f"Broadcast failed for {len(result.failed)} of {len(player_ids)} players",
+                extra={
+                    "message_type": frame.message_type,
+                    "failed_player_ids": result.failed,
+                },
             )
+        return result
 
-    async def broadcast_to_game(self, game: BaseGame, message: ServerMessage) -> None:
+    async def broadcast_to_game(
+        self, game: BaseGame, message: ServerMessage | EncodedFrame
+    ) -> BroadcastResult:
         """Broadcast a message to all players in a game."""
-        for player in game.connected_players:
-            await self.send_to_player(player.id, message)
+        return self._fan_out(
+            [player.id for player in game.connected_players], message
+        )
 
     async def broadcast_to_game_except(
-        self, game: BaseGame, message: ServerMessage, except_player_id: str
-    ) -> None:
+        self,
+        game: BaseGame,
+        message: ServerMessage | EncodedFrame,
+        except_player_id: str,
+    ) -> BroadcastResult:
         """Broadcast a message to all players except one."""
-        for player in game.connected_players:
-            if player.id != except_player_id:
-                await self.send_to_player(player.id, message)
+        return self._fan_out(
+            [
+                player.id
+                for player in game.connected_players
+                if player.id != except_player_id
+            ],
+            message,
+        )
 
     async def broadcast_to_queue(
-        self, message: ServerMessage, game_type: str = GAME_TYPE_HANGMAN
-    ) -> None:
+        self,
+        message: ServerMessage | EncodedFrame,
+        game_type: str = GAME_TYPE_HANGMAN,
+    ) -> BroadcastResult:
         """Broadcast a message to all players in a specific game type queue.
 
         Args:
             message: The message to broadcast
             game_type: The game type queue to broadcast to (default: hangman)
         """
-        for player in self._matchmaking.get_queued_players(game_type):
-            await self.send_to_player(player.id, message)
+        return self._fan_out(
+            [
+                player.id
+                for player in self._matchmaking.get_queued_players(game_type)
+            ],
+            message,
+        )
 
     async def send_error(self, websocket: WebSocket, error_message: str) -> None:
         """Send an error message to a websocket."""
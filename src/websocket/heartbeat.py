@@ -0,0 +1,111 @@
+"""Application-level heartbeat and dead-connection reaper."""
+
+import asyncio
+import logging
+import time
+from typing import Callable, Iterable
+
+from config import WS_PING_INTERVAL, WS_PING_MISSED_LIMIT, WS_PING_SWEEP_SLICES
+from models.messages import PingMessage
+from services.metrics import Metrics, get_metrics
+from websocket.connection import Connection
+from websocket.frames import EncodedFrame
+
+logger = logging.getLogger(__name__)
+
+SWEEP_BATCH_SIZE = 100
+
+
+class Heartbeat:
+    """Pings idle connections and reaps the ones that stop answering.
+
+    A single task sweeps every connection once per interval, so the cost is
+    one timer no matter how many sockets are open. Each sweep is spread over
+    the interval: the connections open when it begins are split into slices
+    and one slice is checked every interval / slices seconds, so pings and
+    their writes go out a little at a time instead of all at once. Within a
+    slice the sweep yields to the event loop every batch_size connections.
+    Any inbound frame counts as a sign of life, so busy clients are never
+    pinged. Connections idle for more than missed_limit intervals are
+    evicted, which runs the normal leave path for their player.
+    """
+
+    def __init__(
+        self,
+        connections: Callable[[], Iterable[Connection]],
+        interval: float = WS_PING_INTERVAL,
+        missed_limit: int = WS_PING_MISSED_LIMIT,
+        slices: int = WS_PING_SWEEP_SLICES,
+        batch_size: int = SWEEP_BATCH_SIZE,
+        metrics: Metrics | None = None,
+    ):
+        self._connections = connections
+        self._interval = interval
+        self._missed_limit = missed_limit
+        self._slices = max(slices, 1)
+        self._batch_size = batch_size
+        self._metrics = metrics or get_metrics()
+        self._task: asyncio.Task | None = None
+
+    @property
+    def running(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    def start(self) -> None:
+        """Start the sweep task if it is not already running."""
+        if not self.running:
+            self._task = asyncio.create_task(self._run())
+
+    def stop(self) -> None:
+        """Stop the sweep task."""
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+
+    async def _run(self) -> None:
+        tick = self._interval / self._slices
+        while True:
+            connections = list(self._connections())
+            size = -(-len(connections) // self._slices)
+            for index in range(self._slices):
+                await asyncio.sleep(tick)
+                try:
+                    await self._sweep(connections[index * size : (index + 1) * size])
+                except Exception as e:
+                    logger.error(f"Heartbeat sweep failed: {e}", exc_info=True)
+
+    async def sweep(self, now: float | None = None) -> int:
+        """Ping idle connections and reap dead ones, all in one pass.
+
+        Returns:
+            Number of connections reaped
+        """
+        return await self._sweep(list(self._connections()), now)
+
+    async def _sweep(
+        self, connections: list[Connection], now: float | None = None
+    ) -> int:
+        now = time.monotonic() if now is None else now
+        reap_after = self._interval * self._missed_limit
+        ping: EncodedFrame | None = None
+        reaped = 0
+
+        for index, connection in enumerate(connections, 1):
+            if index % self._batch_size == 0:
+                await asyncio.sleep(0)
+            if connection.closed:
+                continue
+
+            idle = now - connection.last_seen
+            if idle > reap_after:
+                connection.evict("missed_heartbeat")
+                reaped += 1
+            elif idle >= self._interval:
+                if ping is None:
+                    ping = EncodedFrame.encode(PingMessage())
+                connection.enqueue(ping)
+
+        if reaped:
+            self._metrics.increment("ws_heartbeat_reaped", reaped)
+            logger.info(f"Reaped {reaped} dead connections")
+        return reaped
@@ -0,0 +1,54 @@
+"""Single-pass decoding of client messages."""
+
+from typing import Annotated
+
+from pydantic import Field, TypeAdapter, ValidationError
+
+from games.duels.messages import RematchMessage, SpellCastMessage
+from games.hangman.messages import (
+    GuessBatchMessage,
+    GuessMessage,
+    StationResyncMessage,
+)
+from models.messages import JoinMessage, LeaveMessage, PongMessage, ResumeMessage
+
+InboundMessage = Annotated[
+    JoinMessage
+    | LeaveMessage
+    | PongMessage
+    | ResumeMessage
+    | GuessMessage
+    | GuessBatchMessage
+    | StationResyncMessage
+    | SpellCastMessage
+    | RematchMessage,
+    Field(discriminator="type"),
+]
+
+_adapter: TypeAdapter[InboundMessage] = TypeAdapter(InboundMessage)
+
+_UNKNOWN_TYPE_ERRORS = {"union_tag_not_found", "union_tag_invalid"}
+
+
+class InboundError(ValueError):
+    """Raised when a client message cannot be decoded.
+
+    The message is safe to send back to the client.
+    """
+
+
+def decode_inbound(data: dict) -> InboundMessage:
+    """Validate a client payload into its message model.
+
+    The model is picked by the payload's "type" and validated once.
+
+    Raises:
+        InboundError: If the type is unknown or the payload is invalid
+    """
+    try:
+        return _adapter.validate_python(data)
+    except ValidationError as e:
+        if any(error["type"] in _UNKNOWN_TYPE_ERRORS for error in e.errors()):
+            raise InboundError("Unknown message type") from e
+        msg_type = str(data.get("type", "")).replace("_", " ")
+        raise InboundError(f"Invalid {msg_type} format") from e
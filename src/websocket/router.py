@@ -1,34 +1,51 @@
 """Game router for handling multiple game types."""
 
 import logging
-from typing import Any
+from typing import Any, Awaitable, Callable
 
 from fastapi import WebSocket
 
 from config import (
+    DUELS_MATCHMAKER,
+    DUELS_MATCHMAKER_TICK_SECONDS,
     DUELS_MATCHMAKING_TIMEOUT,
     DUELS_MAX_PLAYERS,
     DUELS_MIN_PLAYERS,
     GAME_TYPE_DUELS,
     GAME_TYPE_HANGMAN,
+    GUESS_BATCH_MAX_LETTERS,
     MATCHMAKING_TIMEOUT_SECONDS,
     MAX_PLAYERS_PER_GAME,
     MIN_PLAYERS_TO_START,
+    WAITING_STATUS_COALESCE_SECONDS,
 )
 from games.duels.events import DuelsEventProcessor
 from games.duels.manager import get_duels_manager
 from games.duels.messages import SpellCastMessage
 from games.hangman.events import HangmanEventProcessor
 from games.hangman.manager import get_hangman_manager
-from games.hangman.messages import GuessMessage
+from games.hangman.messages import (
+    GuessBatchMessage,
+    GuessMessage,
+    StationResyncMessage,
+)
 from models.messages import (
-    ClientMessage,
     JoinedMessage,
     JoinMessage,
     LeaveMessage,
+    PongMessage,
+    ResumeFailedMessage,
+    ResumeMessage,
     WaitingMessage,
 )
+from models.base import BaseGame
+from services.coalescer import Coalescer
+from services.lifecycle import get_game_lifecycle
 from services.matchmaking import get_matchmaking
+from services.metrics import get_metrics
+from services.rate_limit import RateLimitDecision, RateLimiter
+from websocket.frames import EncodedFrame
+from websocket.inbound import InboundError, decode_inbound
 
 logger = logging.getLogger(__name__)
 
@@ -41,16 +58,38 @@ class GameRouter:
     matchmaking operations.
     """
 
-    def __init__(self, handler: "WebSocketHandler"):
+    def __init__(
+        self,
+        handler: "WebSocketHandler",
+        waiting_status_window: float = WAITING_STATUS_COALESCE_SECONDS,
+    ):
         self._handler = handler
+        self._waiting_status = Coalescer(
+            waiting_status_window, name="waiting_status", leading=True
+        )
         self._player_game_types: dict[str, str] = {}
         self._hangman_processor = HangmanEventProcessor(handler)
         self._duels_processor = DuelsEventProcessor(handler)
         self._matchmaking = get_matchmaking()
+        self._lifecycle = get_game_lifecycle()
+        self._rate_limiter = RateLimiter()
+        self._metrics = get_metrics()
+        # message type -> (handler, whether the sender must have joined)
+        self._routes: dict[str, tuple[Callable[..., Awaitable[Any]], bool]] = {
+            "join": (self._route_join, False),
+            "leave": (self._route_leave, False),
+            "pong": (self._route_pong, False),
+            "resume": (self._route_resume, False),
+            "guess": (self._route_guess, True),
+            "guess_batch": (self._route_guess_batch, True),
+            "station_resync": (self._route_station_resync, True),
+            "spell_cast": (self._route_spell_cast, True),
+        }
         self._setup_game_types()
 
     def _setup_game_types(self) -> None:
         hangman_manager = get_hangman_manager()
+        hangman_manager.fill_pool()
         self._matchmaking.register_game_type(
             game_type=GAME_TYPE_HANGMAN,
             min_players=MIN_PLAYERS_TO_START,
@@ -60,6 +99,12 @@ class GameRouter:
             on_game_start=self._on_hangman_game_start,
             joinable_game_finder=hangman_manager.find_joinable_game,
         )
+        self._lifecycle.track(
+            GAME_TYPE_HANGMAN,
+            games=lambda: hangman_manager.games,
+            remove_game=hangman_manager.remove_game,
+            on_evict=self._forget_game,
+        )
 
         duels_manager = get_duels_manager()
         self._matchmaking.register_game_type(
@@ -69,8 +114,32 @@ class GameRouter:
             timeout_seconds=DUELS_MATCHMAKING_TIMEOUT,
             game_creator=duels_manager.create_game,
             on_game_start=self._on_duels_game_start,
+            tick_seconds=(
+                DUELS_MATCHMAKER_TICK_SECONDS if DUELS_MATCHMAKER == "tick" else None
+            ),
+        )
+        self._lifecycle.track(
+            GAME_TYPE_DUELS,
+            games=lambda: duels_manager.games,
+            remove_game=duels_manager.remove_game,
+            on_evict=self._forget_game,
         )
 
+    def _forget_game(self, game: BaseGame) -> None:
+        """Drop every record of an evicted game's players.
+
+        Players still waiting in a queue or playing another game are kept.
+        """
+        self._matchmaking.forget_game(game)
+        for player_id in game.players:
+            if self._matchmaking.get_player_game_type(player_id) is not None:
+                continue
+            self._player_game_types.pop(player_id, None)
+            if not self._handler.is_connected(player_id):
+                self._rate_limiter.forget(player_id)
+        if game.game_type == GAME_TYPE_HANGMAN:
+            self._hangman_processor.forget_game(game)
+
     async def _on_hangman_game_start(self, game) -> None:
         manager = get_hangman_manager()
         manager.start_game(game)
@@ -84,6 +153,9 @@ class GameRouter:
     ) -> dict[str, Any] | None:
         """Process an incoming message and route to appropriate handler.
 
+        Rate limits are checked first, then the payload is validated once
+        into its message model and dispatched by type.
+
         Args:
             websocket: The WebSocket connection
             data: Raw message data from the client
@@ -92,65 +164,145 @@ class GameRouter:
         Returns:
             A dict with player_id for join messages, None otherwise
         """
-        message = ClientMessage.parse(data)
+        if player_id and not await self._within_rate_limit(websocket, data, player_id):
+            return None
 
-        if message is None:
-            return await self._handle_unparsed_message(websocket, data, player_id)
+        try:
+            message = decode_inbound(data)
+        except InboundError as e:
+            logger.warning(
+                f"Invalid message from client: {e}",
+                extra={"player_id": player_id, "data": data},
+            )
+            await self._handler.send_error(websocket, str(e))
+            return None
 
-        if isinstance(message, JoinMessage):
-            return await self._handle_join(websocket, message)
+        route = self._routes.get(message.type)
+        if route is None:
+            await self._handler.send_error(websocket, "Unknown message type")
+            return None
 
-        if isinstance(message, LeaveMessage) and player_id:
-            await self._handle_leave(player_id)
+        handle, requires_player = route
+        if requires_player and not player_id:
+            await self._handler.send_error(websocket, "Not authenticated")
+            return None
 
-        return None
+        return await handle(websocket, message, player_id)
 
-    async def _handle_unparsed_message(
-        self, websocket: WebSocket, data: dict, player_id: str | None
+    async def _within_rate_limit(
+        self, websocket: WebSocket, data: dict, player_id: str
+    ) -> bool:
+        """Charge a message to the player's budget, dropping it if over.
+
+        A guess batch is charged to the guess budget, one token per letter.
+        """
+        msg_type = str(data.get("type"))
+        cost = 1
+        if msg_type == "guess_batch":
+            letters = data.get("letters")
+            msg_type = "guess"
+            if isinstance(letters, list):
+                cost = min(max(len(letters), 1), GUESS_BATCH_MAX_LETTERS)
+
+        decision = self._rate_limiter.check(player_id, msg_type, cost)
+        if decision is RateLimitDecision.ALLOW:
+            return True
+
+        self._metrics.increment(f"rate_limit_dropped_{msg_type}")
+        if decision is RateLimitDecision.DISCONNECT:
+            self._metrics.increment("rate_limit_disconnects")
+            logger.warning(
+                "Disconnecting player for exceeding rate limits",
+                extra={"player_id": player_id, "message_type": msg_type},
+            )
+            self._handler.disconnect(player_id, "rate_limited")
+        else:
+            await self._handler.send_error(websocket, "Rate limit exceeded")
+        return False
+
+    async def _route_join(
+        self, websocket: WebSocket, message: JoinMessage, player_id: str | None
+    ) -> dict[str, Any] | None:
+        return await self._handle_join(websocket, message)
+
+    async def _route_leave(
+        self, websocket: WebSocket, message: LeaveMessage, player_id: str | None
     ) -> None:
-        """Handle game-specific messages like guess and spell_cast."""
-        msg_type = data.get("type")
+        if player_id:
+            await self._handle_leave(player_id)
 
-        if not player_id:
-            await self._handler.send_error(websocket, "Not authenticated")
+    async def _route_resume(
+        self, websocket: WebSocket, message: ResumeMessage, player_id: str | None
+    ) -> dict[str, Any] | None:
+        resumed_id = await self._handler.resume_session(
+            websocket, message.token, message.last_seq
+        )
+        if resumed_id is None:
+            await self._handler.send_to_websocket(
+                websocket, ResumeFailedMessage(message="Session expired")
+            )
+            return None
+
+        self._reattach_player(resumed_id, websocket)
+        return {"player_id": resumed_id}
+
+    def _reattach_player(self, player_id: str, websocket: WebSocket) -> None:
+        """Point a resumed player's game objects at their new socket."""
+        game_id = self._matchmaking.get_player_game(player_id)
+        if not game_id:
             return
 
-        game_type = self._player_game_types.get(player_id, GAME_TYPE_HANGMAN)
+        if self._player_game_types.get(player_id) == GAME_TYPE_DUELS:
+            game = get_duels_manager().get_game(game_id)
+        else:
+            game = get_hangman_manager().get_game(game_id)
+        if game is None:
+            return
 
-        if msg_type == "guess":
-            try:
-                guess_msg = GuessMessage(**data)
-            except (ValueError, TypeError) as e:
-                logger.warning(
-                    f"Invalid guess message from player {player_id}: {e}",
-                    extra={"player_id": player_id, "data": data},
-                )
-                await self._handler.send_error(websocket, "Invalid guess format")
-                return
+        player = game.get_player(player_id)
+        if player is not None:
+            player.websocket = websocket
+        wrapper = getattr(game, "player_wrappers", {}).get(player_id)
+        if wrapper is not None and hasattr(wrapper, "websocket"):
+            wrapper.websocket = websocket
 
-            if game_type == GAME_TYPE_HANGMAN:
-                await self._hangman_processor.handle_guess(
-                    player_id, guess_msg, self._matchmaking
-                )
+    async def _route_pong(
+        self, websocket: WebSocket, message: PongMessage, player_id: str | None
+    ) -> None:
+        # Liveness is recorded by the handler for every inbound frame.
+        return None
 
-        if msg_type == "spell_cast":
-            try:
-                spell_msg = SpellCastMessage(**data)
-            except (ValueError, TypeError) as e:
-                logger.warning(
-                    f"Invalid spell cast message from player {player_id}: {e}",
-                    extra={"player_id": player_id, "data": data},
-                )
-                await self._handler.send_error(websocket, "Invalid spell cast format")
-                return
+    async def _route_guess(
+        self, websocket: WebSocket, message: GuessMessage, player_id: str
+    ) -> None:
+        if self._player_game_types.get(player_id, GAME_TYPE_HANGMAN) == GAME_TYPE_HANGMAN:
+            await self._hangman_processor.handle_guess(
+                player_id, message, self._matchmaking
+            )
 
-            if game_type == GAME_TYPE_DUELS:
-                await self._duels_processor.handle_spell_cast(
-                    player_id, spell_msg, self._matchmaking
-                )
-            return
+    async def _route_guess_batch(
+        self, websocket: WebSocket, message: GuessBatchMessage, player_id: str
+    ) -> None:
+        if self._player_game_types.get(player_id, GAME_TYPE_HANGMAN) == GAME_TYPE_HANGMAN:
+            await self._hangman_processor.handle_guess_batch(
+                player_id, message, self._matchmaking
+            )
 
-        await self._handler.send_error(websocket, "Unknown message type")
+    async def _route_station_resync(
+        self, websocket: WebSocket, message: StationResyncMessage, player_id: str
+    ) -> None:
+        if self._player_game_types.get(player_id, GAME_TYPE_HANGMAN) == GAME_TYPE_HANGMAN:
+            await self._hangman_processor.handle_station_resync(
+                player_id, self._matchmaking
+            )
+
+    async def _route_spell_cast(
+        self, websocket: WebSocket, message: SpellCastMessage, player_id: str
+    ) -> None:
+        if self._player_game_types.get(player_id) == GAME_TYPE_DUELS:
+            await self._duels_processor.handle_spell_cast(
+                player_id, message, self._matchmaking
+            )
 
     async def _handle_join(
         self, websocket: WebSocket, message: JoinMessage
@@ -174,7 +326,7 @@ class GameRouter:
 
             await self._send_joined_message(websocket, player, game)
             if not game:
-                await self._broadcast_waiting_status(player.id, game_type)
+                self._schedule_waiting_status(game_type)
         else:  # DUELS
             player = self._duels_processor.create_player(websocket, message.player_name)
             self._player_game_types[player.id] = game_type
@@ -198,8 +350,9 @@ class GameRouter:
                     player, self._matchmaking
                 )
 
-                await self._broadcast_waiting_status(player.id, game_type)
+                self._schedule_waiting_status(game_type)
 
+        self._matchmaking.report_join(game_type)
         logger.info(
             f"Player {player.name} joined {game_type} game ({game_mode} mode)",
             extra={
@@ -214,40 +367,66 @@ class GameRouter:
         return {"player_id": player.id}
 
     async def _send_joined_message(self, websocket: WebSocket, player, game) -> None:
-        """Send the joined confirmation message to a player."""
+        """Send the joined confirmation message to a player.
+
+        This also starts the player's resumable session; the joined frame is
+        the first in its sequence.
+        """
+        token = self._handler.open_session(player.id, websocket)
         await self._handler.send_to_websocket(
             websocket,
             JoinedMessage(
                 player_id=player.id,
                 game_id=game.id if game else "",
                 player_name=player.name,
+                resume_token=token,
             ),
         )
 
-    async def _broadcast_waiting_status(
-        self, new_player_id: str, game_type: str
-    ) -> None:
+    def _schedule_waiting_status(self, game_type: str) -> None:
+        """Schedule a queue status broadcast, merged with other recent joins.
+
+        The first join into a quiet queue is reported right away. After
+        that, at most one waiting update per game type is sent per window,
+        so a filling lobby costs one frame per queued player per window
+        instead of one per queued player per join.
+        """
+
+        async def broadcast() -> None:
+            await self._broadcast_waiting_status(game_type)
+
+        self._waiting_status.schedule(game_type, broadcast)
+
+    async def _broadcast_waiting_status(self, game_type: str) -> None:
+        """Send the current queue size to everyone in a game type's queue."""
         queue_size = self._matchmaking.get_queue_size(game_type)
-        waiting_msg = WaitingMessage(
-            players_in_queue=queue_size,
-            message=f"Esperando jugadores... ({queue_size} en cola)",
+        if not queue_size:
+            return
+        frame = EncodedFrame.encode(
+            WaitingMessage(
+                players_in_queue=queue_size,
+                message=f"Esperando jugadores... ({queue_size} en cola)",
+            )
         )
-
-        for queued_player in self._matchmaking.get_queued_players(game_type):
-            await self._handler.send_to_player(queued_player.id, waiting_msg)
+        await self._handler.broadcast_to_queue(frame, game_type)
 
     async def _handle_leave(self, player_id: str) -> None:
         game_type = self._player_game_types.get(player_id, GAME_TYPE_HANGMAN)
 
         self._matchmaking.remove_player(player_id)
-        self._matchmaking.remove_player_from_game(player_id)
 
+        # The processors look the player's game up in matchmaking, so the
+        # mapping is dropped only after they have removed the player
         if game_type == GAME_TYPE_HANGMAN:
             await self._hangman_processor.handle_leave(player_id, self._matchmaking)
         elif game_type == GAME_TYPE_DUELS:
             await self._duels_processor.handle_leave(player_id, self._matchmaking)
 
+        self._matchmaking.remove_player_from_game(player_id)
+
         self._player_game_types.pop(player_id, None)
+        self._rate_limiter.forget(player_id)
+        self._handler.end_session(player_id)
 
         logger.info(
             "Player left game", extra={"player_id": player_id, "game_type": game_type}
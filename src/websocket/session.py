@@ -0,0 +1,117 @@
+"""Resumable player sessions with a replay buffer of outbound frames."""
+
+import asyncio
+import secrets
+from collections import deque
+from itertools import islice
+from typing import Callable
+
+from config import SESSION_GRACE_SECONDS, SESSION_REPLAY_BUFFER_SIZE
+from websocket.frames import EncodedFrame
+
+
+class Session:
+    """Outbound frame sequence of one player, kept across reconnects.
+
+    Frames are numbered implicitly: the joined frame is 1 and each frame
+    recorded after it is one more. Clients count the frames they receive
+    (except pings) and send the last number back when resuming.
+    """
+
+    __slots__ = ("player_id", "token", "seq", "_frames", "_expiry")
+
+    def __init__(self, player_id: str, capacity: int, token_prefix: str = ""):
+        self.player_id = player_id
+        self.token = token_prefix + secrets.token_urlsafe(24)
+        self.seq = 0
+        self._frames: deque[EncodedFrame] = deque(maxlen=capacity)
+        self._expiry: asyncio.TimerHandle | None = None
+
+    @property
+    def detached(self) -> bool:
+        """Whether the session is waiting for its client to reconnect."""
+        return self._expiry is not None
+
+    def record(self, frame: EncodedFrame) -> None:
+        """Number a frame and keep it for replay."""
+        self.seq += 1
+        self._frames.append(frame)
+
+    def frames_after(self, last_seq: int) -> list[EncodedFrame] | None:
+        """Get the frames a client has not seen yet.
+
+        Returns:
+            The frames numbered after last_seq, or None if some of them have
+            already been dropped from the buffer.
+        """
+        missed = self.seq - last_seq
+        if missed < 0 or missed > len(self._frames):
+            return None
+        return list(islice(self._frames, len(self._frames) - missed, None))
+
+
+class SessionStore:
+    """Sessions by player and resume token, with a grace timer on detach.
+
+    Tokens start with token_prefix, which lets a front layer tell which
+    shard holds a session.
+    """
+
+    def __init__(
+        self,
+        capacity: int = SESSION_REPLAY_BUFFER_SIZE,
+        grace_seconds: float = SESSION_GRACE_SECONDS,
+        token_prefix: str = "",
+    ):
+        self._capacity = capacity
+        self._grace_seconds = grace_seconds
+        self._token_prefix = token_prefix
+        self._sessions: dict[str, Session] = {}
+        self._tokens: dict[str, Session] = {}
+
+    def open(self, player_id: str) -> Session:
+        """Start a new session for a player, replacing any previous one."""
+        self.close(player_id)
+        session = Session(player_id, self._capacity, self._token_prefix)
+        self._sessions[player_id] = session
+        self._tokens[session.token] = session
+        return session
+
+    def get(self, player_id: str) -> Session | None:
+        return self._sessions.get(player_id)
+
+    def by_token(self, token: str) -> Session | None:
+        return self._tokens.get(token)
+
+    def detach(self, player_id: str, on_expire: Callable[[], None]) -> bool:
+        """Keep a player's session for the grace window after a disconnect.
+
+        Returns:
+            True if the player had a session, False otherwise
+        """
+        session = self._sessions.get(player_id)
+        if session is None:
+            return False
+        if session._expiry is not None:
+            session._expiry.cancel()
+        session._expiry = asyncio.get_running_loop().call_later(
+            self._grace_seconds, on_expire
+        )
+        return True
+
+    def attach(self, session: Session) -> None:
+        """Cancel the grace timer of a resumed session."""
+        if session._expiry is not None:
+            session._expiry.cancel()
+            session._expiry = None
+
+    def close(self, player_id: str) -> None:
+        """End a player's session."""
+        session = self._sessions.pop(player_id, None)
+        if session is None:
+            return
+        self._tokens.pop(session.token, None)
+        self.attach(session)
+
+    def __len__(self) -> int:
+        return len(self._sessions)
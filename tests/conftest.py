@@ -0,0 +1,64 @@
+"""Shared fixtures."""
+
+import asyncio
+import json
+from types import SimpleNamespace
+from typing import Callable
+from unittest.mock import AsyncMock
+
+import pytest
+
+import games.duels.manager as duels_manager_module
+import games.hangman.manager as hangman_manager_module
+import services.lifecycle as lifecycle_module
+import services.matchmaking as matchmaking_module
+import websocket.router as router_module
+from websocket.handler import WebSocketHandler
+
+
+class FakeWebSocket:
+    """Minimal WebSocket stand-in that records sent frames.
+
+    A delay makes every send wait first; fail makes it raise.
+    """
+
+    def __init__(self, delay: float = 0.0, fail: bool = False):
+        self.client_state = SimpleNamespace(name="CONNECTED")
+        self.delay = delay
+        self.fail = fail
+        self.sent: list[str] = []
+        self.close = AsyncMock()
+
+    @property
+    def messages(self) -> list[dict]:
+        """Sent frames, decoded."""
+        return [json.loads(frame) for frame in self.sent]
+
+    async def send_text(self, data: str) -> None:
+        if self.delay:
+            await asyncio.sleep(self.delay)
+        if self.fail:
+            raise RuntimeError("socket closed")
+        self.sent.append(data)
+
+
+@pytest.fixture
+def make_websocket() -> type[FakeWebSocket]:
+    """Build fake client WebSockets that record the frames sent to them."""
+    return FakeWebSocket
+
+
+@pytest.fixture
+def make_isolated_handler(monkeypatch) -> Callable[[], WebSocketHandler]:
+    """Build WebSocketHandlers whose router uses fresh global services.
+
+    Matchmaking, the game managers and the game lifecycle are reset (a
+    test may install its own lifecycle before building the handler), and
+    Hangman games start 10 ms after their second player joins.
+    """
+    monkeypatch.setattr(matchmaking_module, "_matchmaking", None)
+    monkeypatch.setattr(hangman_manager_module, "_hangman_manager", None)
+    monkeypatch.setattr(duels_manager_module, "_duels_manager", None)
+    monkeypatch.setattr(lifecycle_module, "_game_lifecycle", None)
+    monkeypatch.setattr(router_module, "MATCHMAKING_TIMEOUT_SECONDS", 0.01)
+    return WebSocketHandler
@@ -0,0 +1,249 @@
+"""Tests for concurrent broadcast fan-out."""
+
+import asyncio
+import logging
+import time
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from games.hangman.models import HangmanGame, HangmanPlayer
+from models.messages import ErrorMessage
+from services.matchmaking import Matchmaking
+from services.metrics import Metrics, get_metrics
+from websocket.frames import EncodedFrame
+from websocket.handler import WebSocketHandler
+from websocket.router import GameRouter
+
+
+def make_game(handler: WebSocketHandler, sockets: list) -> HangmanGame:
+    game = HangmanGame.create(["WORD"] * 10)
+    for i, ws in enumerate(sockets):
+        player = HangmanPlayer.create(f"P{i}", ws)
+        game.add_player(player)
+        handler.register_connection(player.id, ws)
+    return game
+
+
+class TestBroadcast:
+    """Tests for WebSocketHandler broadcasts."""
+
+    @pytest.mark.asyncio
+    async def test_broadcast_reaches_every_player(self, make_websocket):
+        handler = WebSocketHandler()
+        sockets = [make_websocket() for _ in range(5)]
+        game = make_game(handler, sockets)
+
+        result = await handler.broadcast_to_game(game, ErrorMessage(message="hi"))
+        await handler.flush()
+
+        assert result.ok
+        assert len(result.sent) == 5
+        assert all(len(ws.sent) == 1 for ws in sockets)
+
+    @pytest.mark.asyncio
+    async def test_slow_socket_does_not_delay_others(self, make_websocket):
+        handler = WebSocketHandler(stall_after=0.01, max_lag=5.0)
+        slow = make_websocket(delay=0.5)
+        fast = [make_websocket() for _ in range(4)]
+        game = make_game(handler, [slow, *fast])
+
+        start = time.monotonic()
+        result = await handler.broadcast_to_game(game, ErrorMessage(message="hi"))
+        await asyncio.gather(*(handler._sockets[ws].flush() for ws in fast))
+        elapsed = time.monotonic() - start
+
+        assert elapsed < 0.25
+        assert result.ok
+        assert all(len(ws.sent) == 1 for ws in fast)
+        assert slow.sent == []
+
+    @pytest.mark.asyncio
+    async def test_broadcast_except_reports_failed_sends(self, make_websocket):
+        handler = WebSocketHandler()
+        broken = make_websocket(fail=True)
+        sockets = [make_websocket(), make_websocket(), broken]
+        game = make_game(handler, sockets)
+        players = list(game.players.values())
+
+        await handler.broadcast_to_game_except(
+            game, ErrorMessage(message="first"), except_player_id=players[0].id
+        )
+        await handler.flush()
+        result = await handler.broadcast_to_game_except(
+            game, ErrorMessage(message="second"), except_player_id=players[0].id
+        )
+
+        assert players[0].id not in result.sent + result.failed
+        assert result.failed == [players[2].id]
+        assert sockets[0].sent == []
+
+    @pytest.mark.asyncio
+    async def test_broadcast_encodes_message_once(self, make_websocket):
+        handler = WebSocketHandler()
+        sockets = [make_websocket() for _ in range(5)]
+        game = make_game(handler, sockets)
+        metrics = get_metrics()
+        metrics.reset()
+
+        await handler.broadcast_to_game(game, ErrorMessage(message="hi"))
+        await handler.flush()
+
+        assert metrics.value("ws_serializations") == 1
+        assert metrics.value("ws_serializations_saved") == 4
+        assert len({ws.sent[0] for ws in sockets}) == 1
+
+    @pytest.mark.asyncio
+    async def test_pre_encoded_frame_is_sent_as_is(self, make_websocket):
+        handler = WebSocketHandler()
+        sockets = [make_websocket() for _ in range(3)]
+        game = make_game(handler, sockets)
+        frame = EncodedFrame.encode(ErrorMessage(message="hi"))
+        metrics = get_metrics()
+        metrics.reset()
+
+        await handler.broadcast_to_game(game, frame)
+        await handler.flush()
+
+        assert metrics.value("ws_serializations") == 0
+        assert metrics.value("ws_serializations_saved") == 3
+        assert all(ws.sent == [frame.text] for ws in sockets)
+
+
+class TestWaitingStatus:
+    """Tests for throttled queue status updates."""
+
+    def make_router(self, window: float) -> tuple[WebSocketHandler, GameRouter]:
+        handler = WebSocketHandler()
+        router = GameRouter(handler, waiting_status_window=window)
+        matchmaking = Matchmaking()
+        matchmaking.register_game_type("test", 2, 50, 60, MagicMock(), AsyncMock())
+        handler._matchmaking = router._matchmaking = matchmaking
+        return handler, router
+
+    def join(self, handler: WebSocketHandler, router: GameRouter, ws) -> None:
+        player = HangmanPlayer.create("P", ws)
+        handler.register_connection(player.id, ws)
+        router._matchmaking.enqueue_player(player, "test")
+        router._schedule_waiting_status("test")
+
+    @pytest.mark.asyncio
+    async def test_join_storm_sends_one_update_per_window(self, make_websocket):
+        handler, router = self.make_router(window=0.05)
+        sockets = [make_websocket() for _ in range(10)]
+
+        for ws in sockets:
+            self.join(handler, router, ws)
+        await asyncio.sleep(0.1)
+        await handler.flush()
+
+        assert all(len(ws.sent) == 1 for ws in sockets)
+        assert sockets[0].messages[0]["players_in_queue"] == 10
+        assert len({ws.sent[0] for ws in sockets}) == 1
+
+    @pytest.mark.asyncio
+    async def test_first_update_is_sent_without_waiting(self, make_websocket):
+        handler, router = self.make_router(window=60)
+        ws = make_websocket()
+
+        self.join(handler, router, ws)
+        await asyncio.sleep(0)
+        await handler.flush()
+
+        assert [message["players_in_queue"] for message in ws.messages] == [1]
+        router._waiting_status.cancel("test")
+
+    @pytest.mark.asyncio
+    async def test_later_joins_are_merged_until_the_window_closes(
+        self, make_websocket
+    ):
+        handler, router = self.make_router(window=0.2)
+        first = make_websocket()
+        self.join(handler, router, first)
+        await asyncio.sleep(0)
+
+        for _ in range(4):
+            self.join(handler, router, make_websocket())
+        await handler.flush()
+        assert len(first.sent) == 1
+
+        await asyncio.sleep(0.45)
+        await handler.flush()
+        assert [message["players_in_queue"] for message in first.messages] == [1, 5]
+        assert not router._waiting_status.is_pending("test")
+
+
+class TestSlowConsumers:
+    """Tests for per-connection outbound queues and eviction."""
+
+    @pytest.mark.asyncio
+    async def test_queue_overflow_evicts_client(self, make_websocket):
+        handler = WebSocketHandler(max_queue=2)
+        slow = make_websocket(delay=1.0)
+        game = make_game(handler, [slow])
+        metrics = get_metrics()
+        metrics.reset()
+
+        results = [
+            await handler.broadcast_to_game(game, ErrorMessage(message=str(i)))
+            for i in range(4)
+        ]
+        await asyncio.sleep(0.01)
+
+        assert results[-1].failed
+        assert metrics.value("ws_evictions_queue_full") == 1
+        slow.close.assert_awaited_once()
+        assert not handler.is_connected(next(iter(game.players)))
+
+    @pytest.mark.asyncio
+    async def test_lagging_client_is_evicted_after_stall(self, make_websocket):
+        handler = WebSocketHandler(stall_after=0.01, max_lag=0.05)
+        stalled = make_websocket(delay=1.0)
+        game = make_game(handler, [stalled])
+        metrics = get_metrics()
+        metrics.reset()
+
+        await handler.broadcast_to_game(game, ErrorMessage(message="hi"))
+        await asyncio.sleep(0.1)
+
+        assert metrics.value("ws_send_stalls") == 1
+        assert metrics.value("ws_evictions_lagging") == 1
+        assert not handler.is_connected(next(iter(game.players)))
+
+    @pytest.mark.asyncio
+    async def test_failed_close_of_evicted_socket_is_logged(self, make_websocket, caplog):
+        handler = WebSocketHandler()
+        broken = make_websocket()
+        broken.close = AsyncMock(side_effect=RuntimeError("already gone"))
+        make_game(handler, [broken])
+        connection = handler._sockets[broken]
+
+        with caplog.at_level(logging.DEBUG, logger="websocket.connection"):
+            connection.evict("queue_full")
+            await connection._closer
+
+        assert connection._closer.done() and connection._closer.exception() is None
+        assert "already gone" in caplog.text
+
+
+class TestMetrics:
+    """Tests for the Metrics counters."""
+
+    def test_rate_over_window(self):
+        now = [0.0]
+        metrics = Metrics(window_seconds=10, clock=lambda: now[0])
+        for second in range(1, 11):
+            now[0] = float(second)
+            metrics.increment("frames", 5)
+
+        assert metrics.value("frames") == 50
+        assert metrics.rate("frames") == pytest.approx(5.0)
+
+    def test_old_buckets_leave_the_window(self):
+        now = [0.0]
+        metrics = Metrics(window_seconds=10, clock=lambda: now[0])
+        metrics.increment("frames", 100)
+        now[0] = 20.0
+
+        assert metrics.rate("frames") == 0.0
+        assert metrics.value("frames") == 100
@@ -0,0 +1,109 @@
+"""Tests for negotiated wire codecs."""
+
+import asyncio
+import json
+from types import SimpleNamespace
+
+import pytest
+
+from games.hangman.messages import GameStartMessage, StationDeltaMessage
+from services.codec import JSON_CODEC, CodecError, get_codec, negotiate_codec
+from websocket.frames import EncodedFrame
+from websocket.handler import WebSocketHandler
+
+msgpack = pytest.importorskip("msgpack")
+MSGPACK = get_codec("quodpot.msgpack")
+
+
+class ScriptedWebSocket:
+    """WebSocket stand-in that replays client frames and records replies."""
+
+    def __init__(self, frames: list[dict], subprotocols: list[str] | None = None):
+        self.scope = {"subprotocols": subprotocols or []}
+        self.client_state = SimpleNamespace(name="CONNECTED")
+        self.accepted_subprotocol: str | None = None
+        self.sent: list[str | bytes] = []
+        self._incoming = asyncio.Queue()
+        for frame in frames:
+            self._incoming.put_nowait(frame)
+
+    async def accept(self, subprotocol: str | None = None) -> None:
+        self.accepted_subprotocol = subprotocol
+
+    async def receive(self) -> dict:
+        if self._incoming.empty():
+            await asyncio.sleep(0.01)
+            return {"type": "websocket.disconnect", "code": 1000}
+        return self._incoming.get_nowait()
+
+    async def send_text(self, data: str) -> None:
+        self.sent.append(data)
+
+    async def send_bytes(self, data: bytes) -> None:
+        self.sent.append(data)
+
+
+class TestCodecs:
+    """Tests for codec encoding and negotiation."""
+
+    @pytest.mark.parametrize("codec", [JSON_CODEC, MSGPACK], ids=lambda c: c.name)
+    def test_round_trip(self, codec):
+        message = StationDeltaMessage(
+            seq=3, moves=[{"player_id": "abc", "from": 1, "to": 2}]
+        )
+        data = codec.encode(message.to_dict())
+
+        assert isinstance(data, bytes) == codec.binary
+        assert codec.decode(data) == message.to_dict()
+
+    @pytest.mark.parametrize("codec", [JSON_CODEC, MSGPACK], ids=lambda c: c.name)
+    def test_invalid_frame_raises_codec_error(self, codec):
+        with pytest.raises(CodecError):
+            codec.decode(b"\xc1\xff" if codec.binary else "{not json")
+
+    def test_negotiation_prefers_client_order(self):
+        codec, subprotocol = negotiate_codec(["unknown", "quodpot.msgpack", "quodpot.json"])
+        assert codec is MSGPACK
+        assert subprotocol == "quodpot.msgpack"
+
+    def test_negotiation_defaults_to_json_without_echo(self):
+        codec, subprotocol = negotiate_codec(["graphql-ws"])
+        assert codec is JSON_CODEC
+        assert subprotocol is None
+
+    def test_frame_caches_each_codec_encoding(self):
+        frame = EncodedFrame.encode(
+            GameStartMessage(players=[{"id": "1", "name": "Ana"}], total_stations=10)
+        )
+
+        assert frame.data_for(MSGPACK) is frame.data_for(MSGPACK)
+        assert json.loads(frame.text) == msgpack.unpackb(frame.data_for(MSGPACK))
+
+
+class TestHandlerNegotiation:
+    """Tests for codec negotiation in WebSocketHandler."""
+
+    @pytest.mark.asyncio
+    async def test_msgpack_client_gets_binary_frames(self):
+        handler = WebSocketHandler()
+        join = {"type": "join", "player_name": "Ana", "game_type": "duels"}
+        ws = ScriptedWebSocket(
+            [{"type": "websocket.receive", "bytes": msgpack.packb(join)}],
+            subprotocols=["quodpot.msgpack"],
+        )
+
+        await handler.handle_connection(ws)
+
+        assert ws.accepted_subprotocol == "quodpot.msgpack"
+        assert ws.sent and all(isinstance(frame, bytes) for frame in ws.sent)
+        assert msgpack.unpackb(ws.sent[0])["type"] == "joined"
+
+    @pytest.mark.asyncio
+    async def test_invalid_frame_reports_error(self):
+        handler = WebSocketHandler()
+        ws = ScriptedWebSocket([{"type": "websocket.receive", "text": "{oops"}])
+
+        await handler.handle_connection(ws)
+
+        assert ws.accepted_subprotocol is None
+        assert json.loads(ws.sent[0]) == {"type": "error", "message": "Invalid JSON"}
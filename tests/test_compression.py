@@ -0,0 +1,78 @@
+"""Tests for deflate compression of outbound frames."""
+
+import json
+import zlib
+
+import pytest
+
+from games.hangman.messages import GameStartMessage, GuessMessage
+from services.codec import (
+    FLAG_DEFLATE,
+    FLAG_RAW,
+    JSON_CODEC,
+    CodecError,
+    DeflateCodec,
+    compression_stats,
+    negotiate_codec,
+)
+from services.metrics import Metrics
+
+
+def large_payload() -> dict:
+    players = [{"id": f"player-{i:03d}", "name": f"Jugador{i:02d}"} for i in range(50)]
+    return GameStartMessage(players=players, total_stations=10).to_dict()
+
+
+class TestDeflateCodec:
+    """Tests for DeflateCodec."""
+
+    def test_small_frames_are_sent_raw(self):
+        metrics = Metrics()
+        codec = DeflateCodec(JSON_CODEC, threshold=1024, metrics=metrics)
+        payload = GuessMessage(letter="A").model_dump()
+
+        data = codec.encode(payload)
+
+        assert data[0] == FLAG_RAW
+        assert json.loads(data[1:]) == payload
+        assert compression_stats(metrics) == {}
+
+    def test_large_frames_are_compressed(self):
+        codec = DeflateCodec(JSON_CODEC, threshold=1024, metrics=Metrics())
+        payload = large_payload()
+
+        data = codec.encode(payload)
+
+        assert data[0] == FLAG_DEFLATE
+        assert len(data) < len(JSON_CODEC.encode(payload))
+        assert codec.decode(data) == payload
+
+    def test_records_ratio_and_cpu_per_message_type(self):
+        metrics = Metrics()
+        codec = DeflateCodec(JSON_CODEC, threshold=1024, level=9, metrics=metrics)
+
+        codec.encode(large_payload())
+        codec.encode(large_payload())
+
+        stats = compression_stats(metrics)["game_start"]
+        assert stats["frames"] == 2
+        assert stats["bytes_in"] == 2 * len(JSON_CODEC.encode(large_payload()))
+        assert 0 < stats["ratio"] < 0.5
+
+    def test_rejects_oversized_inflation(self):
+        codec = DeflateCodec(JSON_CODEC)
+        bomb = bytes((FLAG_DEFLATE,)) + zlib.compress(b" " * (4 << 20))
+
+        with pytest.raises(CodecError):
+            codec.decode(bomb)
+
+    def test_rejects_unknown_flag(self):
+        with pytest.raises(CodecError):
+            DeflateCodec(JSON_CODEC).decode(b"\x07{}")
+
+    def test_negotiated_with_suffix(self):
+        codec, subprotocol = negotiate_codec(["quodpot.json+deflate"])
+
+        assert isinstance(codec, DeflateCodec)
+        assert codec.inner is JSON_CODEC
+        assert subprotocol == "quodpot.json+deflate"
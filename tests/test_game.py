@@ -1,11 +1,14 @@
 """Tests for game logic."""
 
-from unittest.mock import AsyncMock, MagicMock
+import asyncio
+from unittest.mock import MagicMock
 
 import pytest
 
-from config import MAX_ATTEMPTS_PER_WORD, TOTAL_STATIONS
-from games.hangman.manager import HangmanGameManager
+from config import MAX_ATTEMPTS_PER_WORD, MAX_PLAYERS_PER_GAME, TOTAL_STATIONS
+from games.hangman.joinable import JoinPolicy
+from games.hangman.manager import HangmanGameManager, get_hangman_manager
+from games.hangman.messages import CorrectGuessMessage, StationUpdateMessage
 from games.hangman.models import HangmanGame, HangmanPlayer, Station
 from models.base import GameStatus
 from services.word_bank import WordBank
@@ -62,6 +65,49 @@ class TestStation:
         station = Station(word="CASA", attempts_left=1)
         assert station.is_failed is False
 
+    def test_revealed_follows_guesses(self):
+        station = Station(word="Casa")
+        station.guess("a")
+        assert station.revealed == "_ a _ a"
+        station.guess("x")
+        station.guess("c")
+        assert station.revealed == "C a _ a"
+        assert station.is_complete is False
+        station.guess("S")
+        assert station.revealed == "C a s a"
+        assert station.is_complete is True
+
+    def test_setting_guessed_letters_replaces_progress(self):
+        station = Station(word="CASA")
+        station.guess("C")
+        station.guessed_letters = {"S"}
+        assert station.revealed == "_ _ S _"
+        assert station.guessed_letters == {"S"}
+
+    def test_positions_are_shared_by_stations_on_a_word(self):
+        first, second = Station(word="CASA"), Station(word="CASA")
+        assert first._positions is second._positions
+        assert first._positions["A"] == ((2, "A"), (6, "A"))
+
+    def test_revealed_changes_only_on_a_correct_guess(self):
+        station = Station(word="CASA")
+        station.guess("A")
+        revealed = station.revealed
+
+        station.guess("X")
+        station.guess("A")
+
+        assert station.revealed is revealed
+
+    def test_guessed_letters_is_a_live_read_only_view(self):
+        station = Station(word="CASA")
+        letters = station.guessed_letters
+
+        station.guess("A")
+
+        assert set(letters) == {"A"}
+        assert not hasattr(letters, "add")
+
 
 class TestPlayer:
     """Tests for the HangmanPlayer class."""
@@ -135,8 +181,8 @@ class TestGameManager:
         first_letter = game.words[0][0]
         result = manager.process_guess(game, player, first_letter)
 
-        assert result["correct"] is True
-        assert result["letter"] == first_letter
+        assert result.correct is True
+        assert result.letter == first_letter
 
     def test_process_wrong_guess(self):
         manager = HangmanGameManager()
@@ -150,8 +196,8 @@ class TestGameManager:
         wrong_letter = "X" if "X" not in word else "Z"
         result = manager.process_guess(game, player, wrong_letter)
 
-        assert result["correct"] is False
-        assert result["attempts_left"] == MAX_ATTEMPTS_PER_WORD - 1
+        assert result.correct is False
+        assert result.attempts_left == MAX_ATTEMPTS_PER_WORD - 1
 
     def test_station_complete_advances_player(self):
         manager = HangmanGameManager()
@@ -166,7 +212,7 @@ class TestGameManager:
         for letter in unique_letters:
             result = manager.process_guess(game, player, letter)
 
-        assert result["station_complete"] is True
+        assert result.station_complete is True
         assert player.current_station == 2
 
     def test_station_failed_resets_player(self):
@@ -191,9 +237,212 @@ class TestGameManager:
         for letter in wrong_letters[:MAX_ATTEMPTS_PER_WORD]:
             result = manager.process_guess(game, player, letter)
 
-        assert result["station_failed"] is True
+        assert result.station_failed is True
         assert player.current_station == 1
 
+    def test_guess_result_builds_the_guess_message(self):
+        manager = HangmanGameManager()
+        game = manager.create_game()
+        player = HangmanPlayer.create("Test", MagicMock())
+        game.add_player(player)
+        manager.start_game(game)
+        letter = game.words[0][0]
+
+        right = manager.process_guess(game, player, letter)
+        wrong = manager.process_guess(game, player, "1")
+
+        assert right.to_message().to_dict() == CorrectGuessMessage(
+            letter=letter, revealed=player.station_state.revealed
+        ).to_dict()
+        assert wrong.error == "Invalid letter"
+        again = manager.process_guess(game, player, "1")
+        assert again.error == "Invalid letter"
+        assert again is not wrong
+        assert manager.station_update(player).to_dict() == StationUpdateMessage(
+            station=1,
+            revealed=player.station_state.revealed,
+            attempts_left=MAX_ATTEMPTS_PER_WORD,
+        ).to_dict()
+
+    def test_process_guesses_applies_letters_in_order(self):
+        manager = HangmanGameManager()
+        game = manager.create_game()
+        player = HangmanPlayer.create("Test", MagicMock())
+        game.add_player(player)
+        manager.start_game(game)
+
+        word = game.words[0]
+        wrong_letter = "X" if "X" not in word else "Z"
+        result = manager.process_guesses(game, player, [word[0], wrong_letter])
+
+        assert result.guesses == [
+            {"letter": word[0], "correct": True},
+            {"letter": wrong_letter, "correct": False},
+        ]
+        assert result.result.attempts_left == MAX_ATTEMPTS_PER_WORD - 1
+        assert player.station_state.revealed == result.result.revealed
+
+    def test_process_guesses_stops_at_station_boundary(self):
+        manager = HangmanGameManager()
+        game = manager.create_game()
+        player = HangmanPlayer.create("Test", MagicMock())
+        game.add_player(player)
+        manager.start_game(game)
+
+        letters = sorted(set(game.words[0].upper()))
+        result = manager.process_guesses(game, player, [*letters, "Q", "W"])
+
+        assert result.result.station_complete is True
+        assert len(result.guesses) == len(letters)
+        assert player.current_station == 2
+        assert player.station_state.guessed_letters == set()
+
+    def test_process_guesses_reports_error_on_first_letter(self):
+        manager = HangmanGameManager()
+        game = manager.create_game()
+        player = HangmanPlayer.create("Test", MagicMock())
+        game.add_player(player)
+        manager.start_game(game)
+
+        result = manager.process_guesses(game, player, ["1", "A"])
+
+        assert result.error == "Invalid letter"
+        assert result.guesses == []
+
+
+class TestJoinableGames:
+    """Tests for late-join placement."""
+
+    def make_manager(self, policy: JoinPolicy = JoinPolicy.FILL) -> HangmanGameManager:
+        return HangmanGameManager(join_policy=policy)
+
+    def start_game(self, manager: HangmanGameManager, players: int) -> HangmanGame:
+        game = manager.create_game()
+        for i in range(players):
+            game.add_player(HangmanPlayer.create(f"P{i}", MagicMock()))
+        manager.start_game(game)
+        return game
+
+    def test_no_joinable_game_before_any_start(self):
+        manager = self.make_manager()
+        manager.create_game()
+        assert manager.find_joinable_game() is None
+
+    def test_fill_picks_the_fullest_game(self):
+        manager = self.make_manager(JoinPolicy.FILL)
+        self.start_game(manager, 2)
+        fullest = self.start_game(manager, 5)
+        self.start_game(manager, 3)
+
+        assert manager.find_joinable_game() is fullest
+
+    def test_balance_picks_the_emptiest_game(self):
+        manager = self.make_manager(JoinPolicy.BALANCE)
+        self.start_game(manager, 4)
+        emptiest = self.start_game(manager, 2)
+
+        assert manager.find_joinable_game() is emptiest
+
+    def test_full_and_finished_games_are_skipped(self):
+        manager = self.make_manager()
+        self.start_game(manager, MAX_PLAYERS_PER_GAME)
+        finished = self.start_game(manager, 3)
+        open_game = self.start_game(manager, 2)
+
+        player = next(iter(finished.players.values()))
+        for station in range(TOTAL_STATIONS):
+            for letter in set(finished.words[station].upper()):
+                manager.process_guess(finished, player, letter)
+
+        assert finished.status == GameStatus.FINISHED
+        assert manager.find_joinable_game() is open_game
+
+    def test_index_follows_joins_and_leaves(self):
+        manager = self.make_manager()
+        small = self.start_game(manager, 2)
+        large = self.start_game(manager, 3)
+
+        manager.add_player_to_active_game(small, HangmanPlayer.create("X", MagicMock()))
+        manager.add_player_to_active_game(small, HangmanPlayer.create("Y", MagicMock()))
+        assert manager.find_joinable_game() is small
+
+        for player_id in list(small.players)[:3]:
+            small.remove_player(player_id)
+            manager.update_joinable(small)
+        assert manager.find_joinable_game() is large
+
+    def test_stale_entries_are_refiled_on_lookup(self):
+        manager = self.make_manager()
+        game = self.start_game(manager, 2)
+        for player_id in game.players:
+            game.remove_player(player_id)
+
+        assert manager.find_joinable_game() is None
+
+    async def test_games_left_through_the_router_leave_the_index(
+        self, make_isolated_handler, make_websocket
+    ):
+        handler = make_isolated_handler()
+        router = handler._game_router
+        player_ids = []
+        for name in ("Ana", "Luis"):
+            joined = await router.process(
+                make_websocket(), {"type": "join", "player_name": name}, None
+            )
+            player_ids.append(joined["player_id"])
+        await asyncio.sleep(0.05)
+        manager = get_hangman_manager()
+        (game,) = manager.games
+        assert manager.find_joinable_game() is game
+
+        await router.process(None, {"type": "leave"}, player_ids[0])
+        assert manager._joinable._levels == {game.id: 1}
+
+        await router.process(None, {"type": "leave"}, player_ids[1])
+        await handler.flush()
+        assert len(manager._joinable) == 0
+        assert manager.find_joinable_game() is None
+
+
+class TestGamePool:
+    """Tests for the pre-built game pool."""
+
+    def test_create_game_takes_pooled_games(self):
+        manager = HangmanGameManager(pool_size=2)
+        manager.fill_pool()
+        pooled = list(manager._pool._games)
+        assert manager.games == []
+
+        first = manager.create_game()
+        manager.create_game()
+        manager.create_game()
+
+        assert first is pooled[0]
+        assert len(first.words) == TOTAL_STATIONS
+        assert len(manager.games) == 3
+        stats = manager.pool_stats()
+        assert (stats["hits"], stats["misses"], stats["available"]) == (2, 1, 0)
+
+    @pytest.mark.asyncio
+    async def test_pool_refills_in_background(self):
+        manager = HangmanGameManager(pool_size=3)
+
+        manager.create_game()
+        assert manager.pool_stats()["available"] == 0
+        await manager._pool._refill_task
+
+        assert manager.pool_stats()["available"] == 3
+        assert manager.games[0] not in manager._pool._games
+
+    def test_zero_size_disables_pool(self):
+        manager = HangmanGameManager(pool_size=0)
+        manager.fill_pool()
+        manager.create_game()
+
+        assert manager.pool_stats() == {
+            "size": 0, "available": 0, "hits": 0, "misses": 0
+        }
+
 
 class TestWordBank:
     """Tests for the WordBank class."""
@@ -0,0 +1,221 @@
+"""Tests for Hangman event processing."""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from games.hangman.events import HangmanEventProcessor
+from games.hangman.manager import HangmanGameManager
+from games.hangman.messages import GuessBatchMessage
+from games.hangman.models import HangmanPlayer
+from games.hangman.station_status import StationTracker
+from models.base import GameStatus
+
+
+def make_handler() -> MagicMock:
+    handler = MagicMock()
+    handler.broadcast_to_game = AsyncMock()
+    handler.broadcast_to_game_except = AsyncMock()
+    handler.send_to_player = AsyncMock()
+    handler.send_to_websocket = AsyncMock()
+    return handler
+
+
+def make_game(players: int = 3):
+    manager = HangmanGameManager()
+    game = manager.create_game()
+    for i in range(players):
+        game.add_player(HangmanPlayer.create(f"P{i}", MagicMock()))
+    manager.start_game(game)
+    return game
+
+
+def sent_types(mock: AsyncMock) -> list[str]:
+    return [call.args[1].type for call in mock.await_args_list]
+
+
+def track(processor: HangmanEventProcessor, game) -> StationTracker:
+    tracker = StationTracker(game)
+    processor._station_trackers[game.id] = tracker
+    return tracker
+
+
+def move(game, index: int, station: int) -> None:
+    list(game.players.values())[index].current_station = station
+
+
+class TestStationStatusCoalescing:
+    """Tests for coalesced station delta broadcasts."""
+
+    @pytest.mark.asyncio
+    async def test_changes_within_window_are_merged(self):
+        handler = make_handler()
+        processor = HangmanEventProcessor(handler, station_status_window=0.02)
+        game = make_game()
+        track(processor, game)
+
+        for station in range(2, 7):
+            move(game, 0, station)
+            processor._schedule_station_status(game)
+        await asyncio.sleep(0.05)
+
+        assert sent_types(handler.broadcast_to_game) == ["station_delta"]
+        delta = handler.broadcast_to_game.await_args.args[1]
+        assert delta.seq == 1
+        assert [(m["from"], m["to"]) for m in delta.moves] == [(1, 6)]
+
+    @pytest.mark.asyncio
+    async def test_changes_in_separate_windows_are_sent_separately(self):
+        handler = make_handler()
+        processor = HangmanEventProcessor(handler, station_status_window=0.01)
+        game = make_game()
+        track(processor, game)
+
+        move(game, 0, 2)
+        processor._schedule_station_status(game)
+        await asyncio.sleep(0.03)
+        move(game, 1, 2)
+        processor._schedule_station_status(game)
+        await asyncio.sleep(0.03)
+
+        sent = [call.args[1] for call in handler.broadcast_to_game.await_args_list]
+        assert [msg.seq for msg in sent] == [1, 2]
+
+    @pytest.mark.asyncio
+    async def test_leave_schedules_a_single_broadcast(self):
+        handler = make_handler()
+        processor = HangmanEventProcessor(handler, station_status_window=0.01)
+        game = make_game()
+        track(processor, game)
+        leaver = next(iter(game.players.values()))
+        matchmaking = MagicMock()
+        matchmaking.get_player_game.return_value = game.id
+
+        with pytest.MonkeyPatch.context() as mp:
+            mp.setattr(
+                "games.hangman.events.get_hangman_manager",
+                lambda: MagicMock(get_game=lambda game_id: game),
+            )
+            await processor.handle_leave(leaver.id, matchmaking)
+        await asyncio.sleep(0.03)
+
+        assert sent_types(handler.broadcast_to_game) == ["station_delta"]
+        delta = handler.broadcast_to_game.await_args.args[1]
+        assert delta.moves == [{"player_id": leaver.id, "from": 1, "to": 0}]
+
+    @pytest.mark.asyncio
+    async def test_game_over_is_sent_immediately(self):
+        handler = make_handler()
+        processor = HangmanEventProcessor(handler, station_status_window=0.05)
+        manager = HangmanGameManager()
+        game = manager.create_game()
+        winner = HangmanPlayer.create("Winner", MagicMock())
+        game.add_player(winner)
+        game.add_player(HangmanPlayer.create("Other", MagicMock()))
+        manager.start_game(game)
+        winner.current_station = len(game.words)
+        manager._init_player_station(game, winner)
+        matchmaking = MagicMock()
+        matchmaking.get_player_game.return_value = game.id
+        track(processor, game)
+        move(game, 1, 3)
+        processor._schedule_station_status(game)
+
+        with pytest.MonkeyPatch.context() as mp:
+            mp.setattr("games.hangman.events.get_hangman_manager", lambda: manager)
+            manager._games[game.id] = game
+            for letter in set(game.words[-1]):
+                await processor.handle_guess(
+                    winner.id, MagicMock(letter=letter), matchmaking
+                )
+
+        assert game.status == GameStatus.FINISHED
+        assert sent_types(handler.broadcast_to_game) == ["game_over"]
+        await asyncio.sleep(0.08)
+        assert sent_types(handler.broadcast_to_game) == ["game_over"]
+
+
+class TestGuessBatch:
+    """Tests for batched guesses."""
+
+    @pytest.mark.asyncio
+    async def test_batch_sends_one_result_frame(self):
+        handler = make_handler()
+        processor = HangmanEventProcessor(handler)
+        manager = HangmanGameManager()
+        game = manager.create_game()
+        player = HangmanPlayer.create("P0", MagicMock())
+        game.add_player(player)
+        manager.start_game(game)
+        matchmaking = MagicMock()
+        matchmaking.get_player_game.return_value = game.id
+        word = game.words[0]
+        wrong = [c for c in "XZQJKW" if c not in word][:2]
+
+        with pytest.MonkeyPatch.context() as mp:
+            mp.setattr("games.hangman.events.get_hangman_manager", lambda: manager)
+            manager._games[game.id] = game
+            await processor.handle_guess_batch(
+                player.id, GuessBatchMessage(letters=[word[0], *wrong]), matchmaking
+            )
+
+        assert sent_types(handler.send_to_player) == ["guess_batch_result"]
+        result = handler.send_to_player.await_args.args[1]
+        assert [g["letter"] for g in result.guesses] == [word[0], *wrong]
+        assert result.attempts_left == player.station_state.attempts_left
+
+
+class TestStationTracker:
+    """Tests for sequence-numbered station positions."""
+
+    def test_no_changes_keeps_sequence(self):
+        game = make_game()
+        tracker = StationTracker(game)
+
+        assert tracker.advance(game) == []
+        assert tracker.seq == 0
+
+    def test_late_joiner_appears_as_move_from_zero(self):
+        game = make_game()
+        tracker = StationTracker(game)
+        joiner = HangmanPlayer.create("Late", MagicMock())
+        game.add_player(joiner)
+
+        moves = tracker.advance(game)
+
+        assert moves == [{"player_id": joiner.id, "from": 0, "to": 1}]
+        assert tracker.seq == 1
+
+    def test_snapshot_matches_last_broadcast_positions(self):
+        game = make_game()
+        tracker = StationTracker(game)
+        move(game, 0, 4)
+
+        snapshot = tracker.snapshot(game)
+
+        assert {p["station"] for p in snapshot} == {1}
+        tracker.advance(game)
+        assert sorted(p["station"] for p in tracker.snapshot(game)) == [1, 1, 4]
+
+    @pytest.mark.asyncio
+    async def test_resync_sends_snapshot_to_requester(self):
+        handler = make_handler()
+        processor = HangmanEventProcessor(handler)
+        game = make_game()
+        track(processor, game)
+        player = next(iter(game.players.values()))
+        matchmaking = MagicMock()
+        matchmaking.get_player_game.return_value = game.id
+
+        with pytest.MonkeyPatch.context() as mp:
+            mp.setattr(
+                "games.hangman.events.get_hangman_manager",
+                lambda: MagicMock(get_game=lambda game_id: game),
+            )
+            await processor.handle_station_resync(player.id, matchmaking)
+
+        player_id, snapshot = handler.send_to_player.await_args.args
+        assert player_id == player.id
+        assert snapshot.type == "station_snapshot"
+        assert len(snapshot.players) == 3
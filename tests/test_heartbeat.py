@@ -0,0 +1,113 @@
+"""Tests for the heartbeat and dead-connection reaper."""
+
+import asyncio
+from unittest.mock import AsyncMock
+
+import pytest
+
+from services.metrics import Metrics
+from websocket.handler import WebSocketHandler
+from websocket.heartbeat import Heartbeat
+
+
+@pytest.fixture
+def connect(make_websocket):
+    """Register fake sockets that have been idle for the given seconds."""
+
+    def connect(handler: WebSocketHandler, player_id: str, idle: float):
+        ws = make_websocket()
+        handler.register_connection(player_id, ws)
+        connection = handler._sockets[ws]
+        connection.last_seen -= idle
+        return ws, connection
+
+    return connect
+
+
+class TestHeartbeat:
+    """Tests for Heartbeat sweeps."""
+
+    @pytest.mark.asyncio
+    async def test_pings_only_idle_connections(self, connect):
+        handler = WebSocketHandler()
+        heartbeat = Heartbeat(handler._sockets.values, interval=30, missed_limit=2)
+        active, _ = connect(handler, "active", idle=0)
+        idle, _ = connect(handler, "idle", idle=31)
+
+        assert await heartbeat.sweep() == 0
+        await handler.flush()
+
+        assert active.sent == []
+        assert [message["type"] for message in idle.messages] == ["ping"]
+
+    @pytest.mark.asyncio
+    async def test_reaps_after_missed_limit_through_leave_path(self, connect):
+        metrics = Metrics()
+        handler = WebSocketHandler()
+        heartbeat = Heartbeat(
+            handler._sockets.values, interval=30, missed_limit=2, metrics=metrics
+        )
+        handler._handle_disconnect = AsyncMock()
+        dead, connection = connect(handler, "dead", idle=61)
+        connect(handler, "alive", idle=45)
+
+        assert await heartbeat.sweep() == 1
+        await asyncio.sleep(0.01)
+
+        assert connection.closed
+        dead.close.assert_awaited_once()
+        handler._handle_disconnect.assert_awaited_once_with("dead")
+        assert handler.is_connected("alive")
+        assert metrics.value("ws_heartbeat_reaped") == 1
+
+    @pytest.mark.asyncio
+    async def test_inbound_frame_resets_idle_time(self, connect):
+        handler = WebSocketHandler()
+        heartbeat = Heartbeat(handler._sockets.values, interval=30, missed_limit=2)
+        _, connection = connect(handler, "p1", idle=90)
+
+        connection.touch()
+
+        assert await heartbeat.sweep() == 0
+        assert not connection.closed
+
+    @pytest.mark.asyncio
+    async def test_single_task_for_all_connections(self):
+        heartbeat = Heartbeat(lambda: [], interval=0.01)
+
+        heartbeat.start()
+        task = heartbeat._task
+        heartbeat.start()
+        await asyncio.sleep(0.03)
+
+        assert heartbeat._task is task and heartbeat.running
+        heartbeat.stop()
+        assert not heartbeat.running
+
+    @pytest.mark.asyncio
+    async def test_handler_close_stops_the_heartbeat(self):
+        handler = WebSocketHandler()
+        handler._heartbeat.start()
+
+        await handler.close()
+
+        assert not handler._heartbeat.running
+
+    @pytest.mark.asyncio
+    async def test_sweep_is_spread_over_the_interval(self, connect):
+        handler = WebSocketHandler()
+        heartbeat = Heartbeat(
+            handler._sockets.values, interval=0.2, missed_limit=10, slices=4
+        )
+        sockets = [connect(handler, f"p{i}", idle=1)[0] for i in range(8)]
+
+        heartbeat.start()
+        await asyncio.sleep(0.075)  # between the first tick and the second
+        await handler.flush()
+        pinged_after_one_tick = sum(bool(ws.sent) for ws in sockets)
+        await asyncio.sleep(0.15)
+        await handler.flush()
+        heartbeat.stop()
+
+        assert pinged_after_one_tick == 2
+        assert all(len(ws.sent) == 1 for ws in sockets)
@@ -0,0 +1,87 @@
+"""Tests for typed inbound message decoding and routing."""
+
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from games.duels.messages import SpellCastMessage
+from games.hangman.messages import GuessMessage
+from models.messages import JoinMessage
+from websocket.inbound import InboundError, decode_inbound
+from websocket.router import GameRouter
+
+
+def make_router() -> tuple[GameRouter, MagicMock]:
+    handler = MagicMock()
+    handler.send_error = AsyncMock()
+    router = GameRouter(handler)
+    router._hangman_processor = MagicMock(handle_guess=AsyncMock())
+    router._duels_processor = MagicMock(handle_spell_cast=AsyncMock())
+    return router, handler
+
+
+class TestDecodeInbound:
+    """Tests for decode_inbound."""
+
+    @pytest.mark.parametrize(
+        "data, model",
+        [
+            ({"type": "join", "player_name": "Ana"}, JoinMessage),
+            ({"type": "guess", "letter": "a"}, GuessMessage),
+            ({"type": "spell_cast", "spell": "aqua"}, SpellCastMessage),
+        ],
+    )
+    def test_picks_model_by_type(self, data, model):
+        assert isinstance(decode_inbound(data), model)
+
+    @pytest.mark.parametrize("data", [{"type": "dance"}, {"letter": "A"}])
+    def test_unknown_type(self, data):
+        with pytest.raises(InboundError, match="Unknown message type"):
+            decode_inbound(data)
+
+    def test_invalid_fields_name_the_type(self):
+        with pytest.raises(InboundError, match="Invalid spell cast format"):
+            decode_inbound({"type": "spell_cast", "spell": "fuego"})
+
+
+class TestRouterDispatch:
+    """Tests for GameRouter dispatch of decoded messages."""
+
+    @pytest.mark.asyncio
+    async def test_guess_is_handled_without_error(self):
+        router, handler = make_router()
+
+        await router.process(MagicMock(), {"type": "guess", "letter": "E"}, "p1")
+
+        guess = router._hangman_processor.handle_guess.await_args.args[1]
+        assert guess.letter == "E"
+        handler.send_error.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_spell_cast_only_reaches_duels_players(self):
+        router, handler = make_router()
+        router._player_game_types["p1"] = "duels"
+
+        await router.process(MagicMock(), {"type": "spell_cast", "spell": "ignis"}, "p1")
+        await router.process(MagicMock(), {"type": "spell_cast", "spell": "ignis"}, "p2")
+
+        assert router._duels_processor.handle_spell_cast.await_count == 1
+
+    @pytest.mark.asyncio
+    async def test_game_messages_require_join(self):
+        router, handler = make_router()
+        websocket = MagicMock()
+
+        await router.process(websocket, {"type": "guess", "letter": "E"}, None)
+
+        handler.send_error.assert_awaited_once_with(websocket, "Not authenticated")
+        router._hangman_processor.handle_guess.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_invalid_message_reports_error(self):
+        router, handler = make_router()
+        websocket = MagicMock()
+
+        await router.process(websocket, {"type": "guess", "letter": "EE"}, "p1")
+
+        handler.send_error.assert_awaited_once_with(websocket, "Invalid guess format")
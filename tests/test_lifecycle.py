@@ -0,0 +1,219 @@
+"""Tests for eviction of finished and abandoned games."""
+
+import asyncio
+import tracemalloc
+from unittest.mock import MagicMock
+
+import games.hangman.manager as hangman_manager_module
+import services.lifecycle as lifecycle_module
+from games.duels.manager import DuelsManager
+from games.hangman.manager import HangmanGameManager
+from games.hangman.models import HangmanPlayer
+from models.base import GameStatus, Player
+from services.lifecycle import GameLifecycle
+from services.matchmaking import Matchmaking
+from services.metrics import Metrics
+
+TTL = 300
+INTERVAL = 60
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def make_lifecycle(clock: FakeClock) -> GameLifecycle:
+    return GameLifecycle(ttl=TTL, interval=INTERVAL, clock=clock, metrics=Metrics())
+
+
+def start_hangman(manager: HangmanGameManager, players: int = 2):
+    game = manager.create_game()
+    for i in range(players):
+        game.add_player(HangmanPlayer.create(f"P{i}", None))
+    manager.start_game(game)
+    return game
+
+
+class TestGameLifecycle:
+    async def test_finished_game_is_evicted_after_ttl(self):
+        clock = FakeClock()
+        lifecycle = make_lifecycle(clock)
+        manager = HangmanGameManager()
+        evicted = []
+        lifecycle.track(
+            "hangman", lambda: manager.games, manager.remove_game, evicted.append
+        )
+        game = start_hangman(manager)
+        playing = start_hangman(manager)
+
+        game.status = GameStatus.FINISHED
+        assert await lifecycle.sweep() == 0
+        clock.now += TTL - 1
+        assert await lifecycle.sweep() == 0
+        clock.now += 1
+        assert await lifecycle.sweep() == 1
+
+        assert evicted == [game]
+        assert manager.get_game(game.id) is None
+        assert manager.get_game(playing.id) is playing
+        assert lifecycle.stats() == {"hangman": {"live": 1, "evicted": 1}}
+
+    async def test_abandoned_game_is_evicted(self):
+        clock = FakeClock()
+        lifecycle = make_lifecycle(clock)
+        manager = HangmanGameManager()
+        lifecycle.track("hangman", lambda: manager.games, manager.remove_game)
+        game = start_hangman(manager)
+
+        for player_id in game.players:
+            game.remove_player(player_id)
+        await lifecycle.sweep()
+        clock.now += TTL
+
+        assert await lifecycle.sweep() == 1
+        assert manager.find_joinable_game() is None
+
+    async def test_game_that_recovers_is_kept(self):
+        clock = FakeClock()
+        lifecycle = make_lifecycle(clock)
+        manager = HangmanGameManager()
+        lifecycle.track("hangman", lambda: manager.games, manager.remove_game)
+        game = start_hangman(manager, players=1)
+        player = next(iter(game.players.values()))
+
+        player.connected = False
+        await lifecycle.sweep()
+        clock.now += TTL / 2
+        player.connected = True
+        await lifecycle.sweep()
+        player.connected = False
+        clock.now += TTL / 2
+
+        assert await lifecycle.sweep() == 0
+        assert manager.get_game(game.id) is game
+
+    def test_forget_game_keeps_players_queued_again(self):
+        matchmaking = Matchmaking()
+        matchmaking.register_game_type("duels", 2, 2, 10, MagicMock(), MagicMock())
+        game = DuelsManager().create_game()
+        stayed, requeued = (
+            Player(id=player_id, name=player_id, websocket=None) for player_id in "ab"
+        )
+        for player in (stayed, requeued):
+            game.add_player(player)
+            matchmaking._player_games[player.id] = game.id
+            matchmaking._player_types[player.id] = "duels"
+        matchmaking._player_types.pop(requeued.id)
+        matchmaking.enqueue_player(requeued, "duels")
+
+        matchmaking.forget_game(game)
+
+        assert matchmaking.get_player_game(stayed.id) is None
+        assert matchmaking.get_player_game_type(stayed.id) is None
+        assert matchmaking.get_player_game_type(requeued.id) == "duels"
+
+
+class TestLeaveThroughRouter:
+    """Players leaving through the router make their game evictable."""
+
+    async def test_left_and_disconnected_game_is_evicted(
+        self, make_isolated_handler, make_websocket, monkeypatch
+    ):
+        clock = FakeClock()
+        lifecycle = make_lifecycle(clock)
+        monkeypatch.setattr(lifecycle_module, "_game_lifecycle", lifecycle)
+        handler = make_isolated_handler()
+        router = handler._game_router
+        manager = hangman_manager_module.get_hangman_manager()
+
+        player_ids = []
+        for name in ("Ana", "Luis"):
+            joined = await router.process(
+                make_websocket(), {"type": "join", "player_name": name}, None
+            )
+            player_ids.append(joined["player_id"])
+        await asyncio.sleep(0.05)
+        (game,) = manager.games
+        assert game.player_count == 2
+
+        await router.process(None, {"type": "leave"}, player_ids[0])
+        await handler._handle_disconnect(player_ids[1])
+        await handler.flush()
+
+        assert game.player_count == 0
+        await lifecycle.sweep()
+        clock.now += TTL
+        assert await lifecycle.sweep() == 1
+        assert manager.get_game(game.id) is None
+
+    async def test_handler_close_stops_the_sweep(self, make_isolated_handler):
+        handler = make_isolated_handler()
+        handler._lifecycle.start()
+
+        await handler.close()
+
+        assert not handler._lifecycle.running
+
+
+async def test_soak_memory_stays_flat():
+    """Six simulated hours of games, ten per minute, keep memory flat."""
+    clock = FakeClock()
+    lifecycle = make_lifecycle(clock)
+    hangman = HangmanGameManager()
+    duels = DuelsManager()
+    matchmaking = Matchmaking()
+    for name, manager in (("hangman", hangman), ("duels", duels)):
+        lifecycle.track(
+            name,
+            lambda manager=manager: manager.games,
+            manager.remove_game,
+            matchmaking.forget_game,
+        )
+
+    def play_minute(minute: int) -> None:
+        for i in range(5):
+            game = start_hangman(hangman)
+            duel = duels.create_game()
+            for n in range(2):
+                duel.add_player(Player.create(f"D{n}", None))
+            duels.start_game(duel)
+            for player_id in [*game.players, *duel.players]:
+                matchmaking._player_games[player_id] = (
+                    game.id if player_id in game.players else duel.id
+                )
+            # Half the games finish, the other half are abandoned
+            if i % 2:
+                game.status = duel.status = GameStatus.FINISHED
+            else:
+                for abandoned in (game, duel):
+                    for player_id in list(abandoned.players):
+                        abandoned.remove_player(player_id)
+
+    async def play_hour(hour: int) -> None:
+        for minute in range(60):
+            play_minute(hour * 60 + minute)
+            clock.now += INTERVAL
+            await lifecycle.sweep()
+
+    tracemalloc.start()
+    try:
+        await play_hour(0)
+        after_first_hour = tracemalloc.get_traced_memory()[0]
+        for hour in range(1, 6):
+            await play_hour(hour)
+        after_six_hours = tracemalloc.get_traced_memory()[0]
+    finally:
+        tracemalloc.stop()
+
+    # Only the games of the last TTL are kept: 5 minutes of 10 games
+    max_live = (TTL // INTERVAL + 1) * 5
+    stats = lifecycle.stats()
+    assert stats["hangman"]["live"] <= max_live
+    assert stats["duels"]["live"] <= max_live
+    assert stats["hangman"]["evicted"] + stats["hangman"]["live"] == 6 * 60 * 5
+    assert len(matchmaking._player_games) <= max_live * 4
+    assert after_six_hours < after_first_hour * 1.2
@@ -0,0 +1,245 @@
+"""Tests for matchmaking queues."""
+
+import asyncio
+from unittest.mock import MagicMock
+
+import pytest
+
+from models.base import BaseGame, Player
+from services.matchmaking import Matchmaking, PlayerQueue, QueuedPlayer
+
+
+def make_player(player_id: str) -> Player:
+    return Player(id=player_id, name=player_id, websocket=None)
+
+
+def queued(player_id: str) -> QueuedPlayer:
+    return QueuedPlayer(player=make_player(player_id), game_type="test")
+
+
+class TestPlayerQueue:
+    def test_keeps_arrival_order_and_rejects_duplicates(self):
+        queue = PlayerQueue()
+        assert queue.append(queued("a"))
+        assert queue.append(queued("b"))
+        assert not queue.append(queued("a"))
+
+        assert [qp.player.id for qp in queue] == ["a", "b"]
+        assert "a" in queue and "c" not in queue
+        assert len(queue) == 2
+
+    def test_remove_from_the_middle(self):
+        queue = PlayerQueue()
+        for player_id in "abc":
+            queue.append(queued(player_id))
+
+        assert queue.remove("b").player.id == "b"
+        assert queue.remove("b") is None
+        assert [qp.player.id for qp in queue] == ["a", "c"]
+
+    def test_pop_front_takes_at_most_what_is_queued(self):
+        queue = PlayerQueue()
+        for player_id in "abc":
+            queue.append(queued(player_id))
+
+        assert [qp.player.id for qp in queue.pop_front(2)] == ["a", "b"]
+        assert [qp.player.id for qp in queue.pop_front(5)] == ["c"]
+        assert len(queue) == 0
+
+
+class TestMatchmakingQueues:
+    async def test_start_takes_the_longest_waiting_players(self):
+        matchmaking = Matchmaking()
+        created = []
+
+        def create_game():
+            game = MagicMock(id=f"game-{len(created)}")
+            created.append(game)
+            return game
+
+        async def on_start(game):
+            pass
+
+        matchmaking.register_game_type("test", 2, 2, 60, create_game, on_start)
+        players = [make_player(f"p{i}") for i in range(3)]
+        for player in players:
+            assert matchmaking.enqueue_player(player, "test")
+        assert not matchmaking.enqueue_player(players[0], "test")
+
+        await matchmaking.try_start_game("test")
+
+        added = [call.args[0] for call in created[0].add_player.call_args_list]
+        assert added == players[:2]
+        assert matchmaking.get_queued_players("test") == [players[2]]
+        assert matchmaking.get_queue_size("test") == 1
+
+    def test_remove_player_reports_queue_change(self):
+        matchmaking = Matchmaking()
+        changes = []
+        matchmaking.add_queue_listener(lambda game_type, size: changes.append(size))
+        matchmaking.register_game_type("test", 3, 4, 60, MagicMock(), MagicMock())
+        for i in range(2):
+            matchmaking.enqueue_player(make_player(f"p{i}"), "test")
+
+        matchmaking.remove_player("p0")
+        matchmaking.remove_player("p0")
+
+        assert changes == [1, 2, 1]
+        assert matchmaking.get_queue_size("test") == 1
+
+    def test_report_join_tells_listeners_the_free_seats(self):
+        matchmaking = Matchmaking()
+        running = MagicMock(player_count=3)
+        matchmaking.register_game_type(
+            "test", 2, 5, 60, MagicMock(), MagicMock(), lambda: running
+        )
+        reports = []
+        matchmaking.add_queue_listener(
+            lambda game_type, size: reports.append(
+                (size, matchmaking.joinable_seats(game_type))
+            )
+        )
+
+        matchmaking.report_join("test")
+        running.player_count = 5
+        matchmaking.report_join("test")
+
+        assert reports == [(0, 2), (0, 0)]
+
+
+class TestTickMatchmaking:
+    def register(
+        self, matchmaking: Matchmaking, on_start, tick: float = 0.01, creator=None
+    ):
+        matchmaking.register_game_type(
+            "test",
+            2,
+            2,
+            60,
+            creator or (lambda: BaseGame(id=BaseGame.generate_id(), game_type="test")),
+            on_start,
+            tick_seconds=tick,
+        )
+
+    async def test_pairs_the_whole_queue_in_one_batch(self):
+        matchmaking = Matchmaking()
+        started = []
+        changes = []
+        matchmaking.add_queue_listener(lambda game_type, size: changes.append(size))
+
+        async def on_start(game):
+            started.append(game)
+
+        self.register(matchmaking, on_start, tick=3600)
+        players = [make_player(f"p{i}") for i in range(5)]
+        for player in players:
+            matchmaking.enqueue_player(player, "test")
+        assert await matchmaking.try_start_game("test") is None
+
+        changes.clear()
+        games = await matchmaking.start_ready_games("test")
+
+        assert games == started
+        assert [list(game.players) for game in games] == [["p0", "p1"], ["p2", "p3"]]
+        assert matchmaking.get_player_game("p3") == games[1].id
+        assert matchmaking.get_queued_players("test") == [players[4]]
+        assert changes == [1]
+
+    async def test_starts_games_concurrently(self):
+        matchmaking = Matchmaking()
+        release = asyncio.Event()
+        waiting = []
+
+        async def on_start(game):
+            # Only returns once every game of the batch has started
+            waiting.append(game)
+            if len(waiting) == 3:
+                release.set()
+            await release.wait()
+
+        self.register(matchmaking, on_start, tick=3600)
+        for i in range(6):
+            matchmaking.enqueue_player(make_player(f"p{i}"), "test")
+
+        games = await asyncio.wait_for(matchmaking.start_ready_games("test"), 1)
+        assert games == waiting
+
+    async def test_tick_task_pairs_and_stops_when_queue_empties(self):
+        matchmaking = Matchmaking()
+        started = asyncio.Queue()
+
+        async def on_start(game):
+            started.put_nowait(game)
+
+        async def failing_start(game):
+            raise RuntimeError("boom")
+
+        self.register(matchmaking, on_start)
+        matchmaking.enqueue_player(make_player("a"), "test")
+        matchmaking.enqueue_player(make_player("b"), "test")
+
+        game = await asyncio.wait_for(started.get(), 1)
+        assert set(game.players) == {"a", "b"}
+        await asyncio.sleep(0.05)
+        assert "test" not in matchmaking._tick_tasks
+
+        self.register(matchmaking, failing_start, tick=3600)
+        for i in range(4):
+            matchmaking.enqueue_player(make_player(f"f{i}"), "test")
+        assert len(await matchmaking.start_ready_games("test")) == 2
+        matchmaking._tick_tasks.pop("test").cancel()
+
+    async def test_add_player_only_enqueues(self):
+        matchmaking = Matchmaking()
+        self.register(matchmaking, MagicMock(), tick=3600)
+
+        for i in range(3):
+            assert await matchmaking.add_player(make_player(f"p{i}"), "test") == (
+                None,
+                False,
+            )
+
+        assert matchmaking.get_queue_size("test") == 3
+        assert "test" in matchmaking._tick_tasks
+        matchmaking._tick_tasks["test"].cancel()
+
+    async def test_failing_creator_leaves_players_queued(self):
+        matchmaking = Matchmaking()
+
+        def failing_creator():
+            raise RuntimeError("no words")
+
+        self.register(matchmaking, MagicMock(), tick=3600, creator=failing_creator)
+        for i in range(4):
+            matchmaking.enqueue_player(make_player(f"p{i}"), "test")
+
+        with pytest.raises(RuntimeError):
+            await matchmaking.start_ready_games("test")
+
+        assert matchmaking.get_queue_size("test") == 4
+        assert matchmaking.get_player_game("p0") is None
+        matchmaking._tick_tasks["test"].cancel()
+
+    async def test_tick_survives_a_failed_tick(self, caplog):
+        matchmaking = Matchmaking()
+        started = asyncio.Queue()
+        failures = [RuntimeError("no words")]
+
+        def flaky_creator():
+            if failures:
+                raise failures.pop()
+            return BaseGame(id=BaseGame.generate_id(), game_type="test")
+
+        async def on_start(game):
+            started.put_nowait(game)
+
+        self.register(matchmaking, on_start, creator=flaky_creator)
+        matchmaking.enqueue_player(make_player("a"), "test")
+        matchmaking.enqueue_player(make_player("b"), "test")
+
+        game = await asyncio.wait_for(started.get(), 1)
+
+        assert set(game.players) == {"a", "b"}
+        assert "Matchmaking tick failed" in caplog.text
+        await asyncio.sleep(0.05)
+        assert "test" not in matchmaking._tick_tasks
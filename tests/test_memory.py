@@ -0,0 +1,75 @@
+"""Memory budgets for per-player and per-game models."""
+
+import tracemalloc
+
+import pytest
+
+from games.duels.models import DuelGame, Round, Spell, SpellCast
+from games.hangman.models import HangmanGame, HangmanPlayer, Station
+from models.base import Player
+
+COUNT = 2_000
+
+
+def bytes_per_object(build) -> float:
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    objects = [build(i) for i in range(COUNT)]
+    held = tracemalloc.get_traced_memory()[0] - before
+    tracemalloc.stop()
+    del objects
+    return held / COUNT
+
+
+def hangman_player(i: int) -> HangmanPlayer:
+    player = HangmanPlayer(id=f"player-{i:08d}", name="Jugador", websocket=None)
+    player.station_state = Station(word="MURCIELAGO")
+    player.station_state.guess("A")
+    return player
+
+
+def duel_game(i: int) -> DuelGame:
+    game = DuelGame(id=f"D{i:07d}", game_type="duels", player1_id="a", player2_id="b")
+    for _ in range(3):
+        game.process_spell_cast("a", Spell.IGNIS)
+        game.process_spell_cast("b", Spell.IGNIS)
+        game.resolve_current_round()
+        game.start_new_round()
+    return game
+
+
+class TestSlots:
+    """Models keep their fields in slots, without an instance dict."""
+
+    @pytest.mark.parametrize(
+        "instance",
+        [
+            Player(id="p", name="p", websocket=None),
+            HangmanPlayer(id="p", name="p", websocket=None),
+            Station(word="CASA"),
+            HangmanGame(id="G", words=["CASA"]),
+            SpellCast(player_id="p", spell=Spell.AQUA),
+            Round(round_number=1),
+            DuelGame(id="D", game_type="duels"),
+        ],
+        ids=lambda instance: type(instance).__name__,
+    )
+    def test_models_have_no_instance_dict(self, instance):
+        assert not hasattr(instance, "__dict__")
+
+
+class TestTimestamps:
+    """Model timestamps come from the monotonic clock."""
+
+    def test_spell_cast_timestamp_is_monotonic_float(self):
+        assert isinstance(SpellCast(player_id="p", spell=Spell.AQUA).timestamp, float)
+
+
+class TestMemoryBudgets:
+    """Per-object memory stays within budget."""
+
+    def test_hangman_player_stays_within_budget(self):
+        assert bytes_per_object(hangman_player) < 600
+
+    def test_duel_game_stays_within_budget(self):
+        assert bytes_per_object(duel_game) < 1_400
@@ -0,0 +1,114 @@
+"""Tests for per-connection rate limiting."""
+
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from services.metrics import Metrics
+from services.rate_limit import RateLimitDecision, RateLimiter
+from websocket.router import GameRouter
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def make_router(limiter: RateLimiter) -> tuple[GameRouter, MagicMock]:
+    handler = MagicMock()
+    handler.send_error = AsyncMock()
+    router = GameRouter(handler)
+    router._hangman_processor = MagicMock(handle_guess=AsyncMock())
+    router._rate_limiter = limiter
+    router._metrics = Metrics()
+    return router, handler
+
+
+class TestRateLimiter:
+    """Tests for RateLimiter buckets."""
+
+    def test_allows_burst_then_refills(self):
+        clock = FakeClock()
+        limiter = RateLimiter({"guess": (2.0, 3)}, clock=clock)
+
+        results = [limiter.check("p1", "guess") for _ in range(4)]
+        clock.now = 0.5
+
+        assert results[:3] == [RateLimitDecision.ALLOW] * 3
+        assert results[3] is RateLimitDecision.DROP
+        assert limiter.check("p1", "guess") is RateLimitDecision.ALLOW
+
+    def test_buckets_are_per_player_and_type(self):
+        limiter = RateLimiter({"guess": (1.0, 1), "spell_cast": (1.0, 1)}, clock=FakeClock())
+
+        assert limiter.check("p1", "guess") is RateLimitDecision.ALLOW
+        assert limiter.check("p1", "spell_cast") is RateLimitDecision.ALLOW
+        assert limiter.check("p2", "guess") is RateLimitDecision.ALLOW
+        assert limiter.check("p1", "guess") is RateLimitDecision.DROP
+
+    def test_unlimited_types_always_allowed(self):
+        limiter = RateLimiter({"guess": (1.0, 1)}, clock=FakeClock())
+
+        assert all(
+            limiter.check("p1", "station_resync") is RateLimitDecision.ALLOW
+            for _ in range(100)
+        )
+
+    def test_disconnect_when_strikes_run_out(self):
+        limiter = RateLimiter({"guess": (1.0, 1)}, strikes=2, clock=FakeClock())
+
+        decisions = [limiter.check("p1", "guess") for _ in range(4)]
+
+        assert decisions == [
+            RateLimitDecision.ALLOW,
+            RateLimitDecision.DROP,
+            RateLimitDecision.DROP,
+            RateLimitDecision.DISCONNECT,
+        ]
+
+
+class TestRouterRateLimit:
+    """Tests for rate limiting in GameRouter."""
+
+    @pytest.mark.asyncio
+    async def test_over_budget_guess_is_dropped_before_game_logic(self):
+        router, handler = make_router(
+            RateLimiter({"guess": (1.0, 2)}, clock=FakeClock())
+        )
+        websocket = MagicMock()
+
+        for _ in range(3):
+            await router.process(websocket, {"type": "guess", "letter": "A"}, "p1")
+
+        assert router._hangman_processor.handle_guess.await_count == 2
+        handler.send_error.assert_awaited_once_with(websocket, "Rate limit exceeded")
+        assert router._metrics.value("rate_limit_dropped_guess") == 1
+
+    @pytest.mark.asyncio
+    async def test_flooding_client_is_disconnected(self):
+        router, handler = make_router(
+            RateLimiter({"guess": (1.0, 1)}, strikes=1, clock=FakeClock())
+        )
+
+        for _ in range(3):
+            await router.process(MagicMock(), {"type": "guess", "letter": "A"}, "p1")
+
+        handler.disconnect.assert_called_once_with("p1", "rate_limited")
+        assert router._metrics.value("rate_limit_disconnects") == 1
+
+    @pytest.mark.asyncio
+    async def test_guess_batch_charges_guess_budget_per_letter(self):
+        router, handler = make_router(
+            RateLimiter({"guess": (1.0, 4)}, clock=FakeClock())
+        )
+        router._hangman_processor.handle_guess_batch = AsyncMock()
+        batch = {"type": "guess_batch", "letters": ["A", "B", "C"]}
+
+        await router.process(MagicMock(), batch, "p1")
+        await router.process(MagicMock(), batch, "p1")
+
+        assert router._hangman_processor.handle_guess_batch.await_count == 1
+        assert router._metrics.value("rate_limit_dropped_guess") == 1
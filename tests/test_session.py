@@ -0,0 +1,134 @@
+"""Tests for resumable sessions."""
+
+import asyncio
+from unittest.mock import AsyncMock
+
+import pytest
+
+from models.messages import ErrorMessage
+from websocket.frames import EncodedFrame
+from websocket.handler import WebSocketHandler
+from websocket.session import Session, SessionStore
+
+
+def frame(text: str) -> EncodedFrame:
+    return EncodedFrame.encode(ErrorMessage(message=text))
+
+
+def make_handler(grace: float = 30.0, capacity: int = 256) -> WebSocketHandler:
+    handler = WebSocketHandler()
+    handler._sessions = SessionStore(capacity=capacity, grace_seconds=grace)
+    handler._handle_disconnect = AsyncMock(wraps=handler._handle_disconnect)
+    return handler
+
+
+class TestSession:
+    """Tests for Session replay."""
+
+    def test_frames_after_returns_missed_frames(self):
+        session = Session("p1", capacity=10)
+        for i in range(5):
+            session.record(frame(str(i)))
+
+        missed = session.frames_after(3)
+
+        assert [f.payload["message"] for f in missed] == ["3", "4"]
+        assert session.frames_after(5) == []
+
+    def test_frames_dropped_from_buffer_cannot_be_replayed(self):
+        session = Session("p1", capacity=3)
+        for i in range(5):
+            session.record(frame(str(i)))
+
+        assert session.frames_after(1) is None
+        assert len(session.frames_after(2)) == 3
+
+    def test_tokens_are_unique(self):
+        store = SessionStore()
+
+        assert store.open("p1").token != store.open("p2").token
+
+
+class TestResume:
+    """Tests for resuming sessions through WebSocketHandler."""
+
+    @pytest.mark.asyncio
+    async def test_resume_replays_only_missed_frames(self, make_websocket):
+        handler = make_handler()
+        old = make_websocket()
+        token = handler.open_session("p1", old)
+        await handler.send_to_player("p1", frame("a"))
+        await handler.send_to_player("p1", frame("b"))
+        await handler.flush()
+
+        await handler._connection_lost("p1")
+        await handler.send_to_player("p1", frame("c"))
+        new = make_websocket()
+        player_id = await handler.resume_session(new, token, last_seq=1)
+        await handler.flush()
+
+        assert player_id == "p1"
+        assert [m.get("message") for m in new.messages] == ["b", "c", None]
+        assert new.messages[-1] == {
+            "type": "resumed", "player_id": "p1", "seq": 4, "replayed": 2
+        }
+        handler._handle_disconnect.assert_not_awaited()
+        assert handler.is_connected("p1")
+
+    @pytest.mark.asyncio
+    async def test_player_stays_reachable_during_grace(self, make_websocket):
+        handler = make_handler()
+        handler.open_session("p1", make_websocket())
+
+        await handler._connection_lost("p1")
+
+        assert handler.is_connected("p1")
+        handler._handle_disconnect.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_grace_expiry_runs_leave_path(self, make_websocket):
+        handler = make_handler(grace=0.01)
+        token = handler.open_session("p1", make_websocket())
+
+        await handler._connection_lost("p1")
+        await asyncio.sleep(0.05)
+
+        handler._handle_disconnect.assert_awaited_once_with("p1")
+        assert await handler.resume_session(make_websocket(), token, 1) is None
+        assert not handler.is_connected("p1")
+
+    @pytest.mark.asyncio
+    async def test_resume_fails_when_buffer_overflowed(self, make_websocket):
+        handler = make_handler(capacity=2)
+        token = handler.open_session("p1", make_websocket())
+        await handler._connection_lost("p1")
+        for text in "abc":
+            await handler.send_to_player("p1", frame(text))
+
+        assert await handler.resume_session(make_websocket(), token, 0) is None
+        handler._handle_disconnect.assert_awaited_once_with("p1")
+
+    @pytest.mark.asyncio
+    async def test_resume_replaces_half_open_connection(self, make_websocket):
+        handler = make_handler()
+        old = make_websocket()
+        token = handler.open_session("p1", old)
+
+        await handler.resume_session(make_websocket(), token, 0)
+        await asyncio.sleep(0.01)
+
+        old.close.assert_awaited_once()
+        handler._handle_disconnect.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_unknown_token_gets_resume_failed(self, make_websocket):
+        handler = make_handler()
+        ws = make_websocket()
+
+        result = await handler._game_router.process(
+            ws, {"type": "resume", "token": "nope", "last_seq": 0}, None
+        )
+        await handler.flush()
+
+        assert result is None
+        assert ws.messages[0]["type"] == "resume_failed"
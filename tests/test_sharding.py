@@ -0,0 +1,242 @@
+"""Tests for the game-sharded runtime: link framing, placement and relaying."""
+
+import asyncio
+import json
+import logging
+from types import SimpleNamespace
+from unittest.mock import AsyncMock
+
+import pytest
+
+from services.metrics import Metrics
+from sharding.front import FrontLayer, ShardPlacement, shard_of_token
+from sharding.link import OP_EVENT, OP_TEXT, LinkError, encode_event, encode_op, read_op
+from sharding.shard import Shard, token_prefix
+from websocket.connection import Connection
+from websocket.handler import WebSocketHandler
+
+
+class ClientWebSocket:
+    """Client socket as seen by the front layer."""
+
+    def __init__(self):
+        self.scope = {"subprotocols": []}
+        self.client_state = SimpleNamespace(name="CONNECTED")
+        self.sent: list[dict] = []
+        self.closed_with: int | None = None
+        self._inbox: asyncio.Queue[dict] = asyncio.Queue()
+
+    async def accept(self, subprotocol=None) -> None:
+        pass
+
+    async def receive(self) -> dict:
+        return await self._inbox.get()
+
+    async def send_text(self, data: str) -> None:
+        self.sent.append(json.loads(data))
+
+    async def close(self, code: int = 1000) -> None:
+        self.closed_with = code
+        self.disconnect()
+
+    def send(self, payload: dict) -> None:
+        message = {"type": "websocket.receive", "text": json.dumps(payload)}
+        self._inbox.put_nowait(message)
+
+    def disconnect(self) -> None:
+        self._inbox.put_nowait({"type": "websocket.disconnect", "code": 1000})
+
+    async def wait_for(self, msg_type: str, timeout: float = 2.0) -> dict:
+        async def find() -> dict:
+            while True:
+                for message in self.sent:
+                    if message["type"] == msg_type:
+                        return message
+                await asyncio.sleep(0.01)
+
+        return await asyncio.wait_for(find(), timeout)
+
+
+class TestLink:
+    """Tests for the front-to-shard link framing."""
+
+    async def test_link_ops_round_trip(self):
+        reader = asyncio.StreamReader()
+        reader.feed_data(encode_op(OP_TEXT, 7, b'{"type":"join"}'))
+        reader.feed_data(encode_event({"event": "queue", "queued": 1}))
+        reader.feed_eof()
+
+        assert await read_op(reader) == (OP_TEXT, 7, b'{"type":"join"}')
+        op, conn_id, payload = await read_op(reader)
+        assert (op, conn_id) == (OP_EVENT, 0)
+        assert json.loads(payload) == {"event": "queue", "queued": 1}
+        with pytest.raises(LinkError):
+            await read_op(reader)
+
+    def test_shard_of_token(self):
+        assert shard_of_token(token_prefix(2) + "abc", shard_count=4) == 2
+        assert shard_of_token(token_prefix(5) + "abc", shard_count=4) is None
+        assert shard_of_token("abc", shard_count=4) is None
+        assert shard_of_token(None, shard_count=4) is None
+
+
+class TestShardPlacement:
+    """Tests for choosing the shard of a joining player."""
+
+    def test_new_games_go_to_least_loaded_shard(self):
+        placement = ShardPlacement(3)
+        placement.bound(0)
+        placement.bound(0)
+        placement.bound(1)
+
+        assert placement.for_join("duels") == 2
+
+    def test_joins_follow_waiting_players(self):
+        placement = ShardPlacement(3)
+        placement.bound(0)
+        placement.queue_changed(0, "duels", 1)
+
+        assert placement.for_join("duels") == 0
+        assert placement.for_join("hangman") == 1
+
+    def test_joins_in_flight_count_as_waiting(self):
+        placement = ShardPlacement(2)
+
+        first = placement.for_join("duels")
+        placement.bound(first)
+
+        assert placement.for_join("duels") == first
+
+    def test_started_game_frees_the_queue(self):
+        placement = ShardPlacement(2)
+        placement.bound(0)
+        placement.bound(0)
+        placement.queue_changed(0, "duels", 0)
+
+        assert placement.for_join("duels") == 1
+
+    def test_late_joins_go_to_free_seats(self):
+        placement = ShardPlacement(2)
+        placement.bound(1)
+        placement.queue_changed(1, "hangman", 0, joinable=1)
+        placement.queue_changed(0, "hangman", 3)
+
+        assert placement.for_join("hangman") == 1
+        assert placement.for_join("hangman") == 0
+
+    def test_report_after_join_drops_in_flight_count(self):
+        placement = ShardPlacement(2)
+
+        shard = placement.for_join("duels")
+        placement.bound(shard)
+        placement.queue_changed(shard, "duels", 0)
+
+        assert placement.for_join("duels") != shard
+
+
+@pytest.fixture
+async def front_and_shard():
+    shard = Shard(0, handler=WebSocketHandler(session_token_prefix=token_prefix(0)))
+    await shard.serve(port=0)
+    front = FrontLayer([("127.0.0.1", shard.port)], metrics=Metrics())
+    await front.start()
+    yield front, shard
+    await front.close()
+    await shard.close()
+
+
+class TestFrontLayer:
+    """Tests for relaying clients between the front layer and a shard."""
+
+    async def test_front_relays_a_duel_to_its_shard(self, front_and_shard):
+        front, _ = front_and_shard
+        alice, bob = ClientWebSocket(), ClientWebSocket()
+        tasks = [asyncio.create_task(front.handle_connection(ws)) for ws in (alice, bob)]
+
+        alice.send({"type": "join", "player_name": "Alice", "game_type": "duels"})
+        joined = await alice.wait_for("joined")
+        bob.send({"type": "join", "player_name": "Bob", "game_type": "duels"})
+
+        start = await alice.wait_for("duel_start")
+        assert start["opponent_name"] == "Bob"
+        assert (await bob.wait_for("duel_start"))["opponent_name"] == "Alice"
+        assert joined["resume_token"].startswith(token_prefix(0))
+        assert front.placement.loads == [2]
+
+        for ws in (alice, bob):
+            ws.send({"type": "leave"})
+            ws.disconnect()
+        await asyncio.gather(*tasks)
+        assert front.placement.loads == [0]
+
+
+    async def test_shard_close_closes_the_client(self, front_and_shard):
+        front, shard = front_and_shard
+        client = ClientWebSocket()
+        task = asyncio.create_task(front.handle_connection(client))
+
+        client.send({"type": "join", "player_name": "Ana", "game_type": "hangman"})
+        joined = await client.wait_for("joined")
+        shard._handler.disconnect(joined["player_id"], "rate_limited")
+
+        await asyncio.wait_for(task, 2.0)
+        assert client.closed_with == 1013
+        assert front.placement.loads == [0]
+
+
+    async def test_front_decodes_only_frames_that_can_move_the_client(
+        self, front_and_shard
+    ):
+        front, _ = front_and_shard
+        client = ClientWebSocket()
+        task = asyncio.create_task(front.handle_connection(client))
+
+        client.send({"type": "join", "player_name": "Ana", "game_type": "hangman"})
+        await client.wait_for("joined")
+        for letter in "AEIOU":
+            client.send({"type": "guess", "letter": letter})
+        client.send({"type": "leave"})
+        client.send({"type": "join", "player_name": "Ana", "game_type": "duels"})
+
+        async def joined_twice() -> None:
+            while sum(message["type"] == "joined" for message in client.sent) < 2:
+                await asyncio.sleep(0.01)
+
+        await asyncio.wait_for(joined_twice(), 2.0)
+
+        assert front._metrics.value("front_frames_decoded") == 2
+        client.disconnect()
+        await task
+
+    async def test_pve_join_leaves_no_queued_player(self, front_and_shard):
+        front, _ = front_and_shard
+        client = ClientWebSocket()
+        task = asyncio.create_task(front.handle_connection(client))
+
+        client.send(
+            {
+                "type": "join",
+                "player_name": "Ana",
+                "game_type": "duels",
+                "game_mode": "pve",
+            }
+        )
+        await client.wait_for("duel_start")
+        await asyncio.sleep(0.05)
+
+        assert front.placement._queued["duels"] == [0]
+        client.send({"type": "leave"})
+        client.disconnect()
+        await task
+
+    async def test_failed_client_close_is_logged(self, caplog):
+        front = FrontLayer([("127.0.0.1", 0)], metrics=Metrics())
+        websocket = ClientWebSocket()
+        websocket.close = AsyncMock(side_effect=RuntimeError("already gone"))
+        connection = Connection(websocket, metrics=Metrics())
+
+        with caplog.at_level(logging.DEBUG, logger="sharding.front"):
+            await front._close_client(connection, 1000)
+
+        assert "already gone" in caplog.text
+        assert connection.closed
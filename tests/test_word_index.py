@@ -0,0 +1,144 @@
+"""Tests for the letter-bitmask word index."""
+
+from collections.abc import Sequence
+
+import pytest
+
+from services.word_bank import WordBank
+from services.word_index import WordIndex, letter_mask
+from services.word_pack import PackedWords, compile_words
+
+WORDS = ["CASA", "PERRO", "ARBOL", "LUZ", "MURCIELAGO", "SOL"]
+
+BACKENDS = [
+    pytest.param(False, id="lists"),
+    pytest.param(
+        True,
+        id="numpy",
+        marks=pytest.mark.skipif(
+            not WordIndex([], use_numpy=None).vectorized, reason="NumPy not installed"
+        ),
+    ),
+]
+
+
+class CountingWords(Sequence):
+    """A word list that counts the words read from it."""
+
+    def __init__(self, words: list[str]):
+        self._words = words
+        self.reads = 0
+
+    def __len__(self) -> int:
+        return len(self._words)
+
+    def __getitem__(self, position):
+        self.reads += 1
+        return self._words[position]
+
+
+class TestLetterMask:
+    """Tests for letter_mask."""
+
+    def test_sets_one_bit_per_letter(self):
+        assert letter_mask("aAb") == 0b11
+        assert letter_mask("Z") == 1 << 25
+        assert letter_mask("Ñ") == 0
+
+
+@pytest.mark.parametrize("use_numpy", BACKENDS)
+class TestWordIndex:
+    """Tests for WordIndex on both backends."""
+
+    def test_info(self, use_numpy):
+        index = WordIndex(WORDS, use_numpy=use_numpy)
+
+        info = index.info(0)
+
+        assert info["mask"] == letter_mask("CAS")
+        assert (info["distinct"], info["length"]) == (3, 4)
+        # C in 2 of 6 words, A in 3, S in 2
+        assert info["score"] == pytest.approx((2 + 3 + 2) / 6)
+
+    def test_info_counts_letters_outside_a_to_z(self, use_numpy):
+        words = ["ÑAÑA", "ÁRBOL", "straße", ""]
+        index = WordIndex(words, use_numpy=use_numpy)
+
+        assert index.info(0)["distinct"] == 2
+        assert index.info(1)["mask"] == letter_mask("RBOL")
+        assert index.info(2)["mask"] == letter_mask("STRAE")
+        assert (index.info(2)["distinct"], index.info(2)["length"]) == (5, 6)
+        assert index.info(3)["mask"] == 0
+
+    def test_query_combines_constraints(self, use_numpy):
+        index = WordIndex(WORDS, use_numpy=use_numpy)
+
+        assert index.query(min_distinct=4, max_distinct=5) == ["PERRO", "ARBOL"]
+        assert index.query(max_length=3) == ["LUZ", "SOL"]
+        assert index.query(avoid="AE") == ["LUZ", "SOL"]
+        assert index.query(include="OR") == ["PERRO", "ARBOL", "MURCIELAGO"]
+        assert index.query(include="OR", avoid="E") == ["ARBOL"]
+        assert index.query(min_score=3.0) == ["MURCIELAGO"]
+        assert index.query() == WORDS
+
+    def test_positions_read_no_words(self, use_numpy):
+        words = CountingWords(WORDS)
+        index = WordIndex(WORDS, use_numpy=use_numpy)
+        index._words = words
+
+        positions = index.positions(include="OR")
+
+        assert list(positions) == [1, 2, 4]
+        assert words.reads == 0
+
+    def test_backends_agree_on_the_word_bank(self, use_numpy):
+        words = WordBank()._words
+        index = WordIndex(words, use_numpy=use_numpy)
+        reference = WordIndex(words, use_numpy=False)
+
+        for constraints in (
+            {"min_distinct": 5, "max_distinct": 6},
+            {"avoid": "AE", "min_length": 5},
+            {"min_score": 2.5},
+        ):
+            assert index.query(**constraints) == reference.query(**constraints)
+
+    def test_pack_indexes_like_its_list(self, use_numpy, tmp_path):
+        words = ["CASA", "ÁRBOL", "MURCIÉLAGO", "ÑU", "LUZ"]
+        path = tmp_path / "words.qwb"
+        compile_words(words, path)
+        pack = PackedWords(path)
+
+        index = WordIndex(pack, use_numpy=use_numpy)
+        reference = WordIndex(words, use_numpy=False)
+
+        for position in range(len(words)):
+            assert index.info(position) == pytest.approx(reference.info(position))
+        assert index.query(min_distinct=4) == ["ÁRBOL", "MURCIÉLAGO"]
+        del index
+        pack.close()
+
+
+class TestSelectWords:
+    """Tests for WordBank.select_words."""
+
+    def test_meets_constraints(self):
+        bank = WordBank()
+
+        words = bank.select_words(5, min_distinct=6, avoid="Z")
+
+        assert len(words) == 5
+        assert all(len(set(word)) >= 6 and "Z" not in word for word in words)
+        with pytest.raises(ValueError):
+            bank.select_words(5, min_length=100)
+
+    def test_reads_only_the_selected_words(self):
+        bank = WordBank()
+        words = CountingWords(list(bank._words))
+        bank._index = WordIndex(bank._words)
+        bank._words = words
+
+        selected = bank.select_words(3, min_distinct=5)
+
+        assert len(set(selected)) == 3
+        assert words.reads == 3
@@ -0,0 +1,108 @@
+"""Tests for compiled, memory-mapped word packs."""
+
+import pytest
+
+from services.word_bank import WordBank
+from services.word_pack import (
+    PackedWords,
+    WordPackError,
+    compile_file,
+    compile_words,
+    is_word_pack,
+    main,
+)
+
+WORDS = ["CASA", "PERRO", "ÁRBOL", "LUZ", "MURCIÉLAGO", "SOL"]
+
+
+@pytest.fixture
+def pack(tmp_path):
+    path = tmp_path / "words.qwb"
+    compile_words(WORDS, path)
+    words = PackedWords(path)
+    yield words
+    words.close()
+
+
+class TestPackedWords:
+    """Tests for reading word packs."""
+
+    def test_read_like_a_list(self, pack):
+        assert len(pack) == len(WORDS)
+        assert list(pack) == WORDS
+        assert pack[-1] == "SOL"
+        assert pack[1:3] == ["PERRO", "ÁRBOL"]
+        assert "LUZ" in pack
+        with pytest.raises(IndexError):
+            pack[len(WORDS)]
+
+    def test_empty(self, tmp_path):
+        path = tmp_path / "empty.qwb"
+        assert compile_words([], path) == 0
+
+        words = PackedWords(path)
+
+        assert len(words) == 0
+        words.close()
+
+    def test_rejects_files_that_are_not_packs(self, tmp_path):
+        text = tmp_path / "words.txt"
+        text.write_text("CASA\nPERRO\n", encoding="utf-8")
+        empty = tmp_path / "empty.qwb"
+        empty.write_bytes(b"")
+        truncated = tmp_path / "truncated.qwb"
+        compile_words(WORDS, truncated)
+        truncated.write_bytes(truncated.read_bytes()[:20])
+
+        assert not is_word_pack(text)
+        for path in (text, empty, truncated):
+            with pytest.raises(WordPackError):
+                PackedWords(path)
+
+
+class TestCompile:
+    """Tests for compiling word lists into packs."""
+
+    def test_compile_file_normalizes_words(self, tmp_path):
+        source = tmp_path / "words.txt"
+        source.write_text("casa\n  perro \n\nno-valida\nluz\n", encoding="utf-8")
+        target = tmp_path / "words.qwb"
+
+        assert compile_file(source, target) == 3
+        assert list(PackedWords(target)) == ["CASA", "PERRO", "LUZ"]
+
+    def test_cli_compiles_a_word_list(self, tmp_path, capsys):
+        source = tmp_path / "words.txt"
+        source.write_text("\n".join(WORDS), encoding="utf-8")
+        target = tmp_path / "words.qwb"
+
+        main([str(source), str(target)])
+
+        assert is_word_pack(target)
+        assert "Wrote 6 words" in capsys.readouterr().out
+
+
+class TestWordBankPack:
+    """Tests for word banks backed by a pack."""
+
+    def test_loads_like_the_text_list(self, tmp_path):
+        text_bank = WordBank()
+        target = tmp_path / "words.qwb"
+        compile_words(text_bank._words, target)
+
+        bank = WordBank(target)
+
+        assert isinstance(bank._words, PackedWords)
+        assert bank.total_words == text_bank.total_words
+        assert bank._index is None
+        selected = bank.select_words(5)
+        assert len(set(selected)) == 5
+        assert set(selected) <= set(text_bank._words)
+        assert bank.index.query(min_distinct=7) == text_bank.index.query(min_distinct=7)
+
+    def test_rejects_a_small_pack(self, tmp_path):
+        target = tmp_path / "words.qwb"
+        compile_words(WORDS, target)
+
+        with pytest.raises(ValueError):
+            WordBank(target)